@@ -25,7 +25,7 @@ app = typer.Typer(
 )
 console = Console()
 
-# Create app context
+# Create app context; data directories are created when a command runs
 ctx = AppContext()
 
 # Define global options
@@ -41,6 +41,8 @@ def callback(
     if config:
         ctx.config_path = config
     ctx.config = load_config(ctx.config_path)
+    # Create the configured data directories now that the config path is final
+    ctx.ensure_data_dirs()
 
 
 @app.command("system-check")
@@ -169,6 +171,9 @@ def ingest(
     preview: bool = typer.Option(
         False, "--preview", help="Preview files to be processed without actually processing them"
     ),
+    parallel_batch_size: Optional[int] = typer.Option(
+        None, "--parallel-batch-size", help="Files processed concurrently per batch (directories only)"
+    ),
 ):
     """
     Parse documents (PDF, HTML, YouTube, DOCX, PPT, TXT) into clean text.
@@ -231,7 +236,8 @@ def ingest(
                 directory=input,
                 output_dir=output_dir,
                 config=ctx.config,
-                verbose=verbose
+                verbose=verbose,
+                parallel_batch_size=parallel_batch_size
             )
             
             # Return appropriate exit code
@@ -286,6 +292,9 @@ def create(
     preview: bool = typer.Option(
         False, "--preview", help="Preview files to be processed without actually processing them"
     ),
+    parallel_batch_size: Optional[int] = typer.Option(
+        None, "--parallel-batch-size", help="Files processed concurrently per batch (directories only)"
+    ),
 ):
     """
     Generate content from text using local LLM inference.
@@ -395,7 +404,8 @@ def create(
                 verbose=verbose,
                 provider=provider,
                 chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap
+                chunk_overlap=chunk_overlap,
+                parallel_batch_size=parallel_batch_size
             )
             
             # Return appropriate exit code
@@ -454,6 +464,9 @@ def curate(
     preview: bool = typer.Option(
         False, "--preview", help="Preview files to be processed without actually processing them"
     ),
+    parallel_batch_size: Optional[int] = typer.Option(
+        None, "--parallel-batch-size", help="Files processed concurrently per batch (directories only)"
+    ),
 ):
     """
     Clean and filter content based on quality.
@@ -547,7 +560,8 @@ def curate(
                 model=model,
                 config_path=ctx.config_path,
                 verbose=verbose,
-                provider=provider
+                provider=provider,
+                parallel_batch_size=parallel_batch_size
             )
             
             # Return appropriate exit code
@@ -607,6 +621,9 @@ def save_as(
     preview: bool = typer.Option(
         False, "--preview", help="Preview files to be processed without actually processing them"
     ),
+    parallel_batch_size: Optional[int] = typer.Option(
+        None, "--parallel-batch-size", help="Files processed concurrently per batch (directories only)"
+    ),
 ):
     """
     Convert to different formats for fine-tuning.
@@ -678,7 +695,8 @@ def save_as(
                 format=format,
                 storage_format=storage,
                 config=ctx.config,
-                verbose=verbose
+                verbose=verbose,
+                parallel_batch_size=parallel_batch_size
             )
             
             # Return appropriate exit code
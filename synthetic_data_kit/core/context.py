@@ -4,11 +4,13 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # Context Manager
+from functools import cached_property
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Optional, Dict, Any
-import os
 
 from synthetic_data_kit.utils.config import DEFAULT_CONFIG_PATH, load_config, get_path_config
+from synthetic_data_kit.utils.fs import ensure_dirs
 
 class AppContext:
     """Context manager for global app state"""
@@ -17,31 +19,43 @@ class AppContext:
         """Initialize app context"""
         self.config_path = config_path or DEFAULT_CONFIG_PATH
         self.config: Dict[str, Any] = {}
+    
+    @cached_property
+    def data_dirs(self) -> SimpleNamespace:
+        """Data directory paths (input, parsed, generated, curated, final)
+        
+        The directories are created on first access rather than at construction,
+        so a context that never touches disk costs no filesystem calls.
+        """
+        return self._create_data_dirs()
+    
+    def ensure_data_dirs(self) -> SimpleNamespace:
+        """Create the configured data directories now and return their paths
         
-        # Ensure data directories exist
-        self._ensure_data_dirs()
+        Call this once the config path is final; later reads of data_dirs reuse
+        the same namespace without touching the filesystem.
+        """
+        return self.data_dirs
         
     # Why have separeate folders? Yes ideally you should just be able to ingest an input folder and have everything being ingested and converted BUT
     # Managing context window is hard and there are more edge cases which needs to be handled carefully
     # it's also easier to debug in alpha if we have multiple files. 
-    def _ensure_data_dirs(self):
-        """Ensure data directories exist based on configuration"""
+    def _create_data_dirs(self) -> SimpleNamespace:
+        """Create data directories based on configuration and return their paths"""
         # Load config to get proper paths
         config = load_config(self.config_path)
         paths_config = config.get('paths', {})
         
-        # Create input directory - handle new config format where input is a string
-        input_dir = paths_config.get('input', 'data/input')
-        os.makedirs(input_dir, exist_ok=True)
-        
-        # Create output directories based on config
+        # Input is a plain string in the new config format; outputs are keyed by stage
         output_config = paths_config.get('output', {})
-        output_dirs = [
-            output_config.get('parsed', 'data/parsed'),
-            output_config.get('generated', 'data/generated'), 
-            output_config.get('curated', 'data/curated'),
-            output_config.get('final', 'data/final'),
-        ]
+        dirs = SimpleNamespace(
+            input=paths_config.get('input', 'data/input'),
+            parsed=output_config.get('parsed', 'data/parsed'),
+            generated=output_config.get('generated', 'data/generated'),
+            curated=output_config.get('curated', 'data/curated'),
+            final=output_config.get('final', 'data/final'),
+        )
         
-        for dir_path in output_dirs:
-            os.makedirs(dir_path, exist_ok=True)
\ No newline at end of file
+        # Directories created by an earlier context in this process are skipped
+        ensure_dirs(vars(dirs).values())
+        return dirs
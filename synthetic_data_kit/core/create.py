@@ -173,7 +173,6 @@ def process_file(
         
     elif content_type == "cot-enhance":
         from synthetic_data_kit.generators.cot_generator import COTGenerator
-        from tqdm import tqdm
         
         # Initialize the CoT generator
         generator = COTGenerator(client, config_path)
@@ -236,10 +235,11 @@ def process_file(
             if verbose:
                 print(f"Found {len(conversations)} conversation(s) to enhance")
             
-            # Process each conversation
-            enhanced_conversations = []
+            # Collect the messages of every valid conversation
+            enhanced_conversations = list(conversations)
+            to_enhance = []
             
-            for i, conversation in enumerate(tqdm(conversations, desc="Enhancing conversations")):
+            for i, conversation in enumerate(conversations):
                 # Check if this item has a conversations field
                 if isinstance(conversation, dict) and "conversations" in conversation:
                     conv_messages = conversation["conversations"]
@@ -247,32 +247,28 @@ def process_file(
                     # Validate messages format
                     if not isinstance(conv_messages, list):
                         print(f"Warning: conversations field is not a list in item {i}, skipping")
-                        enhanced_conversations.append(conversation)  # Keep original
                         continue
                     
-                    # Enhance this conversation's messages
                     if verbose:
                         print(f"Debug - Conv_messages type: {type(conv_messages)}")
-                        print(f"Debug - Conv_messages structure: {conv_messages[:1] if isinstance(conv_messages, list) else 'Not a list'}")
+                        print(f"Debug - Conv_messages structure: {conv_messages[:1]}")
                     
-                    # Always include simple steps when enhancing QA pairs
-                    enhanced_messages = generator.enhance_with_cot(conv_messages, include_simple_steps=True)
-                    
-                    # Handle nested bug
-                    if enhanced_messages and isinstance(enhanced_messages, list):
-                        # Nested bug
-                        if enhanced_messages and isinstance(enhanced_messages[0], list):
-                            if verbose:
-                                print(f"Debug - Flattening nested array response")
-                            enhanced_messages = enhanced_messages[0]
-                    
-                    # Create enhanced conversation with same structure
-                    enhanced_conv = conversation.copy()
-                    enhanced_conv["conversations"] = enhanced_messages
-                    enhanced_conversations.append(enhanced_conv)
-                else:
-                    # Not the expected format, just keep original
-                    enhanced_conversations.append(conversation)
+                    to_enhance.append(i)
+                # Anything else is not the expected format, just keep original
+            
+            # Enhance all conversations together, batch_size per request
+            # Always include simple steps when enhancing QA pairs
+            if to_enhance:
+                enhanced_messages = generator.enhance_with_cot(
+                    [conversations[i]["conversations"] for i in to_enhance],
+                    include_simple_steps=True
+                )
+                
+                # Create enhanced conversations with same structure
+                for i, messages in zip(to_enhance, enhanced_messages):
+                    enhanced_conv = conversations[i].copy()
+                    enhanced_conv["conversations"] = messages
+                    enhanced_conversations[i] = enhanced_conv
             
             # Save enhanced conversations
             output_path = os.path.join(output_dir, f"{base_name}_enhanced.json")
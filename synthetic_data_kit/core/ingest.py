@@ -99,8 +99,9 @@ def process_file(
     # Determine parser based on file type
     parser = determine_parser(file_path, config)
 
-    # Parse the file
-    content = parser.parse(file_path)
+    # Parse the file; parsers with parse_iter stream their text straight to disk
+    parse_iter = getattr(parser, "parse_iter", None)
+    content = parse_iter(file_path) if parse_iter else parser.parse(file_path)
 
     # Generate output filename if not provided
     if not output_name:
@@ -108,9 +109,13 @@ def process_file(
             # Extract filename from URL
             if "youtube.com" in file_path or "youtu.be" in file_path:
                 # Use video ID for YouTube URLs
-                import re
+                from synthetic_data_kit.parsers.youtube_parser import extract_video_id
 
-                video_id = re.search(r"(?:v=|\.be/)([^&]+)", file_path).group(1)
+                video_id = extract_video_id(file_path)
+                if video_id is None:
+                    import re
+
+                    video_id = re.search(r"(?:v=|\.be/)([^&]+)", file_path).group(1)
                 output_name = f"youtube_{video_id}.txt"
             else:
                 # Use domain for other URLs
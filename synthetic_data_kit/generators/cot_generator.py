@@ -6,13 +6,89 @@
 # Logic for generating CoT from scratch and also enhancing CoT (take existing format and add CoT)
 import os
 import json
-import re
-from typing import Dict, List, Any, Optional
+import string
+from functools import lru_cache
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
 
 from synthetic_data_kit.models.llm_client import LLMClient
 from synthetic_data_kit.utils.config import get_prompt, get_generation_config
 
+# Used when a config predates the cot_generation_continuation prompt
+DEFAULT_COT_CONTINUATION_PROMPT = (
+    "These are examples {first}-{last} of {total}. "
+    "Ask questions different from these earlier ones:\n{previous_questions}"
+)
+
+def _balanced_end(text: str, start: int) -> int:
+    """Return the index closing the bracket opened at start, or -1
+    
+    Tracks bracket depth and skips over string literals so brackets inside
+    strings are ignored.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '[{':
+            depth += 1
+        elif char in ']}':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+def _find_json_array(text: str) -> Optional[List]:
+    """Return the first JSON array of objects or arrays in text, or None
+    
+    Bracketed prose before the payload (e.g. "see note [1]") is skipped:
+    a balanced candidate that doesn't decode to a list of dicts or lists
+    moves the scan on to the next '[' after it. Arrays nested inside a
+    rejected candidate are never returned on their own.
+    """
+    start = text.find('[')
+    while start != -1:
+        end = _balanced_end(text, start)
+        if end == -1:
+            return None
+        try:
+            candidate = json.loads(text[start:end + 1])
+        except json.JSONDecodeError:
+            candidate = None
+        if isinstance(candidate, list) and all(isinstance(item, (dict, list)) for item in candidate):
+            return candidate
+        start = text.find('[', end + 1)
+    return None
+
+@lru_cache(maxsize=None)
+def _compile_prompt(template: str) -> Callable[..., str]:
+    """Parse a prompt template once and return a function that fills it
+    
+    Templates with only plain named fields are rendered by joining the
+    pre-parsed pieces; anything else falls back to template.format.
+    """
+    parts = list(string.Formatter().parse(template))
+    if any(spec or conversion or (field is not None and not field.isidentifier())
+           for _, field, spec, conversion in parts):
+        return template.format
+    
+    def render(**kwargs) -> str:
+        return "".join(
+            literal if field is None else literal + format(kwargs[field])
+            for literal, field, _, _ in parts
+        )
+    return render
+
 class COTGenerator:
     """Generates chain-of-thought reasoning examples"""
     
@@ -28,9 +104,9 @@ class COTGenerator:
         output_text = output_text.strip()
         
         # Try to extract JSON array
-        json_match = re.search(r"\[.*\]", output_text, re.DOTALL)
-        if json_match:
-            output_text = json_match.group(0)
+        json_array = _find_json_array(output_text)
+        if json_array is not None:
+            return json_array
         
         try:
             # Handle quoted JSON
@@ -69,39 +145,67 @@ class COTGenerator:
         return self._generate_with_chunking(document_text, num_examples)
     
     def _generate_single_call(self, document_text: str, num_examples: int) -> List[Dict[str, Any]]:
-        """Generate CoT examples in a single API call"""
-        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+        """Generate CoT examples with one prompt per batch_size examples
         
-        # Get the prompt template
-        prompt_template = get_prompt(self.config, "cot_generation")
+        Each prompt asks for its whole batch as one JSON array. Later batches
+        are told which examples of the total they cover and which questions
+        were already generated, so they don't repeat earlier batches.
+        """
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
         
-        # Format the prompt
-        prompt = prompt_template.format(
-            num_examples=num_examples,
-            text=document_text
-        )
+        # Get the prompt templates
+        render_prompt = _compile_prompt(get_prompt(self.config, "cot_generation"))
+        render_continuation = _compile_prompt(get_prompt(
+            self.config, "cot_generation_continuation", DEFAULT_COT_CONTINUATION_PROMPT
+        ))
         
         # Generate examples
         temperature = self.generation_config.get("temperature", 0.7)
         max_tokens = self.generation_config.get("max_tokens", 4096)
+        batch_size = max(1, self.generation_config.get("batch_size", 32))
+        total_batches = (num_examples + batch_size - 1) // batch_size
         
         if verbose:
-            print(f"Generating {num_examples} CoT examples (single call)...")
+            print(f"Generating {num_examples} CoT examples in {total_batches} batch(es)...")
         
-        messages = [{"role": "system", "content": prompt}]
-        response = self.client.chat_completion(
-            messages, 
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-        
-        # Parse response
-        examples = self.parse_json_output(response)
-        
-        if examples is None:
-            if verbose:
-                print("Failed to parse CoT examples, returning empty list")
-            return []
+        examples = []
+        for batch_start in range(0, num_examples, batch_size):
+            batch_count = min(batch_size, num_examples - batch_start)
+            
+            # Format the prompt with this batch's share of the examples
+            prompt = render_prompt(
+                num_examples=batch_count,
+                text=document_text
+            )
+            if batch_start:
+                previous = "\n".join(
+                    f"- {example['question']}"
+                    for example in examples
+                    if isinstance(example, dict) and "question" in example
+                )
+                prompt += "\n\n" + render_continuation(
+                    first=batch_start + 1,
+                    last=batch_start + batch_count,
+                    total=num_examples,
+                    previous_questions=previous or "- (none)"
+                )
+            
+            messages = [{"role": "system", "content": prompt}]
+            response = self.client.chat_completion(
+                messages, 
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+            
+            # Parse response
+            batch_examples = self.parse_json_output(response)
+            
+            if batch_examples is None:
+                if verbose:
+                    print(f"Failed to parse CoT examples {batch_start + 1}-{batch_start + batch_count}")
+                continue
+            
+            examples.extend(batch_examples[:batch_count])
         
         if verbose:
             print(f"Successfully generated {len(examples)} CoT examples")
@@ -136,13 +240,13 @@ class COTGenerator:
         examples_per_chunk = max(1, round(num_examples / len(chunks)))
         
         # Get CoT generation prompt template
-        cot_prompt_template = get_prompt(self.config, "cot_generation")
+        render_cot_prompt = _compile_prompt(get_prompt(self.config, "cot_generation"))
         
         # Prepare all message batches
         all_messages = []
         for i, chunk in enumerate(chunks):
             # Format the prompt with text
-            cot_prompt = cot_prompt_template.format(
+            cot_prompt = render_cot_prompt(
                 num_examples=examples_per_chunk,
                 text=chunk
             )
@@ -226,19 +330,60 @@ class COTGenerator:
         return all_examples
     
     def enhance_with_cot(self, conversations: List[Dict], include_simple_steps: bool = False) -> List[Dict]:
-        """Enhance existing conversations with CoT reasoning"""
-        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
+        """Enhance existing conversations with CoT reasoning
         
-        # Get the prompt template
-        prompt_template = get_prompt(self.config, "cot_enhancement")
+        A list of conversations is sent batch_size conversations per request;
+        a single conversation (a flat list of messages) is sent as one request.
+        """
+        verbose = os.environ.get('SDK_VERBOSE', 'false').lower() == 'true'
         
         if verbose:
             print(f"Debug - Conversations to enhance structure: {type(conversations)}")
             print(f"Debug - First conversation: {json.dumps(conversations[0] if conversations else {}, indent=2)[:100]}...")
         
+        # A single conversation is a flat list of messages
+        if not conversations or not all(isinstance(conv, list) for conv in conversations):
+            enhanced_conversations = self._enhance_batch(conversations, include_simple_steps)
+            if enhanced_conversations is None:
+                if verbose:
+                    print("Failed to parse enhanced conversations, returning original")
+                return conversations
+            return enhanced_conversations
+        
+        batch_size = max(1, self.generation_config.get("batch_size", 32))
+        
+        if verbose:
+            print(f"Enhancing {len(conversations)} conversations with CoT in batches of {batch_size}...")
+        
+        enhanced_conversations = []
+        for batch_start in range(0, len(conversations), batch_size):
+            batch = conversations[batch_start:batch_start + batch_size]
+            enhanced_batch = self._enhance_batch(batch, include_simple_steps)
+            
+            # Keep the originals if the reply can't be matched back to the batch
+            # or isn't one list of messages per conversation
+            if (enhanced_batch is None or len(enhanced_batch) != len(batch)
+                    or not all(isinstance(conv, list) and all(isinstance(msg, dict) for msg in conv)
+                               for conv in enhanced_batch)):
+                if verbose:
+                    print(f"Failed to parse enhanced conversations {batch_start + 1}-{batch_start + len(batch)}, keeping original")
+                enhanced_conversations.extend(batch)
+            else:
+                enhanced_conversations.extend(enhanced_batch)
+        
+        if verbose:
+            print(f"Successfully enhanced conversations with CoT")
+        
+        return enhanced_conversations
+    
+    def _enhance_batch(self, conversations: List, include_simple_steps: bool) -> Optional[List]:
+        """Enhance a batch of conversations with a single API call"""
+        # Get the prompt template
+        render_prompt = _compile_prompt(get_prompt(self.config, "cot_enhancement"))
+        
         # Format the prompt
         conversation_str = json.dumps(conversations, ensure_ascii=False, indent=2)
-        prompt = prompt_template.format(
+        prompt = render_prompt(
             conversations=conversation_str,
             include_simple_steps=str(include_simple_steps).lower()
         )
@@ -247,9 +392,6 @@ class COTGenerator:
         temperature = self.generation_config.get("temperature", 0.2)
         max_tokens = self.generation_config.get("max_tokens", 4096)
         
-        if verbose:
-            print(f"Enhancing {len(conversations)} conversations with CoT...")
-        
         messages = [{"role": "system", "content": prompt}]
         response = self.client.chat_completion(
             messages, 
@@ -258,17 +400,7 @@ class COTGenerator:
         )
         
         # Parse response
-        enhanced_conversations = self.parse_json_output(response)
-        
-        if enhanced_conversations is None:
-            if verbose:
-                print("Failed to parse enhanced conversations, returning original")
-            return conversations
-        
-        if verbose:
-            print(f"Successfully enhanced conversations with CoT")
-        
-        return enhanced_conversations
+        return self.parse_json_output(response)
     
     def process_document(self, document_text: str, num_examples: int = None, include_simple_steps: bool = False) -> Dict[str, Any]:
         """Process a document to generate CoT examples"""
@@ -0,0 +1,44 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# Async entry points for file parsers
+import asyncio
+from typing import List
+
+class AsyncParseMixin:
+    """Adds parse_async/parse_many to a parser with a blocking parse(path) method"""
+    
+    async def parse_async(self, file_path: str) -> str:
+        """Parse a file on the default thread pool without blocking the event loop
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Extracted text
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.parse, file_path)
+    
+    async def parse_many(self, file_paths: List[str], concurrency: int = 16) -> List[str]:
+        """Parse several files concurrently
+        
+        Opening and reading each file is I/O-bound, so up to `concurrency`
+        files are parsed at once.
+        
+        Args:
+            file_paths: Paths to the files
+            concurrency: Maximum number of files parsed at the same time
+            
+        Returns:
+            Extracted texts, in the same order as file_paths
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def parse_one(file_path: str) -> str:
+            async with semaphore:
+                return await self.parse_async(file_path)
+        
+        return await asyncio.gather(*(parse_one(file_path) for file_path in file_paths))
@@ -4,10 +4,14 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # DOCX parasers
-import os
-from typing import Dict, Any
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, Union
 
-class DOCXParser:
+from synthetic_data_kit.parsers.async_parse import AsyncParseMixin
+from synthetic_data_kit.utils.lazy_import import lazy_import
+from synthetic_data_kit.utils.text import iter_joined, write_text
+
+class DOCXParser(AsyncParseMixin):
     """Parser for Microsoft Word documents"""
     
     def parse(self, file_path: str) -> str:
@@ -19,31 +23,53 @@ class DOCXParser:
         Returns:
             Extracted text from the document
         """
+        return "".join(self.parse_iter(file_path))
+    
+    def parse_iter(self, file_path: str) -> Iterator[str]:
+        """Parse a DOCX file into text chunks that concatenate to parse()'s result
+        
+        Args:
+            file_path: Path to the DOCX file
+            
+        Returns:
+            Iterator over the extracted text chunks
+        """
         try:
-            import docx
+            docx = lazy_import("docx")
         except ImportError:
             raise ImportError("python-docx is required for DOCX parsing. Install it with: pip install python-docx")
         
         doc = docx.Document(file_path)
         
-        # Extract text from paragraphs
-        paragraphs = [p.text for p in doc.paragraphs]
+        if hasattr(type(doc), 'iter_inner_content'):
+            # python-docx >= 1.0: walk the body once, keeping tables in reading order
+            Table = lazy_import("docx.table").Table
+            texts = self._iter_block_text(doc.iter_inner_content(), Table)
+        else:
+            # Older python-docx: paragraph text followed by table cell text
+            paragraphs = (p.text for p in doc.paragraphs)
+            cells = (cell.text for table in doc.tables for row in table.rows for cell in row.cells)
+            texts = chain(paragraphs, cells)
         
-        # Extract text from tables
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    paragraphs.append(cell.text)
-        
-        return "\n\n".join(p for p in paragraphs if p)
+        # Skip empty paragraphs and cells
+        return iter_joined(filter(None, texts), "\n\n")
+    
+    @staticmethod
+    def _iter_block_text(blocks: Iterable[Any], table_type: type) -> Iterator[str]:
+        """Yield paragraph text, or each cell's text for tables, in document order"""
+        for block in blocks:
+            if isinstance(block, table_type):
+                for row in block.rows:
+                    for cell in row.cells:
+                        yield cell.text
+            else:
+                yield block.text
     
-    def save(self, content: str, output_path: str) -> None:
+    def save(self, content: Union[str, bytes, Iterable[str]], output_path: str) -> None:
         """Save the extracted text to a file
         
         Args:
-            content: Extracted text content
+            content: Extracted text content, its UTF-8 bytes, or text chunks from parse_iter
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
\ No newline at end of file
+        write_text(content, output_path)
\ No newline at end of file
@@ -5,10 +5,13 @@
 # the root directory of this source tree.
 # PPTX parser logic
 
-import os
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, Union
 
-class PPTParser:
+from synthetic_data_kit.parsers.async_parse import AsyncParseMixin
+from synthetic_data_kit.utils.lazy_import import lazy_import
+from synthetic_data_kit.utils.text import iter_joined, write_text
+
+class PPTParser(AsyncParseMixin):
     """Parser for PowerPoint presentations"""
     
     def parse(self, file_path: str) -> str:
@@ -20,17 +23,29 @@ class PPTParser:
         Returns:
             Extracted text from the presentation
         """
+        return "".join(self.parse_iter(file_path))
+    
+    def parse_iter(self, file_path: str) -> Iterator[str]:
+        """Parse a PPTX file into text chunks that concatenate to parse()'s result
+        
+        Args:
+            file_path: Path to the PPTX file
+            
+        Returns:
+            Iterator over the extracted text, one chunk per slide plus separators
+        """
         try:
-            from pptx import Presentation
+            Presentation = lazy_import("pptx").Presentation
         except ImportError:
             raise ImportError("python-pptx is required for PPTX parsing. Install it with: pip install python-pptx")
         
         prs = Presentation(file_path)
-        
-        # Extract text from slides
-        all_text = []
-        
-        for i, slide in enumerate(prs.slides):
+        return iter_joined(self._iter_slide_text(prs.slides), "\n\n")
+    
+    @staticmethod
+    def _iter_slide_text(slides: Iterable[Any]) -> Iterator[str]:
+        """Yield the text of each slide"""
+        for i, slide in enumerate(slides):
             slide_text = []
             slide_text.append(f"--- Slide {i+1} ---")
             
@@ -43,17 +58,13 @@ class PPTParser:
                 if hasattr(shape, "text") and shape.text:
                     slide_text.append(shape.text)
             
-            all_text.append("\n".join(slide_text))
-        
-        return "\n\n".join(all_text)
+            yield "\n".join(slide_text)
     
-    def save(self, content: str, output_path: str) -> None:
+    def save(self, content: Union[str, bytes, Iterable[str]], output_path: str) -> None:
         """Save the extracted text to a file
         
         Args:
-            content: Extracted text content
+            content: Extracted text content, its UTF-8 bytes, or text chunks from parse_iter
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
\ No newline at end of file
+        write_text(content, output_path)
\ No newline at end of file
@@ -5,8 +5,148 @@
 # the root directory of this source tree.
 # Download and save the transcript
 
+import json
 import os
-from typing import Dict, Any
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from synthetic_data_kit.utils.lazy_import import lazy_import
+from synthetic_data_kit.utils.text import iter_joined, write_text
+
+# 11-character video ID from watch, youtu.be, embed and shorts URLs
+_VIDEO_ID_RE = re.compile(
+    r'(?:[?&]v=|youtu\.be/|/embed/|/shorts/|/live/)([0-9A-Za-z_-]{11})(?![0-9A-Za-z_-])'
+)
+
+# youtube-transcript-api errors raised when YouTube throttles the client
+_THROTTLE_ERRORS = {'TooManyRequests', 'RequestBlocked', 'IpBlocked'}
+
+
+class _RateLimiter:
+    """Token bucket allowing at most `calls` requests per `period` seconds"""
+    
+    def __init__(self, calls: int, period: float):
+        self.capacity = calls
+        self.rate = calls / period
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by all parser instances and batch worker threads
+_transcript_rate_limiter = _RateLimiter(calls=10, period=1.0)
+
+# Keep-alive HTTP session shared by all transcript fetches, created on first use
+_HTTP_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared pooled HTTP session, so each video reuses open connections"""
+    global _HTTP_SESSION
+    with _SESSION_LOCK:
+        if _HTTP_SESSION is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+            _HTTP_SESSION = session
+        return _HTTP_SESSION
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a transcript fetch failure is transient"""
+    return isinstance(error, requests.RequestException) or type(error).__name__ in _THROTTLE_ERRORS
+
+
+def _fetch_transcript_with_retry(api: Any, video_id: str, max_attempts: int = 5,
+                                 initial_delay: float = 1.0, max_delay: float = 30.0) -> List[Dict[str, Any]]:
+    """Fetch a transcript, retrying transient failures with jittered exponential backoff
+    
+    Args:
+        api: The YouTubeTranscriptApi class (pre- or post-1.0 interface)
+        video_id: YouTube video ID
+        max_attempts: Total number of attempts before giving up
+        initial_delay: Delay before the first retry, in seconds
+        max_delay: Upper bound on any single delay, in seconds
+        
+    Returns:
+        Transcript segments
+    """
+    if hasattr(api, 'fetch'):
+        # youtube-transcript-api >= 1.0 takes its HTTP client at construction
+        client = api(http_client=_get_session())
+        
+        def fetch():
+            return client.fetch(video_id).to_raw_data()
+    else:
+        def fetch():
+            return api.get_transcript(video_id)
+    
+    for attempt in range(max_attempts):
+        _transcript_rate_limiter.acquire()
+        try:
+            return fetch()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not _is_retryable(e):
+                raise
+            delay = min(max_delay, initial_delay * 2 ** attempt)
+            time.sleep(delay + random.uniform(0, delay))
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Return the video ID in a YouTube URL, or None if it has no recognizable ID"""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _cache_dir() -> str:
+    """Directory holding cached transcripts; SDK_CACHE_DIR overrides the default"""
+    base = os.environ.get('SDK_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'synthetic-data-kit'
+    )
+    return os.path.join(base, 'youtube')
+
+
+def _load_cache(video_id: str) -> Optional[Dict[str, Any]]:
+    """Return the cached payload for video_id, or None on a miss"""
+    try:
+        with open(os.path.join(_cache_dir(), f"{video_id}.json"), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(video_id: str, payload: Dict[str, Any]) -> None:
+    """Persist the payload for video_id; failures only cost a refetch later"""
+    cache_dir = _cache_dir()
+    data = json.dumps(payload)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(os.path.join(cache_dir, f"{video_id}.json"), 'w', encoding='utf-8') as f:
+            f.write(data)
+    except OSError:
+        pass
+
 
 class YouTubeParser:
     """Parser for YouTube transcripts"""
@@ -20,45 +160,84 @@ class YouTubeParser:
         Returns:
             Transcript text
         """
+        # The segments are already a list, so one C-level join beats
+        # concatenating parse_iter's interleaved separators
+        metadata, segments = self._load_transcript(url)
+        return metadata + "\n".join(segments)
+    
+    def parse_iter(self, url: str) -> Iterator[str]:
+        """Parse a YouTube video transcript into chunks that concatenate to parse()'s result
+        
+        Args:
+            url: YouTube video URL
+            
+        Returns:
+            Iterator over the metadata header and transcript lines
+        """
+        metadata, segments = self._load_transcript(url)
+        return chain((metadata,), iter_joined(segments, "\n"))
+    
+    def _load_transcript(self, url: str) -> Tuple[str, List[str]]:
+        """Fetch (or read from cache) a video's metadata header and transcript segments"""
         try:
-            from pytubefix import YouTube
-            from youtube_transcript_api import YouTubeTranscriptApi
+            YouTube = lazy_import("pytubefix").YouTube
+            YouTubeTranscriptApi = lazy_import("youtube_transcript_api").YouTubeTranscriptApi
         except ImportError:
             raise ImportError(
                 "pytube and youtube-transcript-api are required for YouTube parsing. "
                 "Install them with: pip install pytube youtube-transcript-api"
             )
         
-        # Extract video ID from URL
-        yt = YouTube(url)
-        video_id = yt.video_id
+        # Use the cached transcript and metadata when this video was fetched before;
+        # a recognizable URL needs no pytubefix round trip to find its video ID
+        video_id = extract_video_id(url)
+        payload = _load_cache(video_id) if video_id else None
+        if payload is None:
+            yt = YouTube(url)
+            video_id = yt.video_id
+            transcript = _fetch_transcript_with_retry(YouTubeTranscriptApi, video_id)
+            payload = {
+                'title': yt.title,
+                'author': yt.author,
+                'length': yt.length,
+                'segments': [segment['text'] for segment in transcript],
+            }
+            _save_cache(video_id, payload)
         
-        # Get transcript
-        transcript = YouTubeTranscriptApi.get_transcript(video_id)
-        
-        # Combine transcript segments
-        combined_text = []
-        for segment in transcript:
-            combined_text.append(segment['text'])
-        
-        # Add video metadata
+        # Video metadata header
         metadata = (
-            f"Title: {yt.title}\n"
-            f"Author: {yt.author}\n"
-            f"Length: {yt.length} seconds\n"
+            f"Title: {payload['title']}\n"
+            f"Author: {payload['author']}\n"
+            f"Length: {payload['length']} seconds\n"
             f"URL: {url}\n\n"
             f"Transcript:\n"
         )
         
-        return metadata + "\n".join(combined_text)
+        return metadata, payload['segments']
+    
+    def parse_batch(self, urls: List[str], max_workers: int = 8) -> List[str]:
+        """Parse several YouTube video transcripts concurrently
+        
+        Transcript and metadata fetches are network-bound, so each URL is
+        parsed in its own worker thread.
+        
+        Args:
+            urls: YouTube video URLs
+            max_workers: Maximum number of concurrent fetches
+            
+        Returns:
+            Transcript texts, in the same order as urls
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(self.parse, urls))
     
-    def save(self, content: str, output_path: str) -> None:
+    def save(self, content: Union[str, bytes, Iterable[str]], output_path: str) -> None:
         """Save the transcript to a file
         
         Args:
-            content: Transcript content
+            content: Transcript content, its UTF-8 bytes, or text chunks from parse_iter
             output_path: Path to save the text
         """
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
\ No newline at end of file
+        write_text(content, output_path)
\ No newline at end of file
@@ -4,6 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # Config Utilities
+import copy
 import yaml
 import os
 from pathlib import Path
@@ -23,6 +24,10 @@ PACKAGE_CONFIG_PATH = os.path.abspath(
 # Use internal package path as default
 DEFAULT_CONFIG_PATH = PACKAGE_CONFIG_PATH
 
+# Parsed configs keyed by absolute path -> (mtime_ns, size, config); an edit to
+# the file changes its mtime or size and forces a re-parse
+_CONFIG_CACHE: Dict[str, Any] = {}
+
 def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     """Load YAML configuration file"""
     if config_path is None:
@@ -35,12 +40,23 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
             # If none exists, use the default (which will likely fail, but with a clear error)
             config_path = DEFAULT_CONFIG_PATH
     
-    if not os.path.exists(config_path):
+    try:
+        config_stat = os.stat(config_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found at {config_path}")
     
     print(f"Loading config from: {config_path}")
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    cache_key = os.path.abspath(config_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[:2] == (config_stat.st_mtime_ns, config_stat.st_size):
+        config = cached[2]
+    else:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        _CONFIG_CACHE[cache_key] = (config_stat.st_mtime_ns, config_stat.st_size, config)
+    
+    # Callers may modify their config, so never hand out the cached object
+    config = copy.deepcopy(config)
     
     # Debug: Print LLM provider if it exists
     if 'llm' in config and 'provider' in config['llm']:
@@ -134,10 +150,20 @@ def get_format_config(config: Dict[str, Any]) -> Dict[str, Any]:
         'pretty_json': True
     })
 
-def get_prompt(config: Dict[str, Any], prompt_name: str) -> str:
-    """Get prompt by name"""
+def get_batch_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Get directory batch processing configuration"""
+    return config.get('batch', {
+        'parallel_batch_size': 100,
+        'max_workers': None,
+        'ingest_processes': False
+    })
+
+def get_prompt(config: Dict[str, Any], prompt_name: str, default: Optional[str] = None) -> str:
+    """Get prompt by name, falling back to default for prompts older configs lack"""
     prompts = config.get('prompts', {})
     if prompt_name not in prompts:
+        if default is not None:
+            return default
         raise ValueError(f"Prompt '{prompt_name}' not found in configuration")
     return prompts[prompt_name]
 
@@ -5,12 +5,27 @@
 # the root directory of this source tree.
 # Directory processing utilities for batch operations
 
+import asyncio
+import importlib
+import json
 import os
+import re
+import stat
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import lru_cache, partial
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Iterator, Tuple, FrozenSet
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 
+# Core modules are imported once here; their functions are looked up at call
+# time (e.g. ingest.process_file) so they can still be patched per module
+from synthetic_data_kit.core import ingest, create, curate, save_as
+from synthetic_data_kit.utils.config import get_batch_config, load_config, get_path_config
+
 console = Console()
 
 # Supported file extensions for each command
@@ -19,49 +34,547 @@ CREATE_EXTENSIONS = ['.txt']
 CURATE_EXTENSIONS = ['.json']
 SAVE_AS_EXTENSIONS = ['.json']
 
+@lru_cache(maxsize=None)
+def _extension_matcher(ext_set: FrozenSet[str]) -> "re.Pattern[str]":
+    """Compile one pattern capturing a supported extension at the end of a name
+    
+    Matches exactly the names whose os.path.splitext extension is in ext_set
+    (leading dots do not start an extension), but runs in C instead of a
+    Python-level splitext and lower() per entry.
+    """
+    alternatives = "|".join(re.escape(ext[1:]) for ext in sorted(ext_set) if ext.startswith("."))
+    return re.compile(r"\.*[^.].*?(\.(?:%s))\Z" % (alternatives or "(?!)"), re.IGNORECASE | re.DOTALL)
+
+# Ingest has the most extensions; compile its matcher at import time so the
+# first (usually largest) scan does not pay for it
+_INGEST_EXT_SET = frozenset(INGEST_EXTENSIONS)
+_INGEST_ENDS = _extension_matcher(_INGEST_EXT_SET)
+
+# Number of files submitted to the worker pool at once; each batch is drained
+# before the next one starts so in-flight requests and memory stay bounded
+DEFAULT_PARALLEL_BATCH_SIZE = 100
+
+# Default number of files processed at once by the async directory variants;
+# size this to the LLM provider's rate limit
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Modules imported once per worker process when ingest runs in processes, so
+# each task does not pay the parser import cost again
+_INGEST_WARM_MODULES = (
+    "synthetic_data_kit.core.ingest",
+    "synthetic_data_kit.parsers.pdf_parser",
+    "synthetic_data_kit.parsers.html_parser",
+    "synthetic_data_kit.parsers.docx_parser",
+    "synthetic_data_kit.parsers.ppt_parser",
+    "synthetic_data_kit.parsers.txt_parser",
+    "pdfminer.high_level",
+    "bs4",
+    "docx",
+    "pptx",
+)
+
+# Directory scan results keyed by (directory, extensions) -> (mtime_ns, files, stats),
+# least recently used first and bounded to _DIR_CACHE_MAX_ENTRIES
+_DIR_CACHE: "OrderedDict[Tuple[str, FrozenSet[str]], Tuple[int, List[str], Dict[str, Any]]]" = OrderedDict()
+_DIR_CACHE_MAX_ENTRIES = 64
+
+# Filesystems with coarse timestamps (down to 2s on FAT) can add a file without
+# moving the directory mtime, so directories modified this recently aren't cached
+_DIR_CACHE_MIN_AGE_NS = 2_000_000_000
+
+# DirEntry.is_file() answers regular files and directories from the d_type
+# scandir already returned, so only symlinks cost a stat(). Symlinks are still
+# followed so linked input files keep being processed. Filesystems that do not
+# report d_type (some NFS/FUSE mounts) make every DirEntry.is_file() call
+# stat(); with SDK_PARALLEL_STAT=1 those stats are overlapped on a thread pool
+# for directories larger than this
+_PARALLEL_STAT_THRESHOLD = 1000
+_PARALLEL_STAT_WORKERS = 32
+
+# Progress bar layout shared by all directory commands
+_PROGRESS_COLUMNS = (
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+    TextColumn("({task.completed}/{task.total})"),
+    TimeElapsedColumn(),
+)
+
+# Buffered per-file status lines are printed with a single console call once
+# this many have accumulated or this many seconds have passed
+_LINE_FLUSH_SIZE = 50
+_LINE_FLUSH_INTERVAL = 0.1
+
+# Progress bars are advanced once this many files have completed or this many
+# seconds have passed, instead of re-rendering after every file
+_PROGRESS_FLUSH_SIZE = 8
+_PROGRESS_FLUSH_INTERVAL = 0.1
+
+# When results are streamed to a log file, only this many of the most recent
+# success and error records are kept in the returned dictionary
+RESULTS_LOG_KEEP_LAST = 1000
+
+# One fixed encoder keeps results log bytes the same in every environment;
+# values JSON can't represent (e.g. exceptions) are logged as str()
+_RESULTS_LOG_ENCODER = json.JSONEncoder(separators=(", ", ": "), ensure_ascii=True, default=str)
+
+class _LineBuffer:
+    """Collect console lines and print them in batches to cut Rich per-call overhead"""
+    
+    def __init__(self, style: Optional[str] = None):
+        self.style = style
+        self.lines: List[str] = []
+        self.last_flush = time.monotonic()
+    
+    def add(self, line: str):
+        self.lines.append(line)
+        if (len(self.lines) >= _LINE_FLUSH_SIZE
+                or time.monotonic() - self.last_flush >= _LINE_FLUSH_INTERVAL):
+            self.flush()
+    
+    def flush(self):
+        if self.lines:
+            text = "\n".join(self.lines)
+            if console.is_terminal:
+                console.print(text, style=self.style)
+            else:
+                # Styling is dropped when not writing to a terminal anyway, so
+                # skip Rich's markup parsing and rendering entirely
+                console.file.write(text + "\n")
+            self.lines = []
+        self.last_flush = time.monotonic()
+
+class _ProgressTicker:
+    """Accumulate progress advances and apply them to a Rich task in batches"""
+    
+    def __init__(self, progress: Progress, task):
+        self.progress = progress
+        self.task = task
+        self.pending = 0
+        self.last_flush = time.monotonic()
+    
+    def advance(self):
+        self.pending += 1
+        if (self.pending >= _PROGRESS_FLUSH_SIZE
+                or time.monotonic() - self.last_flush >= _PROGRESS_FLUSH_INTERVAL):
+            self.flush()
+    
+    def flush(self):
+        if self.pending:
+            self.progress.update(self.task, advance=self.pending)
+            self.pending = 0
+        self.last_flush = time.monotonic()
+
+def _print_summary(title: str, results: Dict[str, Any]):
+    """Print the processing summary shown after every directory command"""
+    console.print("\n" + "="*50, style="bold")
+    console.print(title, style="bold blue")
+    console.print(f"Total files: {results['total_files']}")
+    console.print(f"Successful: {results['successful']}", style="green")
+    console.print(f"Failed: {results['failed']}", style="red" if results['failed'] > 0 else "green")
+    console.print("="*50, style="bold")
+
+class _ResultLog:
+    """Record per-file results, optionally streaming them to a JSONL file
+    
+    Without a log path every record is kept in memory as before. With one,
+    each record is written as soon as it is known and the in-memory lists are
+    trimmed to the last RESULTS_LOG_KEEP_LAST entries.
+    """
+    
+    def __init__(self, results: Dict[str, Any], log_path: Optional[str] = None):
+        self.results = results
+        self.log_path = log_path
+        self.file = None
+        if log_path:
+            parent = os.path.dirname(log_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            self.file = open(log_path, "wb")
+            results["results_log"] = log_path
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _write(self, key: str, record: Dict[str, Any]):
+        records = self.results[key]
+        records.append(record)
+        if self.file is None:
+            return
+        self.file.write(_RESULTS_LOG_ENCODER.encode(record).encode("ascii") + b"\n")
+        # Trim in chunks so the list copy is amortised over many appends
+        if len(records) >= 2 * RESULTS_LOG_KEEP_LAST:
+            del records[:-RESULTS_LOG_KEEP_LAST]
+    
+    def success(self, record: Dict[str, Any]):
+        self.results["successful"] += 1
+        self._write("results", record)
+    
+    def failure(self, record: Dict[str, Any]):
+        self.results["failed"] += 1
+        self._write("errors", record)
+    
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            for key in ("results", "errors"):
+                del self.results[key][:-RESULTS_LOG_KEEP_LAST]
+
 def is_directory(path: str) -> bool:
     """Check if path is a directory"""
     return os.path.isdir(path)
 
-def get_supported_files(directory: str, extensions: List[str]) -> List[str]:
-    """Get all files with supported extensions in directory (non-recursive)
+def _scan_directory(directory: str, extensions: List[str]) -> Tuple[List[str], Dict[str, Any]]:
+    """Scan directory once, collecting supported files and statistics (non-recursive)
     
     Args:
         directory: Directory path to scan
         extensions: List of supported file extensions (e.g., ['.pdf', '.txt'])
     
     Returns:
-        List of full file paths with supported extensions
+        Tuple of (sorted full paths of supported files, statistics dictionary)
     """
-    if not os.path.exists(directory):
+    try:
+        dir_stat = os.stat(directory)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Directory not found: {directory}")
     
-    if not os.path.isdir(directory):
+    if not stat.S_ISDIR(dir_stat.st_mode):
         raise ValueError(f"Path is not a directory: {directory}")
     
+    # The directory mtime changes whenever entries are added, removed or renamed,
+    # so an unchanged mtime means the previous scan is still valid
+    # Normalise once so callers may pass upper-case extensions and lookups are O(1)
+    ext_set = frozenset(ext.lower() for ext in extensions)
+    cache_key = (os.path.abspath(directory), ext_set)
+    cached = _DIR_CACHE.get(cache_key)
+    if cached is not None and cached[0] == dir_stat.st_mtime_ns:
+        try:
+            _DIR_CACHE.move_to_end(cache_key)
+        except KeyError:
+            pass  # Invalidated concurrently; the copy below is still consistent
+        return _copy_scan(cached[1], cached[2])
+    
     supported_files = []
+    file_list = []
+    by_extension = Counter()
+    total_files = 0
+    
+    # Local aliases avoid attribute lookups in the per-entry loop
+    _append_path = supported_files.append
+    _append_name = file_list.append
+    _match = _extension_matcher(ext_set).match
     
     try:
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
-            
+        with os.scandir(directory) as it:
+            entries = list(it)
+        
+        if len(entries) > _PARALLEL_STAT_THRESHOLD and os.environ.get("SDK_PARALLEL_STAT") == "1":
+            with ThreadPoolExecutor(max_workers=_PARALLEL_STAT_WORKERS) as executor:
+                is_file_flags = list(executor.map(os.DirEntry.is_file, entries))
+        else:
+            is_file_flags = [entry.is_file() for entry in entries]
+        
+        for entry, is_file in zip(entries, is_file_flags):
             # Skip directories, only process files
-            if os.path.isfile(file_path):
-                # Check if file has supported extension
-                file_ext = os.path.splitext(filename)[1].lower()
-                if file_ext in extensions:
-                    supported_files.append(file_path)
+            if not is_file:
+                continue
+            
+            total_files += 1
+            match = _match(entry.name)
+            if match is not None:
+                _append_path(entry.path)
+                _append_name(entry.name)
+                by_extension[match.group(1).lower()] += 1
     
     except PermissionError:
         raise PermissionError(f"Permission denied accessing directory: {directory}")
     
-    return sorted(supported_files)  # Sort for consistent processing order
+    # Sort for consistent processing order
+    supported_files.sort()
+    file_list.sort()
+    
+    stats = {
+        "total_files": total_files,
+        "supported_files": len(supported_files),
+        "unsupported_files": total_files - len(supported_files),
+        "by_extension": dict(by_extension),
+        "file_list": file_list
+    }
+    if time.time_ns() - dir_stat.st_mtime_ns >= _DIR_CACHE_MIN_AGE_NS:
+        _DIR_CACHE[cache_key] = (dir_stat.st_mtime_ns, supported_files, stats)
+        _DIR_CACHE.move_to_end(cache_key)
+        while len(_DIR_CACHE) > _DIR_CACHE_MAX_ENTRIES:
+            _DIR_CACHE.popitem(last=False)
+    return _copy_scan(supported_files, stats)
+
+def _copy_scan(supported_files: List[str], stats: Dict[str, Any]) -> Tuple[List[str], Dict[str, Any]]:
+    """Copy cached scan results so callers cannot mutate the cache"""
+    return list(supported_files), {
+        **stats,
+        "by_extension": dict(stats["by_extension"]),
+        "file_list": list(stats["file_list"])
+    }
+
+def _invalidate_directory_cache(directory: str):
+    """Drop cached scans of a directory after writing into it"""
+    directory = os.path.abspath(directory)
+    for key in [key for key in _DIR_CACHE if key[0] == directory]:
+        _DIR_CACHE.pop(key, None)
+
+def _base_name(file_path: str) -> str:
+    """Return the file name of a path without its final extension
+    
+    Scanned paths always carry a matched extension, so a slice at the last dot
+    is enough and avoids the extra work os.path.splitext does for edge cases.
+    """
+    name = file_path[file_path.rfind(os.sep) + 1:]
+    dot = name.rfind('.')
+    return name[:dot] if dot > 0 else name
+
+def get_supported_files(directory: str, extensions: List[str]) -> List[str]:
+    """Get all files with supported extensions in directory (non-recursive)
+    
+    Args:
+        directory: Directory path to scan
+        extensions: List of supported file extensions (e.g., ['.pdf', '.txt'])
+    
+    Returns:
+        List of full file paths with supported extensions
+    """
+    return _scan_directory(directory, extensions)[0]
+
+def iter_supported_files(directory: str, extensions: List[str], sort: bool = False) -> Iterator[str]:
+    """Lazily yield files with supported extensions in directory (non-recursive)
+    
+    Unlike get_supported_files, no list is built when sort is False, so callers
+    that stream files or stop early only pay for the entries they consume.
+    
+    Args:
+        directory: Directory path to scan
+        extensions: List of supported file extensions (e.g., ['.pdf', '.txt'])
+        sort: Yield paths in sorted order (materializes the full list)
+    
+    Yields:
+        Full file paths with supported extensions, in directory order unless sorted
+    """
+    if sort:
+        yield from get_supported_files(directory, extensions)
+        return
+    
+    _match = _extension_matcher(frozenset(ext.lower() for ext in extensions)).match
+    
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Directory not found: {directory}")
+    except NotADirectoryError:
+        raise ValueError(f"Path is not a directory: {directory}")
+    except PermissionError:
+        raise PermissionError(f"Permission denied accessing directory: {directory}")
+    
+    with entries:
+        for entry in entries:
+            if entry.is_file() and _match(entry.name) is not None:
+                yield entry.path
+
+def count_supported_files(directory: str, extensions: List[str]) -> int:
+    """Count files with supported extensions in directory without listing them
+    
+    Args:
+        directory: Directory path to scan
+        extensions: List of supported file extensions (e.g., ['.pdf', '.txt'])
+    
+    Returns:
+        Number of supported files
+    """
+    return sum(1 for _ in iter_supported_files(directory, extensions))
+
+def _resolve_batch_settings(
+    parallel_batch_size: Optional[int],
+    config: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, Optional[int]]:
+    """Resolve batch size and worker count from arguments, then config, then defaults"""
+    batch_config = get_batch_config(config) if config else {}
+    if parallel_batch_size is None:
+        parallel_batch_size = batch_config.get('parallel_batch_size')
+    max_workers = batch_config.get('max_workers')
+    return max(1, parallel_batch_size or DEFAULT_PARALLEL_BATCH_SIZE), max_workers
+
+def _process_in_batches(
+    file_paths: List[str],
+    worker: Callable[[str], Any],
+    parallel_batch_size: int,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[str, Any, Optional[BaseException]]]:
+    """Run worker over files in sequential batches, in parallel within each batch
+    
+    Args:
+        file_paths: Files to process
+        worker: Callable taking a file path and returning its output path
+        parallel_batch_size: Number of files submitted to the pool at once
+        max_workers: Maximum worker threads (None uses the executor default)
+    
+    Yields:
+        (file_path, output, error) tuples in input order; error is None on success
+    """
+    files_iter = iter(file_paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            batch = list(islice(files_iter, parallel_batch_size))
+            if not batch:
+                break
+            
+            futures = [executor.submit(worker, file_path) for file_path in batch]
+            wait(futures)
+            
+            for file_path, future in zip(batch, futures):
+                error = future.exception()
+                yield file_path, None if error else future.result(), error
+
+def _warm_ingest_imports():
+    """Process pool initializer that imports the parsers and their libraries"""
+    for module_name in _INGEST_WARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            # Optional parser dependency; the parser reports it if it is needed
+            pass
+
+def _ingest_one(
+    file_path: str,
+    output_dir: Optional[str],
+    config: Optional[Dict[str, Any]],
+) -> Tuple[Any, Optional[BaseException]]:
+    """Ingest one file in a worker process, returning (output, error)"""
+    try:
+        return ingest.process_file(file_path, output_dir, None, config), None
+    except Exception as e:
+        return None, e
+
+def _process_in_processes(
+    file_paths: List[str],
+    output_dir: Optional[str],
+    config: Optional[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[str, Any, Optional[BaseException]]]:
+    """Ingest files on a process pool for CPU-bound parsing
+    
+    Args:
+        file_paths: Files to ingest
+        output_dir: Directory to save parsed text
+        config: Configuration dictionary
+        max_workers: Worker processes (None uses the CPU count)
+    
+    Yields:
+        (file_path, output, error) tuples in input order; error is None on success
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    # Several files per task amortise pickling and IPC for many small files
+    chunksize = max(1, len(file_paths) // (max_workers * 4))
+    worker = partial(_ingest_one, output_dir=output_dir, config=config)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_warm_ingest_imports) as executor:
+        for file_path, (output, error) in zip(
+            file_paths, executor.map(worker, file_paths, chunksize=chunksize)
+        ):
+            yield file_path, output, error
+
+def _create_worker(
+    output_dir, config_path, api_base, model, content_type, num_pairs,
+    verbose, provider, chunk_size, chunk_overlap
+) -> Callable[[str], str]:
+    """Build the per-file worker shared by the sync and async create paths"""
+    def worker(file_path):
+        return create.process_file(
+            file_path,
+            output_dir,
+            config_path,
+            api_base,
+            model,
+            content_type,
+            num_pairs,
+            verbose,
+            provider=provider,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap
+        )
+    return worker
+
+def _curate_worker(
+    output_dir, threshold, api_base, model, config_path, verbose, provider
+) -> Callable[[str], str]:
+    """Build the per-file worker shared by the sync and async curate paths"""
+    _join = os.path.join
+    
+    def worker(file_path):
+        # Generate output path for this file
+        output_path = _join(output_dir, _base_name(file_path) + "_cleaned.json")
+        
+        return curate.curate_qa_pairs(
+            file_path,
+            output_path,
+            threshold,
+            api_base,
+            model,
+            config_path,
+            verbose,
+            provider=provider
+        )
+    return worker
+
+async def _process_concurrently(
+    file_paths: List[str],
+    worker: Callable[[str], Any],
+    max_concurrency: int,
+    on_complete: Optional[Callable[[], None]] = None,
+) -> List[Tuple[str, Any, Optional[BaseException]]]:
+    """Run a blocking worker over files with at most max_concurrency in flight
+    
+    Each call runs on a dedicated thread pool so the LLM client's own event
+    loop usage (e.g. batch_completion) stays off the caller's loop.
+    
+    Args:
+        file_paths: Files to process
+        worker: Callable taking a file path and returning its output path
+        max_concurrency: Maximum number of files processed at once
+        on_complete: Called once per finished file, in completion order
+    
+    Returns:
+        (file_path, output, error) tuples in input order
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run(index, file_path):
+        async with semaphore:
+            try:
+                output = await loop.run_in_executor(executor, worker, file_path)
+                return index, (file_path, output, None)
+            except Exception as e:
+                return index, (file_path, None, e)
+    
+    outcomes = [None] * len(file_paths)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        tasks = [run(i, file_path) for i, file_path in enumerate(file_paths)]
+        for next_done in asyncio.as_completed(tasks):
+            index, outcome = await next_done
+            outcomes[index] = outcome
+            if on_complete is not None:
+                on_complete()
+    return outcomes
 
 def process_directory_ingest(
     directory: str,
     output_dir: Optional[str] = None,
     config: Optional[Dict[str, Any]] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    parallel_batch_size: Optional[int] = None,
+    results_log_path: Optional[str] = None,
+    use_processes: Optional[bool] = None,
 ) -> Dict[str, Any]:
     """Process all supported files in directory for ingestion
     
@@ -70,12 +583,15 @@ def process_directory_ingest(
         output_dir: Directory to save processed files
         config: Configuration dictionary
         verbose: Show detailed progress
+        parallel_batch_size: Files processed concurrently per batch (default from config)
+        results_log_path: Stream each result record to this JSONL file and keep only
+            the last RESULTS_LOG_KEEP_LAST records in memory
+        use_processes: Parse files in worker processes instead of threads
+            (default from config batch.ingest_processes)
     
     Returns:
         Dictionary with processing results
     """
-    from synthetic_data_kit.core.ingest import process_file
-    
     # Get all supported files
     supported_files = get_supported_files(directory, INGEST_EXTENSIONS)
     
@@ -101,62 +617,70 @@ def process_directory_ingest(
         "errors": []
     }
     
+    # Batch settings come from the default config when none is passed
+    if config is None:
+        config = load_config()
+    
     # Process files with progress bar
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("({task.completed}/{task.total})"),
-        TimeElapsedColumn(),
-        console=console,
-        disable=not verbose
-    ) as progress:
+    success_lines = _LineBuffer(style="green")
+    with _ResultLog(results, results_log_path) as result_log, \
+         Progress(*_PROGRESS_COLUMNS, console=console, disable=not verbose) as progress:
         
         task = progress.add_task("Processing files", total=len(supported_files))
+        ticker = _ProgressTicker(progress, task)
+        
+        batch_size, max_workers = _resolve_batch_settings(parallel_batch_size, config)
+        if use_processes is None:
+            use_processes = bool(config and get_batch_config(config).get('ingest_processes'))
+        
+        if use_processes:
+            # PDF/DOCX/PPTX parsing is CPU-bound, so threads would contend on the GIL
+            outcomes = _process_in_processes(supported_files, output_dir, config, max_workers)
+        else:
+            def worker(file_path):
+                return ingest.process_file(file_path, output_dir, None, config)
+            
+            outcomes = _process_in_batches(supported_files, worker, batch_size, max_workers)
         
-        for file_path in supported_files:
+        for file_path, output_path, error in outcomes:
             filename = os.path.basename(file_path)
             
-            try:
-                # Process individual file
-                output_path = process_file(file_path, output_dir, None, config)
-                
+            if error is None:
                 # Record success
-                results["successful"] += 1
-                results["results"].append({
+                result_log.success({
                     "input_file": file_path,
                     "output_file": output_path,
                     "status": "success"
                 })
                 
                 if verbose:
-                    console.print(f"✓ Processed {filename} -> {os.path.basename(output_path)}", style="green")
+                    success_lines.add(f"✓ Processed {filename} -> {os.path.basename(output_path)}")
                 else:
-                    console.print(f"✓ {filename}", style="green")
+                    success_lines.add(f"✓ {filename}")
                 
-            except Exception as e:
+            else:
                 # Record failure
-                results["failed"] += 1
-                results["errors"].append({
+                result_log.failure({
                     "input_file": file_path,
-                    "error": str(e),
+                    "error": str(error),
                     "status": "failed"
                 })
                 
+                success_lines.flush()
                 if verbose:
-                    console.print(f"✗ Failed to process {filename}: {e}", style="red")
+                    console.print(f"✗ Failed to process {filename}: {error}", style="red")
                 else:
-                    console.print(f"✗ {filename}: {e}", style="red")
+                    console.print(f"✗ {filename}: {error}", style="red")
             
-            progress.update(task, advance=1)
+            ticker.advance()
+        ticker.flush()
+    
+    if output_dir is not None:
+        _invalidate_directory_cache(output_dir)
     
     # Show summary
-    console.print("\n" + "="*50, style="bold")
-    console.print(f"Processing Summary:", style="bold blue")
-    console.print(f"Total files: {results['total_files']}")
-    console.print(f"Successful: {results['successful']}", style="green")
-    console.print(f"Failed: {results['failed']}", style="red" if results['failed'] > 0 else "green")
-    console.print("="*50, style="bold")
+    success_lines.flush()
+    _print_summary("Processing Summary:", results)
     
     return results
 
@@ -170,43 +694,10 @@ def get_directory_stats(directory: str, extensions: List[str]) -> Dict[str, Any]
     Returns:
         Dictionary with file statistics
     """
-    if not os.path.exists(directory):
-        return {"error": f"Directory not found: {directory}"}
-    
-    if not os.path.isdir(directory):
-        return {"error": f"Path is not a directory: {directory}"}
-    
-    stats = {
-        "total_files": 0,
-        "supported_files": 0,
-        "unsupported_files": 0,
-        "by_extension": {},
-        "file_list": []
-    }
-    
     try:
-        for filename in os.listdir(directory):
-            file_path = os.path.join(directory, filename)
-            
-            if os.path.isfile(file_path):
-                stats["total_files"] += 1
-                file_ext = os.path.splitext(filename)[1].lower()
-                
-                if file_ext in extensions:
-                    stats["supported_files"] += 1
-                    stats["file_list"].append(filename)
-                    
-                    # Count by extension
-                    if file_ext not in stats["by_extension"]:
-                        stats["by_extension"][file_ext] = 0
-                    stats["by_extension"][file_ext] += 1
-                else:
-                    stats["unsupported_files"] += 1
-    
-    except PermissionError:
-        return {"error": f"Permission denied accessing directory: {directory}"}
-    
-    return stats
+        return _scan_directory(directory, extensions)[1]
+    except (FileNotFoundError, ValueError, PermissionError) as e:
+        return {"error": str(e)}
 
 def process_directory_create(
     directory: str,
@@ -220,6 +711,8 @@ def process_directory_create(
     provider: Optional[str] = None,
     chunk_size: Optional[int] = None,
     chunk_overlap: Optional[int] = None,
+    parallel_batch_size: Optional[int] = None,
+    results_log_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Process all supported files in directory for content creation
     
@@ -233,12 +726,13 @@ def process_directory_create(
         num_pairs: Target number of QA pairs or examples
         verbose: Show detailed progress
         provider: LLM provider to use
+        parallel_batch_size: Files processed concurrently per batch
+        results_log_path: Stream each result record to this JSONL file and keep only
+            the last RESULTS_LOG_KEEP_LAST records in memory
     
     Returns:
         Dictionary with processing results
     """
-    from synthetic_data_kit.core.create import process_file
-    
     # For create command, we process .txt files (output from ingest)
     # For cot-enhance, we process .json files instead
     if content_type == "cot-enhance":
@@ -275,40 +769,28 @@ def process_directory_create(
     }
     
     # Process files with progress bar
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("({task.completed}/{task.total})"),
-        TimeElapsedColumn(),
-        console=console,
-        disable=not verbose
-    ) as progress:
+    success_lines = _LineBuffer(style="green")
+    with _ResultLog(results, results_log_path) as result_log, \
+         Progress(*_PROGRESS_COLUMNS, console=console, disable=not verbose) as progress:
         
         task = progress.add_task(f"Generating {content_type} content", total=len(supported_files))
+        ticker = _ProgressTicker(progress, task)
+        
+        batch_size, max_workers = _resolve_batch_settings(parallel_batch_size, load_config(config_path))
+        
+        worker = _create_worker(
+            output_dir, config_path, api_base, model, content_type, num_pairs,
+            verbose, provider, chunk_size, chunk_overlap
+        )
         
-        for file_path in supported_files:
+        for file_path, output_path, error in _process_in_batches(
+            supported_files, worker, batch_size, max_workers
+        ):
             filename = os.path.basename(file_path)
             
-            try:
-                # Process individual file
-                output_path = process_file(
-                    file_path,
-                    output_dir,
-                    config_path,
-                    api_base,
-                    model,
-                    content_type,
-                    num_pairs,
-                    verbose,
-                    provider=provider,
-                    chunk_size=chunk_size,
-                    chunk_overlap=chunk_overlap
-                )
-                
+            if error is None:
                 # Record success
-                results["successful"] += 1
-                results["results"].append({
+                result_log.success({
                     "input_file": file_path,
                     "output_file": output_path,
                     "content_type": content_type,
@@ -316,34 +798,34 @@ def process_directory_create(
                 })
                 
                 if verbose:
-                    console.print(f"✓ Generated {content_type} from {filename} -> {os.path.basename(output_path)}", style="green")
+                    success_lines.add(f"✓ Generated {content_type} from {filename} -> {os.path.basename(output_path)}")
                 else:
-                    console.print(f"✓ {filename}", style="green")
+                    success_lines.add(f"✓ {filename}")
                 
-            except Exception as e:
+            else:
                 # Record failure
-                results["failed"] += 1
-                results["errors"].append({
+                result_log.failure({
                     "input_file": file_path,
-                    "error": str(e),
+                    "error": str(error),
                     "content_type": content_type,
                     "status": "failed"
                 })
                 
+                success_lines.flush()
                 if verbose:
-                    console.print(f"✗ Failed to process {filename}: {e}", style="red")
+                    console.print(f"✗ Failed to process {filename}: {error}", style="red")
                 else:
-                    console.print(f"✗ {filename}: {e}", style="red")
+                    console.print(f"✗ {filename}: {error}", style="red")
             
-            progress.update(task, advance=1)
+            ticker.advance()
+        ticker.flush()
+    
+    if output_dir is not None:
+        _invalidate_directory_cache(output_dir)
     
     # Show summary
-    console.print("\n" + "="*50, style="bold")
-    console.print(f"Content Generation Summary ({content_type}):", style="bold blue")
-    console.print(f"Total files: {results['total_files']}")
-    console.print(f"Successful: {results['successful']}", style="green")
-    console.print(f"Failed: {results['failed']}", style="red" if results['failed'] > 0 else "green")
-    console.print("="*50, style="bold")
+    success_lines.flush()
+    _print_summary(f"Content Generation Summary ({content_type}):", results)
     
     return results
 
@@ -356,6 +838,8 @@ def process_directory_curate(
     config_path: Optional[str] = None,
     verbose: bool = False,
     provider: Optional[str] = None,
+    parallel_batch_size: Optional[int] = None,
+    results_log_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Process all supported files in directory for content curation
     
@@ -368,12 +852,13 @@ def process_directory_curate(
         config_path: Path to configuration file
         verbose: Show detailed progress
         provider: LLM provider to use
+        parallel_batch_size: Files processed concurrently per batch
+        results_log_path: Stream each result record to this JSONL file and keep only
+            the last RESULTS_LOG_KEEP_LAST records in memory
     
     Returns:
         Dictionary with processing results
     """
-    from synthetic_data_kit.core.curate import curate_qa_pairs
-    
     # For curate command, we process .json files (output from create)
     supported_files = get_supported_files(directory, CURATE_EXTENSIONS)  # ['.json']
     
@@ -400,47 +885,35 @@ def process_directory_curate(
     }
     
     # If no output_dir specified, default to cleaned directory
+    config = load_config(config_path)
     if output_dir is None:
-        from synthetic_data_kit.utils.config import load_config, get_path_config
-        config = load_config(config_path)
         output_dir = get_path_config(config, "output", "curated")
     
+    # Create the output directory once rather than per file in curate_qa_pairs
+    os.makedirs(output_dir, exist_ok=True)
+    
     # Process files with progress bar
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("({task.completed}/{task.total})"),
-        TimeElapsedColumn(),
-        console=console,
-        disable=not verbose
-    ) as progress:
+    success_lines = _LineBuffer(style="green")
+    with _ResultLog(results, results_log_path) as result_log, \
+         Progress(*_PROGRESS_COLUMNS, console=console, disable=not verbose) as progress:
         
         task = progress.add_task("Curating QA pairs", total=len(supported_files))
+        ticker = _ProgressTicker(progress, task)
+        
+        batch_size, max_workers = _resolve_batch_settings(parallel_batch_size, config)
         
-        for file_path in supported_files:
+        worker = _curate_worker(
+            output_dir, threshold, api_base, model, config_path, verbose, provider
+        )
+        
+        for file_path, result_path, error in _process_in_batches(
+            supported_files, worker, batch_size, max_workers
+        ):
             filename = os.path.basename(file_path)
             
-            try:
-                # Generate output path for this file
-                base_name = os.path.splitext(filename)[0]
-                output_path = os.path.join(output_dir, f"{base_name}_cleaned.json")
-                
-                # Process individual file
-                result_path = curate_qa_pairs(
-                    file_path,
-                    output_path,
-                    threshold,
-                    api_base,
-                    model,
-                    config_path,
-                    verbose,
-                    provider=provider
-                )
-                
+            if error is None:
                 # Record success
-                results["successful"] += 1
-                results["results"].append({
+                result_log.success({
                     "input_file": file_path,
                     "output_file": result_path,
                     "threshold": threshold,
@@ -448,34 +921,34 @@ def process_directory_curate(
                 })
                 
                 if verbose:
-                    console.print(f"✓ Curated {filename} -> {os.path.basename(result_path)}", style="green")
+                    success_lines.add(f"✓ Curated {filename} -> {os.path.basename(result_path)}")
                 else:
-                    console.print(f"✓ {filename}", style="green")
+                    success_lines.add(f"✓ {filename}")
                 
-            except Exception as e:
+            else:
                 # Record failure
-                results["failed"] += 1
-                results["errors"].append({
+                result_log.failure({
                     "input_file": file_path,
-                    "error": str(e),
+                    "error": str(error),
                     "threshold": threshold,
                     "status": "failed"
                 })
                 
+                success_lines.flush()
                 if verbose:
-                    console.print(f"✗ Failed to curate {filename}: {e}", style="red")
+                    console.print(f"✗ Failed to curate {filename}: {error}", style="red")
                 else:
-                    console.print(f"✗ {filename}: {e}", style="red")
+                    console.print(f"✗ {filename}: {error}", style="red")
             
-            progress.update(task, advance=1)
+            ticker.advance()
+        ticker.flush()
+    
+    if output_dir is not None:
+        _invalidate_directory_cache(output_dir)
     
     # Show summary
-    console.print("\n" + "="*50, style="bold")
-    console.print(f"Curation Summary (threshold: {threshold}):", style="bold blue")
-    console.print(f"Total files: {results['total_files']}")
-    console.print(f"Successful: {results['successful']}", style="green")
-    console.print(f"Failed: {results['failed']}", style="red" if results['failed'] > 0 else "green")
-    console.print("="*50, style="bold")
+    success_lines.flush()
+    _print_summary(f"Curation Summary (threshold: {threshold}):", results)
     
     return results
 
@@ -486,6 +959,8 @@ def process_directory_save_as(
     storage_format: str = "json",
     config: Optional[Dict[str, Any]] = None,
     verbose: bool = False,
+    parallel_batch_size: Optional[int] = None,
+    results_log_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Process all supported files in directory for format conversion
     
@@ -496,12 +971,13 @@ def process_directory_save_as(
         storage_format: Storage format (json, hf)
         config: Configuration dictionary
         verbose: Show detailed progress
+        parallel_batch_size: Files processed concurrently per batch (default from config)
+        results_log_path: Stream each result record to this JSONL file and keep only
+            the last RESULTS_LOG_KEEP_LAST records in memory
     
     Returns:
         Dictionary with processing results
     """
-    from synthetic_data_kit.core.save_as import convert_format
-    
     # For save-as command, we process .json files (output from curate)
     supported_files = get_supported_files(directory, SAVE_AS_EXTENSIONS)  # ['.json']
     
@@ -528,54 +1004,55 @@ def process_directory_save_as(
     }
     
     # If no output_dir specified, default to final directory
+    if config is None:
+        config = load_config()
     if output_dir is None:
-        from synthetic_data_kit.utils.config import load_config, get_path_config
-        if config is None:
-            config = load_config()
         output_dir = get_path_config(config, "output", "final")
     
+    # Create the output directory once rather than per file in convert_format
+    os.makedirs(output_dir, exist_ok=True)
+    
     # Process files with progress bar
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TextColumn("({task.completed}/{task.total})"),
-        TimeElapsedColumn(),
-        console=console,
-        disable=not verbose
-    ) as progress:
+    success_lines = _LineBuffer(style="green")
+    with _ResultLog(results, results_log_path) as result_log, \
+         Progress(*_PROGRESS_COLUMNS, console=console, disable=not verbose) as progress:
         
         task = progress.add_task(f"Converting to {format} format", total=len(supported_files))
+        ticker = _ProgressTicker(progress, task)
+        
+        batch_size, max_workers = _resolve_batch_settings(parallel_batch_size, config)
         
-        for file_path in supported_files:
+        # The output name suffix depends only on format and storage, so pick it once
+        if storage_format == "hf":
+            # For HF datasets, use a directory name
+            output_suffix = f"_{format}_hf"
+        elif format == "jsonl":
+            # For JSON files, use appropriate extension
+            output_suffix = ".jsonl"
+        else:
+            output_suffix = f"_{format}.json"
+        _join = os.path.join
+        
+        def worker(file_path):
+            # Generate output path for this file
+            output_path = _join(output_dir, _base_name(file_path) + output_suffix)
+            
+            return save_as.convert_format(
+                file_path,
+                output_path,
+                format,
+                config,
+                storage_format=storage_format
+            )
+        
+        for file_path, result_path, error in _process_in_batches(
+            supported_files, worker, batch_size, max_workers
+        ):
             filename = os.path.basename(file_path)
             
-            try:
-                # Generate output path for this file
-                base_name = os.path.splitext(filename)[0]
-                
-                if storage_format == "hf":
-                    # For HF datasets, use a directory name
-                    output_path = os.path.join(output_dir, f"{base_name}_{format}_hf")
-                else:
-                    # For JSON files, use appropriate extension
-                    if format == "jsonl":
-                        output_path = os.path.join(output_dir, f"{base_name}.jsonl")
-                    else:
-                        output_path = os.path.join(output_dir, f"{base_name}_{format}.json")
-                
-                # Process individual file
-                result_path = convert_format(
-                    file_path,
-                    output_path,
-                    format,
-                    config,
-                    storage_format=storage_format
-                )
-                
+            if error is None:
                 # Record success
-                results["successful"] += 1
-                results["results"].append({
+                result_log.success({
                     "input_file": file_path,
                     "output_file": result_path,
                     "format": format,
@@ -584,34 +1061,225 @@ def process_directory_save_as(
                 })
                 
                 if verbose:
-                    console.print(f"✓ Converted {filename} -> {os.path.basename(result_path)} ({format}, {storage_format})", style="green")
+                    success_lines.add(f"✓ Converted {filename} -> {os.path.basename(result_path)} ({format}, {storage_format})")
                 else:
-                    console.print(f"✓ {filename}", style="green")
+                    success_lines.add(f"✓ {filename}")
                 
-            except Exception as e:
+            else:
                 # Record failure
-                results["failed"] += 1
-                results["errors"].append({
+                result_log.failure({
                     "input_file": file_path,
-                    "error": str(e),
+                    "error": str(error),
                     "format": format,
                     "storage": storage_format,
                     "status": "failed"
                 })
                 
+                success_lines.flush()
                 if verbose:
-                    console.print(f"✗ Failed to convert {filename}: {e}", style="red")
+                    console.print(f"✗ Failed to convert {filename}: {error}", style="red")
                 else:
-                    console.print(f"✗ {filename}: {e}", style="red")
+                    console.print(f"✗ {filename}: {error}", style="red")
             
-            progress.update(task, advance=1)
+            ticker.advance()
+        ticker.flush()
+    
+    if output_dir is not None:
+        _invalidate_directory_cache(output_dir)
     
     # Show summary
-    console.print("\n" + "="*50, style="bold")
-    console.print(f"Format Conversion Summary ({format}, {storage_format}):", style="bold blue")
-    console.print(f"Total files: {results['total_files']}")
-    console.print(f"Successful: {results['successful']}", style="green")
-    console.print(f"Failed: {results['failed']}", style="red" if results['failed'] > 0 else "green")
-    console.print("="*50, style="bold")
+    success_lines.flush()
+    _print_summary(f"Format Conversion Summary ({format}, {storage_format}):", results)
+    
+    return results
+
+def _record_async_outcomes(
+    outcomes: List[Tuple[str, Any, Optional[BaseException]]],
+    results: Dict[str, Any],
+    extra: Dict[str, Any],
+    verbose: bool,
+    success_label: str,
+    failure_label: str,
+):
+    """Record (file_path, output, error) outcomes into a results dictionary"""
+    success_lines = _LineBuffer(style="green")
+    for file_path, output_path, error in outcomes:
+        filename = os.path.basename(file_path)
+        
+        if error is None:
+            results["successful"] += 1
+            results["results"].append({
+                "input_file": file_path,
+                "output_file": output_path,
+                **extra,
+                "status": "success"
+            })
+            
+            if verbose:
+                success_lines.add(f"✓ {success_label} {filename} -> {os.path.basename(output_path)}")
+            else:
+                success_lines.add(f"✓ {filename}")
+        else:
+            results["failed"] += 1
+            results["errors"].append({
+                "input_file": file_path,
+                "error": str(error),
+                **extra,
+                "status": "failed"
+            })
+            
+            success_lines.flush()
+            if verbose:
+                console.print(f"✗ Failed to {failure_label} {filename}: {error}", style="red")
+            else:
+                console.print(f"✗ {filename}: {error}", style="red")
+    success_lines.flush()
+
+async def process_directory_create_async(
+    directory: str,
+    output_dir: Optional[str] = None,
+    config_path: Optional[str] = None,
+    api_base: Optional[str] = None,
+    model: Optional[str] = None,
+    content_type: str = "qa",
+    num_pairs: Optional[int] = None,
+    verbose: bool = False,
+    provider: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    chunk_overlap: Optional[int] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Async variant of process_directory_create for LLM-bound workloads
     
-    return results
\ No newline at end of file
+    Files are fanned out under an asyncio.Semaphore instead of in fixed
+    batches, so a slow file never holds back the rest of its batch.
+    
+    Args:
+        directory: Directory containing .txt files to process
+        output_dir: Directory to save generated content
+        config_path: Path to configuration file
+        api_base: API base URL
+        model: Model to use
+        content_type: Type of content to generate (qa, summary, cot, cot-enhance)
+        num_pairs: Target number of QA pairs or examples
+        verbose: Show detailed progress
+        provider: LLM provider to use
+        max_concurrency: Maximum number of files processed at once
+    
+    Returns:
+        Dictionary with processing results
+    """
+    extensions = ['.json'] if content_type == "cot-enhance" else CREATE_EXTENSIONS
+    supported_files = get_supported_files(directory, extensions)
+    
+    results = {
+        "total_files": len(supported_files),
+        "successful": 0,
+        "failed": 0,
+        "results": [],
+        "errors": []
+    }
+    if not supported_files:
+        console.print(f"No supported files found in {directory}", style="yellow")
+        return results
+    
+    console.print(f"Found {len(supported_files)} {content_type} files to process", style="blue")
+    
+    worker = _create_worker(
+        output_dir, config_path, api_base, model, content_type, num_pairs,
+        verbose, provider, chunk_size, chunk_overlap
+    )
+    with Progress(*_PROGRESS_COLUMNS, console=console, disable=not verbose) as progress:
+        task = progress.add_task(f"Generating {content_type} content", total=len(supported_files))
+        ticker = _ProgressTicker(progress, task)
+        outcomes = await _process_concurrently(
+            supported_files, worker, max(1, max_concurrency),
+            on_complete=ticker.advance
+        )
+        ticker.flush()
+    
+    _record_async_outcomes(
+        outcomes, results, {"content_type": content_type}, verbose,
+        f"Generated {content_type} from", "process"
+    )
+    
+    if output_dir is not None:
+        _invalidate_directory_cache(output_dir)
+    
+    # Show summary
+    _print_summary(f"Content Generation Summary ({content_type}):", results)
+    
+    return results
+
+async def process_directory_curate_async(
+    directory: str,
+    output_dir: Optional[str] = None,
+    threshold: Optional[float] = None,
+    api_base: Optional[str] = None,
+    model: Optional[str] = None,
+    config_path: Optional[str] = None,
+    verbose: bool = False,
+    provider: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> Dict[str, Any]:
+    """Async variant of process_directory_curate for LLM-bound workloads
+    
+    Args:
+        directory: Directory containing .json files to curate
+        output_dir: Directory to save curated content (if None, uses config)
+        threshold: Quality threshold (1-10)
+        api_base: API base URL
+        model: Model to use
+        config_path: Path to configuration file
+        verbose: Show detailed progress
+        provider: LLM provider to use
+        max_concurrency: Maximum number of files processed at once
+    
+    Returns:
+        Dictionary with processing results
+    """
+    supported_files = get_supported_files(directory, CURATE_EXTENSIONS)
+    
+    results = {
+        "total_files": len(supported_files),
+        "successful": 0,
+        "failed": 0,
+        "results": [],
+        "errors": []
+    }
+    if not supported_files:
+        console.print(f"No supported files found in {directory}", style="yellow")
+        return results
+    
+    console.print(f"Found {len(supported_files)} JSON files to curate", style="blue")
+    
+    # If no output_dir specified, default to cleaned directory
+    if output_dir is None:
+        config = load_config(config_path)
+        output_dir = get_path_config(config, "output", "curated")
+    
+    # Create the output directory once rather than per file in curate_qa_pairs
+    os.makedirs(output_dir, exist_ok=True)
+    
+    worker = _curate_worker(
+        output_dir, threshold, api_base, model, config_path, verbose, provider
+    )
+    with Progress(*_PROGRESS_COLUMNS, console=console, disable=not verbose) as progress:
+        task = progress.add_task("Curating QA pairs", total=len(supported_files))
+        ticker = _ProgressTicker(progress, task)
+        outcomes = await _process_concurrently(
+            supported_files, worker, max(1, max_concurrency),
+            on_complete=ticker.advance
+        )
+        ticker.flush()
+    
+    _record_async_outcomes(
+        outcomes, results, {"threshold": threshold}, verbose, "Curated", "curate"
+    )
+    
+    _invalidate_directory_cache(output_dir)
+    
+    # Show summary
+    _print_summary(f"Curation Summary (threshold: {threshold}):", results)
+    
+    return results
@@ -7,61 +7,74 @@
 import json
 import os
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable
+
+# Explicit settings keep JSONL output byte-identical across environments:
+# the same separators and ASCII escaping as json.dumps defaults
+_JSONL_ENCODER = json.JSONEncoder(separators=(', ', ': '), ensure_ascii=True)
+
+def _write_jsonl(records: Iterable[Dict[str, Any]], output_path: str):
+    """Write one JSON record per line, encoded straight to bytes"""
+    encode = _JSONL_ENCODER.encode
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        for record in records:
+            f.write(encode(record).encode('ascii'))
+            f.write(b'\n')
 
 def to_jsonl(data: List[Dict[str, Any]], output_path: str) -> str:
     """Convert data to JSONL format and save to a file"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for item in data:
-            f.write(json.dumps(item) + '\n')
+    _write_jsonl(data, output_path)
     return output_path
 
-def to_alpaca(qa_pairs: List[Dict[str, str]], output_path: str) -> str:
-    """Convert QA pairs to Alpaca format and save"""
-    alpaca_data = []
+def format_records(qa_pairs: List[Dict[str, Any]], format_type: str) -> List[Dict[str, Any]]:
+    """Shape QA pairs into the records of the requested output format
     
-    for pair in qa_pairs:
-        alpaca_item = {
-            "instruction": pair["question"],
-            "input": "",
-            "output": pair["answer"]
-        }
-        alpaca_data.append(alpaca_item)
+    Args:
+        qa_pairs: List of question-answer dictionaries
+        format_type: Output format (jsonl, alpaca, ft, chatml)
     
+    Returns:
+        One record per QA pair, as written by the matching to_* function
+    """
+    if format_type == "jsonl":
+        # For JSONL, just use the QA pairs directly
+        return qa_pairs
+    if format_type == "alpaca":
+        return [
+            {"instruction": pair["question"], "input": "", "output": pair["answer"]}
+            for pair in qa_pairs
+        ]
+    if format_type in ("ft", "chatml"):
+        system_prompt = "You are a helpful assistant." if format_type == "ft" else "You are a helpful AI assistant."
+        return [
+            {
+                "messages": [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": pair["question"]},
+                    {"role": "assistant", "content": pair["answer"]}
+                ]
+            }
+            for pair in qa_pairs
+        ]
+    raise ValueError(f"Unknown format type: {format_type}")
+
+def to_alpaca(qa_pairs: List[Dict[str, str]], output_path: str) -> str:
+    """Convert QA pairs to Alpaca format and save"""
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(alpaca_data, f, indent=2)
+        json.dump(format_records(qa_pairs, "alpaca"), f, indent=2)
     
     return output_path
 
 def to_fine_tuning(qa_pairs: List[Dict[str, str]], output_path: str) -> str:
     """Convert QA pairs to fine-tuning format and save"""
-    ft_data = []
-    
-    for pair in qa_pairs:
-        ft_item = {
-            "messages": [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": pair["question"]},
-                {"role": "assistant", "content": pair["answer"]}
-            ]
-        }
-        ft_data.append(ft_item)
-    
     with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(ft_data, f, indent=2)
+        json.dump(format_records(qa_pairs, "ft"), f, indent=2)
     
     return output_path
 
 def to_chatml(qa_pairs: List[Dict[str, str]], output_path: str) -> str:
     """Convert QA pairs to ChatML format and save as JSONL"""
-    with open(output_path, 'w', encoding='utf-8') as f:
-        for pair in qa_pairs:
-            chat = [
-                {"role": "system", "content": "You are a helpful AI assistant."},
-                {"role": "user", "content": pair["question"]},
-                {"role": "assistant", "content": pair["answer"]}
-            ]
-            f.write(json.dumps({"messages": chat}) + '\n')
+    _write_jsonl(format_records(qa_pairs, "chatml"), output_path)
     
     return output_path
 
@@ -91,10 +104,14 @@ def to_hf_dataset(qa_pairs: List[Dict[str, str]], output_path: str) -> str:
     # Create directory if needed
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Convert list of dicts to dict of lists for Dataset.from_dict()
-    dict_of_lists = {}
-    for key in qa_pairs[0].keys():
-        dict_of_lists[key] = [item.get(key, "") for item in qa_pairs]
+    # Convert list of dicts to dict of lists for Dataset.from_dict(),
+    # filling every column in a single pass over the pairs
+    keys = list(qa_pairs[0].keys())
+    columns = [[None] * len(qa_pairs) for _ in keys]
+    for i, item in enumerate(qa_pairs):
+        for column, key in zip(columns, keys):
+            column[i] = item.get(key, "")
+    dict_of_lists = dict(zip(keys, columns))
     
     # Create dataset
     dataset = Dataset.from_dict(dict_of_lists)
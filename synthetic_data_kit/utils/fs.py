@@ -0,0 +1,77 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# Filesystem helpers shared by the app context and the parsers
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Set
+
+# Absolute paths of directories already created by this process, so repeated
+# saves into the same directory skip the makedirs calls
+_CREATED_DIRS: Set[str] = set()
+_DIRS_LOCK = threading.Lock()
+
+def _mkdir_leaf(dir_path: str) -> None:
+    """Create one directory whose parent is known to exist"""
+    try:
+        os.mkdir(dir_path)
+    except FileExistsError:
+        if not os.path.isdir(dir_path):
+            raise
+
+def ensure_dirs(dir_paths: Iterable[str]) -> None:
+    """Create each directory not yet created by this process
+    
+    Shared parent directories (e.g. data/ for data/input and data/parsed) are
+    created once up front; the leaves are then created concurrently with a
+    single mkdir each, since mkdir blocks on slow (e.g. network) filesystems.
+    The first error is re-raised.
+    """
+    with _DIRS_LOCK:
+        # Relative paths resolve against the current directory, so key on the absolute path
+        pending = {}
+        for dir_path in dir_paths:
+            key = os.path.abspath(dir_path)
+            if key not in _CREATED_DIRS:
+                pending.setdefault(key, dir_path)
+        if not pending:
+            return
+        
+        if len(pending) == 1:
+            (key, dir_path), = pending.items()
+            os.makedirs(dir_path, exist_ok=True)
+            _CREATED_DIRS.add(key)
+            return
+        
+        # Create each distinct parent once, shallowest first
+        parents = {}
+        for key, dir_path in pending.items():
+            parent_key = os.path.dirname(key)
+            if parent_key not in _CREATED_DIRS:
+                parents.setdefault(parent_key, os.path.dirname(dir_path) or parent_key)
+        for parent_key in sorted(parents, key=len):
+            os.makedirs(parents[parent_key], exist_ok=True)
+            _CREATED_DIRS.add(parent_key)
+        
+        leaves = {key: dir_path for key, dir_path in pending.items() if key not in _CREATED_DIRS}
+        if not leaves:
+            return
+        with ThreadPoolExecutor(max_workers=len(leaves)) as executor:
+            futures = {key: executor.submit(_mkdir_leaf, dir_path) for key, dir_path in leaves.items()}
+        for key, future in futures.items():
+            future.result()  # Re-raise the first mkdir error
+            _CREATED_DIRS.add(key)
+
+def forget_dir(dir_path: str) -> None:
+    """Drop dir_path from the created-directory cache, e.g. after it was removed"""
+    with _DIRS_LOCK:
+        _CREATED_DIRS.discard(os.path.abspath(dir_path))
+
+def ensure_parent(path: str) -> None:
+    """Create the parent directory of path if this process has not already"""
+    parent = os.path.dirname(path)
+    if parent:
+        ensure_dirs((parent,))
@@ -0,0 +1,19 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the terms described in the LICENSE file in
+# the root directory of this source tree.
+# Deferred imports for optional parser dependencies
+import importlib
+from functools import lru_cache
+from types import ModuleType
+
+@lru_cache(maxsize=None)
+def lazy_import(name: str) -> ModuleType:
+    """Import a module on first use and return the cached module afterwards
+    
+    Parsers call this from parse() so optional libraries are only required
+    when that format is actually used. A failed import raises ImportError and
+    is not cached, so installing the library later in the process works.
+    """
+    return importlib.import_module(name)
@@ -4,9 +4,14 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 # Text processing utilities
+import os
 import re
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Iterator, TypeVar, Union
+
+from synthetic_data_kit.utils.fs import ensure_parent, forget_dir
+
+T = TypeVar('T')
 
 def split_into_chunks(text: str, chunk_size: int = 4000, overlap: int = 200) -> List[str]:
     """Split text into chunks with optional overlap"""
@@ -63,4 +68,66 @@ def extract_json_from_text(text: str) -> Dict[str, Any]:
         except json.JSONDecodeError:
             pass
     
-    raise ValueError("Could not extract valid JSON from the response")
\ No newline at end of file
+    raise ValueError("Could not extract valid JSON from the response")
+
+def iter_joined(parts: Iterable[str], separator: str) -> Iterator[str]:
+    """Yield parts with separator between them, lazily
+    
+    "".join(iter_joined(parts, sep)) == sep.join(parts), without holding
+    every part in memory at once.
+    """
+    first = True
+    for part in parts:
+        if not first:
+            yield separator
+        first = False
+        yield part
+
+def _open_output(output_path: str, opener: Callable[[], T]) -> T:
+    """Call opener, recreating the parent directory once if it has been removed
+    
+    ensure_parent skips directories it created earlier, so a directory deleted
+    since then (e.g. a cleaned-up data/parsed) only shows up here.
+    """
+    try:
+        return opener()
+    except FileNotFoundError:
+        parent = os.path.dirname(output_path)
+        if not parent:
+            raise
+        forget_dir(parent)
+        ensure_parent(output_path)
+        return opener()
+
+def write_text(content: Union[str, bytes, Iterable[str]], output_path: str) -> None:
+    """Write a string, pre-encoded UTF-8 bytes or an iterable of text chunks to output_path"""
+    ensure_parent(output_path)
+    if not isinstance(content, (str, bytes)):
+        # Chunks may come from a parser that fails part way, so stream into a
+        # temporary file and only replace output_path once every chunk is written
+        tmp_path = output_path + '.tmp'
+        try:
+            with _open_output(tmp_path, lambda: open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20)) as f:
+                f.writelines(content)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        return
+    
+    # Whole content needs no buffering, so write its bytes straight to the descriptor;
+    # bytes are written as-is with no decode/encode round trip. Strings get the
+    # same newline translation as the text-mode writes above
+    if isinstance(content, str) and os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content if isinstance(content, bytes) else content.encode('utf-8'))
+    # 0o666 leaves the final permissions to the umask, as open() does
+    fd = _open_output(output_path, lambda: os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666))
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
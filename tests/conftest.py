@@ -1,78 +1,114 @@
 """Common pytest fixtures"""
 
+import copy
+import importlib.util
 import json
 import os
+import shutil
+import sys
 import tempfile
+import types
+from collections import namedtuple
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import MagicMock, patch
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 
 import pytest
 from typer.testing import CliRunner
 
+from synthetic_data_kit.cli import app as _cli_app
+from synthetic_data_kit.core import ingest as _ingest, create as _create, curate as _curate, save_as as _save_as
+from synthetic_data_kit.models import llm_client as _llm_client
+from synthetic_data_kit.utils import config as _cfg_module, directory_processor as _dp
+
 # Import our test utilities
+from tests.integration.fixtures import QA_PAIRS_BASIC
 from tests.utils import TempDirectoryManager, CLITestHelper
 
 
+# Static test inputs checked into the repository
+_DATA_DIR = Path(__file__).parent / "data"
+
+
+def _freeze(value):
+    """Recursively make fixture data read-only so session-scoped fixtures cannot leak state."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@pytest.fixture(scope="session", autouse=True)
+def openai_module():
+    """Provide the openai module once per session, stubbed when it is not installed.
+    
+    Tests patch attributes on this module object with patch.object instead of
+    resolving "openai.OpenAI" by name, and never need the real client.
+    """
+    if "openai" in sys.modules or importlib.util.find_spec("openai") is not None:
+        yield importlib.import_module("openai")
+        return
+    
+    stub = types.ModuleType("openai")
+    stub.OpenAI = MagicMock(name="OpenAI")
+    stub.AsyncOpenAI = MagicMock(name="AsyncOpenAI")
+    sys.modules["openai"] = stub
+    yield stub
+    sys.modules.pop("openai", None)
+
+
 @pytest.fixture
 def sample_data_path():
     """Fixture providing path to the sample data directory."""
-    base_dir = Path(__file__).parent
-    return str(base_dir / "data")
+    return str(_DATA_DIR)
 
 
 @pytest.fixture
-def sample_text_file():
+def sample_text_file(tmp_path):
     """Create a temporary text file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".txt", delete=False) as f:
-        f.write("This is sample text content for testing Synthetic Data Kit.")
-        file_path = f.name
-
-    yield file_path
+    file_path = tmp_path / "sample.txt"
+    file_path.write_text("This is sample text content for testing Synthetic Data Kit.")
+    return str(file_path)
+
+
+_QA_PAIRS = [
+    {
+        "question": "What is synthetic data?",
+        "answer": "Synthetic data is artificially generated data that mimics real data.",
+    },
+    {
+        "question": "Why use synthetic data for fine-tuning?",
+        "answer": "Synthetic data can help overcome data scarcity and privacy concerns.",
+    },
+]
+_QA_PAIRS_BYTES = json.dumps(_QA_PAIRS).encode()
+
+_COT_EXAMPLES = [
+    {
+        "reasoning": "Let me think step by step...",
+        "answer": "Based on my analysis, the answer is...",
+    }
+]
 
-    # Cleanup
-    if os.path.exists(file_path):
-        os.unlink(file_path)
+# Per-item batch_completion responses for the default mock clients
+_DEFAULT_BATCH_QA_JSON = tuple(json.dumps([pair]) for pair in _QA_PAIRS)
+_DEFAULT_BATCH_COT_JSON = tuple(json.dumps([example]) for example in _COT_EXAMPLES)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_qa_pairs():
     """Return sample QA pairs for testing."""
-    return [
-        {
-            "question": "What is synthetic data?",
-            "answer": "Synthetic data is artificially generated data that mimics real data.",
-        },
-        {
-            "question": "Why use synthetic data for fine-tuning?",
-            "answer": "Synthetic data can help overcome data scarcity and privacy concerns.",
-        },
-    ]
+    return _freeze(_QA_PAIRS)
 
 
-@pytest.fixture
-def sample_qa_pairs_file():
-    """Create a temporary file with sample QA pairs for testing."""
-    qa_pairs = [
-        {
-            "question": "What is synthetic data?",
-            "answer": "Synthetic data is artificially generated data that mimics real data.",
-        },
-        {
-            "question": "Why use synthetic data for fine-tuning?",
-            "answer": "Synthetic data can help overcome data scarcity and privacy concerns.",
-        },
-    ]
-
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as f:
-        json.dump(qa_pairs, f)
-        file_path = f.name
-
-    yield file_path
-
-    # Cleanup
-    if os.path.exists(file_path):
-        os.unlink(file_path)
+@pytest.fixture(scope="session")
+def sample_qa_pairs_file(tmp_path_factory):
+    """Create a file with sample QA pairs once for the whole session."""
+    file_path = tmp_path_factory.mktemp("qa").joinpath("pairs.json")
+    file_path.write_bytes(_QA_PAIRS_BYTES)
+    return str(file_path)
 
 
 # Mock factories for reusable test components
@@ -81,43 +117,36 @@ def sample_qa_pairs_file():
 class MockLLMClientFactory:
     """Factory for creating mock LLM clients with different configurations."""
 
-    @staticmethod
-    def create_qa_client(qa_pairs=None):
-        """Create a mock client for QA generation."""
-        if qa_pairs is None:
-            qa_pairs = [
-                {
-                    "question": "What is synthetic data?",
-                    "answer": "Synthetic data is artificially generated data that mimics real data.",
-                },
-                {
-                    "question": "Why use synthetic data for fine-tuning?",
-                    "answer": "Synthetic data can help overcome data scarcity and privacy concerns.",
-                },
-            ]
+    _DEFAULT_RATINGS = [8, 7, 9]
 
+    # Serialized once; mocks are still built per call so call records never leak between tests
+    _DEFAULT_QA_JSON = _QA_PAIRS_BYTES.decode()
+    _DEFAULT_COT_JSON = json.dumps(_COT_EXAMPLES)
+    _DEFAULT_RATINGS_JSON = json.dumps(_DEFAULT_RATINGS)
+    _DEFAULT_RATINGS_BATCH = tuple(json.dumps([rating]) for rating in _DEFAULT_RATINGS)
+
+    @staticmethod
+    def _build_client(response, batch_responses):
         mock_client = MagicMock()
-        mock_client.chat_completion.return_value = json.dumps(qa_pairs)
-        mock_client.batch_completion.return_value = [json.dumps([pair]) for pair in qa_pairs]
+        mock_client.chat_completion.return_value = response
+        mock_client.batch_completion.return_value = list(batch_responses)
         return mock_client
 
-    @staticmethod
-    def create_cot_client(cot_examples=None):
+    @classmethod
+    def create_qa_client(cls, qa_pairs=None):
+        """Create a mock client for QA generation."""
+        if qa_pairs is None:
+            return cls._build_client(cls._DEFAULT_QA_JSON, _DEFAULT_BATCH_QA_JSON)
+        return cls._build_client(json.dumps(qa_pairs), [json.dumps([pair]) for pair in qa_pairs])
+
+    @classmethod
+    def create_cot_client(cls, cot_examples=None):
         """Create a mock client for Chain of Thought generation."""
         if cot_examples is None:
-            cot_examples = [
-                {
-                    "reasoning": "Let me think step by step...",
-                    "answer": "Based on my analysis, the answer is...",
-                }
-            ]
-
-        mock_client = MagicMock()
-        mock_client.chat_completion.return_value = json.dumps(cot_examples)
-        mock_client.batch_completion.return_value = [
-            json.dumps([example]) for example in cot_examples
-        ]
-        return mock_client
+            return cls._build_client(cls._DEFAULT_COT_JSON, _DEFAULT_BATCH_COT_JSON)
+        return cls._build_client(
+            json.dumps(cot_examples), [json.dumps([example]) for example in cot_examples]
+        )
 
     @staticmethod
     def create_summary_client(summary_text="This is a test summary."):
@@ -126,36 +155,73 @@ class MockLLMClientFactory:
         mock_client.chat_completion.return_value = summary_text
         return mock_client
 
-    @staticmethod
-    def create_rating_client(ratings=None):
+    @classmethod
+    def create_rating_client(cls, ratings=None):
         """Create a mock client for content rating."""
         if ratings is None:
-            ratings = [8, 7, 9]  # Default ratings
-
-        mock_client = MagicMock()
-        mock_client.chat_completion.return_value = json.dumps(ratings)
-        mock_client.batch_completion.return_value = [json.dumps([rating]) for rating in ratings]
-        return mock_client
+            return cls._build_client(cls._DEFAULT_RATINGS_JSON, cls._DEFAULT_RATINGS_BATCH)
+        return cls._build_client(json.dumps(ratings), [json.dumps([rating]) for rating in ratings])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm_client_factory():
     """Factory fixture for creating various mock LLM clients."""
     return MockLLMClientFactory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_client(llm_client_factory):
     """Default mock LLM client for backward compatibility."""
     return llm_client_factory.create_qa_client()
 
 
+# Canonical generated document for workflow tests; json.dump'd by create.process_file,
+# so it stays a plain dict and must not be mutated
+_WORKFLOW_QA_PAYLOAD = {
+    "summary": "A sample document about synthetic data generation.",
+    "qa_pairs": [
+        {
+            "question": "What is the document about?",
+            "answer": "Synthetic data generation techniques.",
+        },
+        {
+            "question": "Why is synthetic data useful?",
+            "answer": "It helps in training machine learning models without real data.",
+        },
+    ],
+}
+
+PrebuiltQAMocks = namedtuple("PrebuiltQAMocks", "parser llm_client qa_generator qa_payload")
+
+
+@pytest.fixture(scope="session")
+def prebuilt_qa_mocks():
+    """Parser, LLM client and QA generator mocks wired to a shared QA payload."""
+    from synthetic_data_kit.parsers.txt_parser import TXTParser
+
+    llm_client = MagicMock()
+    llm_client.config = {
+        "prompts": {
+            "qa_generation": "Generate question-answer pairs based on this text: {text}",
+        }
+    }
+    qa_generator = MagicMock()
+    qa_generator.process_document.return_value = _WORKFLOW_QA_PAYLOAD
+    return PrebuiltQAMocks(TXTParser(), llm_client, qa_generator, _WORKFLOW_QA_PAYLOAD)
+
+
 class MockConfigFactory:
-    """Factory for creating various mock configurations."""
+    """Factory for creating various mock configurations.
+    
+    Configs are read-only MappingProxyType views; the default ones are built
+    once and shared. Pass mutable=True for a fresh plain dict to modify.
+    """
+
+    _API_DEFAULTS = ("api-endpoint", "mock-key", "mock-model")
+    _VLLM_DEFAULTS = ("mock-vllm-model",)
 
     @staticmethod
-    def create_api_config(provider="api-endpoint", api_key="mock-key", model="mock-model"):
-        """Create a mock API endpoint configuration."""
+    def _build_api_config(provider, api_key, model):
         return {
             "llm": {"provider": provider},
             "api-endpoint": {
@@ -178,8 +244,7 @@ class MockConfigFactory:
         }
 
     @staticmethod
-    def create_vllm_config(model="mock-vllm-model"):
-        """Create a mock vLLM configuration."""
+    def _build_vllm_config(model):
         return {
             "llm": {"provider": "vllm"},
             "vllm": {
@@ -200,48 +265,84 @@ class MockConfigFactory:
             },
         }
 
+    @classmethod
+    def create_api_config(cls, provider="api-endpoint", api_key="mock-key", model="mock-model", mutable=False):
+        """Create a mock API endpoint configuration."""
+        if not mutable and (provider, api_key, model) == cls._API_DEFAULTS:
+            return _API_CFG
+        config = cls._build_api_config(provider, api_key, model)
+        return config if mutable else _freeze(config)
 
-@pytest.fixture
+    @classmethod
+    def create_vllm_config(cls, model="mock-vllm-model", mutable=False):
+        """Create a mock vLLM configuration."""
+        if not mutable and (model,) == cls._VLLM_DEFAULTS:
+            return _VLLM_CFG
+        config = cls._build_vllm_config(model)
+        return config if mutable else _freeze(config)
+
+
+# Shared read-only default configs
+_API_CFG = _freeze(MockConfigFactory._build_api_config(*MockConfigFactory._API_DEFAULTS))
+_VLLM_CFG = _freeze(MockConfigFactory._build_vllm_config(*MockConfigFactory._VLLM_DEFAULTS))
+
+# Built once; patch fixtures hand each test its own deep copy
+_API_CFG_TEMPLATE = MockConfigFactory.create_api_config(mutable=True)
+_VLLM_CFG_TEMPLATE = MockConfigFactory.create_vllm_config(mutable=True)
+
+
+@pytest.fixture(scope="session")
 def config_factory():
     """Factory fixture for creating various mock configurations."""
     return MockConfigFactory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config(config_factory):
     """Default mock configuration for backward compatibility."""
     return config_factory.create_api_config()
 
 
 @pytest.fixture
-def test_env():
+def test_env(monkeypatch):
     """Set test environment variables."""
-    original_env = os.environ.copy()
-    os.environ["PROJECT_TEST_ENV"] = "1"
+    monkeypatch.setenv("PROJECT_TEST_ENV", "1")
     # Only use API_ENDPOINT_KEY for consistency with the code
-    os.environ["API_ENDPOINT_KEY"] = "mock-api-key-for-testing"
-    os.environ["SDK_VERBOSE"] = "false"
+    monkeypatch.setenv("API_ENDPOINT_KEY", "mock-api-key-for-testing")
+    monkeypatch.setenv("SDK_VERBOSE", "false")
 
     yield
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+
+@pytest.fixture(scope="session")
+def _config_loader():
+    """Patch the config loader once per session; it falls through to the real loader when idle."""
+    with patch.object(_cfg_module, "load_config", wraps=_cfg_module.load_config) as mock_load_config:
+        yield mock_load_config
+
+
+@contextmanager
+def _loaded_config(mock_load_config, template):
+    """Point the session config loader at a fresh copy of ``template`` for one test."""
+    mock_load_config.reset_mock(return_value=True)
+    mock_load_config.return_value = copy.deepcopy(template)
+    try:
+        yield mock_load_config
+    finally:
+        mock_load_config.reset_mock(return_value=True)
 
 
 @pytest.fixture
-def patch_config(config_factory):
+def patch_config(_config_loader):
     """Patch the config loader to return a mock configuration."""
-    with patch("synthetic_data_kit.utils.config.load_config") as mock_load_config:
-        mock_load_config.return_value = config_factory.create_api_config()
+    with _loaded_config(_config_loader, _API_CFG_TEMPLATE) as mock_load_config:
         yield mock_load_config
 
 
 @pytest.fixture
-def patch_vllm_config(config_factory):
+def patch_vllm_config(_config_loader):
     """Patch the config loader to return a vLLM configuration."""
-    with patch("synthetic_data_kit.utils.config.load_config") as mock_load_config:
-        mock_load_config.return_value = config_factory.create_vllm_config()
+    with _loaded_config(_config_loader, _VLLM_CFG_TEMPLATE) as mock_load_config:
         yield mock_load_config
 
 
@@ -255,19 +356,27 @@ def temp_output_dir():
         yield temp_dir
 
 
+_FILE_OPERATION_PATCHES = (
+    ("builtins.open", {}),
+    ("os.makedirs", {}),
+    ("os.path.exists", {"return_value": True}),
+    ("pathlib.Path.exists", {"return_value": True}),
+)
+
+
 @pytest.fixture
 def mock_file_operations():
     """Mock common file operations for testing."""
-    with patch("builtins.open"), patch("os.makedirs"), patch(
-        "os.path.exists", return_value=True
-    ), patch("pathlib.Path.exists", return_value=True):
+    with ExitStack() as stack:
+        for target, kwargs in _FILE_OPERATION_PATCHES:
+            stack.enter_context(patch(target, **kwargs))
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_cot_data():
     """Sample Chain of Thought data for testing."""
-    return [
+    return _freeze([
         {
             "query": "What is 2 + 2?",
             "reasoning": "Let me solve this step by step. First, I need to add 2 and 2. This is a basic arithmetic operation.",
@@ -278,13 +387,13 @@ def sample_cot_data():
             "reasoning": "To explain photosynthesis, I need to break it down into its key components and process.",
             "answer": "Photosynthesis is the process by which plants convert sunlight into energy.",
         },
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_conversations():
     """Sample conversation data for testing."""
-    return [
+    return _freeze([
         {
             "messages": [
                 {"role": "user", "content": "How do I bake a cake?"},
@@ -300,9 +409,9 @@ def sample_conversations():
                 {"role": "assistant", "content": "I don't have access to current weather data."},
             ]
         },
-    ]
+    ])
 #New fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
     """Fixture providing CLI runner for testing CLI commands.
     
@@ -311,14 +420,25 @@ def cli_runner():
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def app():
+    """Fixture providing the Typer CLI app, imported once per session."""
+    return _cli_app
+
+
+@pytest.fixture(scope="session")
+def runner(cli_runner):
+    """Short alias for the session-scoped CLI runner."""
+    return cli_runner
+
+
+@pytest.fixture(scope="session")
 def cli_helper():
     """Fixture providing CLI test helper with common utilities.
     
     This replaces manual CLI testing setup in functional tests.
     """
-    from synthetic_data_kit.cli import app
-    return CLITestHelper(app)
+    return CLITestHelper(_cli_app)
 
 
 @pytest.fixture
@@ -331,119 +451,173 @@ def temp_env():
         yield temp_mgr
 
 
-@pytest.fixture
-def standard_test_files():
+@pytest.fixture(scope="session")
+def standard_test_files(tmp_path_factory):
     """Fixture providing standard test files in a temporary directory.
     
-    This replaces repeated file creation patterns across tests.
+    This replaces repeated file creation patterns across tests. The files are
+    shared by the whole session; use standard_test_files_copy to modify them.
     """
-    with TempDirectoryManager() as temp_mgr:
+    base_dir = tmp_path_factory.mktemp("std_files", numbered=False)
+    with TempDirectoryManager(base_dir) as temp_mgr:
         # Create standard test files that many tests need
         files = temp_mgr.create_files({
             "test.txt": "This is test content for processing.",
             "sample.txt": "Sample document content for testing.",
             "document.txt": "Document with multiple sentences. It has detailed content for analysis."
         })
-        yield temp_mgr, files
+        yield temp_mgr, tuple(files)
 
 
 @pytest.fixture
+def standard_test_files_copy(standard_test_files, tmp_path):
+    """Fixture providing a per-test, writable copy of standard_test_files."""
+    session_mgr, session_files = standard_test_files
+    copy_dir = tmp_path / "std_files"
+    shutil.copytree(session_mgr.path, copy_dir)
+    with TempDirectoryManager(copy_dir) as temp_mgr:
+        files = [str(copy_dir / os.path.basename(path)) for path in session_files]
+        temp_mgr.created_files.extend(files)
+        yield temp_mgr, files
+
+
+_STANDARD_QA_FILES = ("qa1.json", "qa2.json")
+
+
+@pytest.fixture(scope="session")
 def standard_qa_files():
-    """Fixture providing standard QA JSON files in a temporary directory.
+    """Fixture providing the standard QA JSON files shipped in tests/data.
     
-    This replaces repeated QA file creation in integration tests.
+    Returns (data_dir, {filename: path}); the files are shared and must not be
+    modified; use standard_qa_files_copy for a writable copy.
     """
-    with TempDirectoryManager() as temp_mgr:
-        qa_data = {
-            "qa1.json": {
-                "qa_pairs": [
-                    {"question": "What is AI?", "answer": "Artificial Intelligence"},
-                    {"question": "What is ML?", "answer": "Machine Learning"}
-                ]
-            },
-            "qa2.json": {
-                "qa_pairs": [
-                    {"question": "What is data science?", "answer": "Analyzing data for insights"},
-                    {"question": "What is Python?", "answer": "A programming language"}
-                ]
-            }
-        }
-        files = temp_mgr.create_json_files(qa_data)
-        yield temp_mgr, files
+    return _DATA_DIR, {name: _DATA_DIR / name for name in _STANDARD_QA_FILES}
 
 
-class MockPatchManager:
-    """Context manager for common patch patterns used across tests.
+@pytest.fixture
+def standard_qa_files_copy(tmp_path):
+    """Fixture providing a per-test, writable copy of the standard QA files."""
+    files = {}
+    for name in _STANDARD_QA_FILES:
+        files[name] = tmp_path / name
+        shutil.copyfile(_DATA_DIR / name, files[name])
+    return tmp_path, files
+
+
+# Read-only input directories shared by the whole session, one per scenario, so
+# directory tests that only read their inputs never create files themselves
+_FIXTURE_DIR_FILES = {
+    "mixed": {"test.txt": b"Test content", "test.xyz": b"Unsupported content"},
+    "stats": {"test.txt": b"Test content", "test.pdf": b"PDF content", "test.xyz": b"Unsupported"},
+    "nested": {"main.txt": b"Main content", "subdir/sub.txt": b"Sub content"},
+    "qa": {
+        "file1_cleaned.json": json.dumps({"qa_pairs": [QA_PAIRS_BASIC[0]]}).encode(),
+        "file2_cleaned.json": json.dumps({"qa_pairs": [QA_PAIRS_BASIC[1]]}).encode(),
+    },
+    "partial": {
+        "good.json": json.dumps({"qa_pairs": [{"question": "Q?", "answer": "A."}]}).encode(),
+        "bad.json": b"invalid json content",
+    },
+}
+
+
+@pytest.fixture(scope="session")
+def qa_fixture_dir(tmp_path_factory):
+    """Fixture providing one directory per input scenario, built once per session.
     
-    This reduces repetitive patching patterns found in multiple test files.
+    Subdirectories: mixed, stats, nested, qa, partial (see _FIXTURE_DIR_FILES).
+    The files are shared and must not be modified; copy any file a test needs
+    to change into its own tmp_path. Under pytest-xdist each worker builds its
+    own copy under its own basetemp.
     """
+    base_dir = tmp_path_factory.mktemp("qa_fixtures", numbered=False)
+    for scenario, files in _FIXTURE_DIR_FILES.items():
+        for name, content in files.items():
+            path = base_dir / scenario / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(content)
+    return base_dir
+
+
+# Common patch patterns used across tests; module-level so they are defined once
+
+
+@contextmanager
+def patch_process_file(return_value=None):
+    """Standard process_file patching for ingest tests."""
+    with patch.object(_ingest, "process_file") as mock_process:
+        mock_process.return_value = return_value or "/tmp/mock_output.txt"
+        yield mock_process
+
+
+@contextmanager
+def patch_create_process_file(return_value=None):
+    """Standard process_file patching for create tests."""
+    with patch.object(_create, "process_file") as mock_process:
+        mock_process.return_value = return_value or "/tmp/mock_qa.json"
+        yield mock_process
+
+
+@contextmanager
+def patch_curate_qa_pairs(return_value=None):
+    """Standard curate_qa_pairs patching for curate tests."""
+    with patch.object(_curate, "curate_qa_pairs") as mock_curate:
+        mock_curate.return_value = return_value or "/tmp/mock_curated.json"
+        yield mock_curate
+
+
+@contextmanager
+def patch_convert_format(return_value=None):
+    """Standard convert_format patching for save-as tests."""
+    with patch.object(_save_as, "convert_format") as mock_convert:
+        mock_convert.return_value = return_value or "/tmp/mock_converted.jsonl"
+        yield mock_convert
+
+
+_DP_TARGETS = (
+    "process_directory_ingest",
+    "process_directory_create",
+    "process_directory_curate",
+    "process_directory_save_as",
+)
+
+
+@contextmanager
+def patch_directory_processor(success_count=1, failed_count=0):
+    """Standard directory processor patching with configurable results."""
+    result = {"total_files": success_count + failed_count, "successful": success_count, "failed": failed_count}
     
-    @contextmanager
-    def patch_process_file(self, return_value=None):
-        """Standard process_file patching for ingest tests."""
-        with patch("synthetic_data_kit.core.ingest.process_file") as mock_process:
-            mock_process.return_value = return_value or "/tmp/mock_output.txt"
-            yield mock_process
-    
-    @contextmanager
-    def patch_create_process_file(self, return_value=None):
-        """Standard process_file patching for create tests."""
-        with patch("synthetic_data_kit.core.create.process_file") as mock_process:
-            mock_process.return_value = return_value or "/tmp/mock_qa.json"
-            yield mock_process
-    
-    @contextmanager
-    def patch_curate_qa_pairs(self, return_value=None):
-        """Standard curate_qa_pairs patching for curate tests."""
-        with patch("synthetic_data_kit.core.curate.curate_qa_pairs") as mock_curate:
-            mock_curate.return_value = return_value or "/tmp/mock_curated.json"
-            yield mock_curate
-    
-    @contextmanager
-    def patch_convert_format(self, return_value=None):
-        """Standard convert_format patching for save-as tests."""
-        with patch("synthetic_data_kit.core.save_as.convert_format") as mock_convert:
-            mock_convert.return_value = return_value or "/tmp/mock_converted.jsonl"
-            yield mock_convert
-    
-    @contextmanager
-    def patch_directory_processor(self, success_count=1, failed_count=0):
-        """Standard directory processor patching with configurable results."""
-        result = {"total_files": success_count + failed_count, "successful": success_count, "failed": failed_count}
-        
-        patches = [
-            patch("synthetic_data_kit.utils.directory_processor.process_directory_ingest", return_value=result),
-            patch("synthetic_data_kit.utils.directory_processor.process_directory_create", return_value=result),
-            patch("synthetic_data_kit.utils.directory_processor.process_directory_curate", return_value=result),
-            patch("synthetic_data_kit.utils.directory_processor.process_directory_save_as", return_value=result),
-        ]
-        
-        with patch.multiple(
-            "synthetic_data_kit.utils.directory_processor",
-            process_directory_ingest=patches[0],
-            process_directory_create=patches[1], 
-            process_directory_curate=patches[2],
-            process_directory_save_as=patches[3]
-        ):
-            yield
-    
-    @contextmanager
-    def patch_llm_client(self, response="Mock LLM response"):
-        """Standard LLM client patching for create/curate tests."""
-        with patch("synthetic_data_kit.models.llm_client.LLMClient") as mock_client_class:
-            mock_client = MagicMock()
-            mock_client.chat_completion.return_value = response
-            mock_client_class.return_value = mock_client
-            yield mock_client
+    with patch.multiple(_dp, **{name: MagicMock(return_value=result) for name in _DP_TARGETS}):
+        yield
 
 
-@pytest.fixture
+@contextmanager
+def patch_llm_client(response="Mock LLM response"):
+    """Standard LLM client patching for create/curate tests."""
+    with patch.object(_llm_client, "LLMClient") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client.chat_completion.return_value = response
+        mock_client_class.return_value = mock_client
+        yield mock_client
+
+
+_MOCK_PATCHES = SimpleNamespace(
+    patch_process_file=patch_process_file,
+    patch_create_process_file=patch_create_process_file,
+    patch_curate_qa_pairs=patch_curate_qa_pairs,
+    patch_convert_format=patch_convert_format,
+    patch_directory_processor=patch_directory_processor,
+    patch_llm_client=patch_llm_client,
+)
+
+
+@pytest.fixture(scope="session")
 def mock_patches():
-    """Fixture providing mock patch manager for common patching patterns.
+    """Fixture providing the common patching patterns as one namespace.
     
     This reduces repetitive mock setup across test files.
     """
-    return MockPatchManager()
+    return _MOCK_PATCHES
 
 
 class StandardTestData:
@@ -453,7 +627,8 @@ class StandardTestData:
     FILE_CONTENTS = {
         'short': "Brief test content.",
         'medium': "Medium length test content with more details and information.",
-        'long': "Very long test content with extensive details. " * 20,
+        # Built once at import and interned so every reference shares one object
+        'long': sys.intern("Very long test content with extensive details. " * 20),
         'html': "<html><body><h1>Test HTML</h1><p>HTML content for testing.</p></body></html>",
         'json_qa': '{"qa_pairs": [{"question": "Test?", "answer": "Yes."}]}'
     }
@@ -480,7 +655,7 @@ class StandardTestData:
     }
 
 
-@pytest.fixture 
+@pytest.fixture(scope="session")
 def test_data():
     """Fixture providing centralized test data constants.
     
@@ -489,13 +664,14 @@ def test_data():
     return StandardTestData
 
 
-@pytest.fixture
-def mixed_file_directory():
+@pytest.fixture(scope="session")
+def mixed_file_directory(tmp_path_factory):
     """Fixture providing a directory with mixed supported/unsupported files.
     
     This replaces the repeated mixed file setup in edge case tests.
     """
-    with TempDirectoryManager() as temp_mgr:
+    base_dir = tmp_path_factory.mktemp("mixed_files", numbered=False)
+    with TempDirectoryManager(base_dir) as temp_mgr:
         # Create supported files
         supported_files = temp_mgr.create_files({
             "doc1.txt": "Supported text file content",
@@ -508,4 +684,4 @@ def mixed_file_directory():
             "data.unknown": "Another unsupported file"
         })
         
-        yield temp_mgr, supported_files, unsupported_files
+        yield temp_mgr, tuple(supported_files), tuple(unsupported_files)
@@ -1,208 +1,85 @@
 """Functional tests for preview mode across all CLI commands."""
 
-import os
-import tempfile
 import json
-from unittest.mock import patch
 
 import pytest
 
 
-@pytest.mark.functional
-def test_ingest_preview_mode(patch_config):
-    """Test ingest command with --preview flag."""
-    temp_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create test files
-        txt_file = os.path.join(temp_dir, "test.txt")
-        with open(txt_file, "w") as f:
-            f.write("Test content")
-            
-        pdf_file = os.path.join(temp_dir, "test.pdf")
-        with open(pdf_file, "w") as f:
-            f.write("PDF content")
-            
-        # Mock CLI execution
-        with patch('sys.argv', ['synthetic-data-kit', 'ingest', temp_dir, '--preview']):
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['ingest', temp_dir, '--preview'])
-            
-            # Should show preview without processing
-            assert result.exit_code == 0
-            assert "Preview:" in result.stdout
-            assert "Total files:" in result.stdout
-            assert "Supported files:" in result.stdout
-            assert "test.txt" in result.stdout
-            assert "test.pdf" in result.stdout
-            assert "To process these files, run:" in result.stdout
-            
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
-
+_QA_FILES = (
+    ("test1.json", json.dumps({"qa_pairs": [{"question": "Q1?", "answer": "A1."}]})),
+    ("test2.json", json.dumps({"qa_pairs": [{"question": "Q2?", "answer": "A2."}]})),
+)
 
-@pytest.mark.functional
-def test_create_preview_mode(patch_config):
-    """Test create command with --preview flag."""
-    temp_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create test .txt files for create command
-        txt_file1 = os.path.join(temp_dir, "test1.txt")
-        with open(txt_file1, "w") as f:
-            f.write("Test content 1")
-            
-        txt_file2 = os.path.join(temp_dir, "test2.txt")
-        with open(txt_file2, "w") as f:
-            f.write("Test content 2")
-            
-        # Mock CLI execution
-        from synthetic_data_kit.cli import app
-        from typer.testing import CliRunner
-        
-        runner = CliRunner()
-        result = runner.invoke(app, ['create', temp_dir, '--type', 'qa', '--preview'])
-        
-        # Should show preview without processing
-        assert result.exit_code == 0
-        assert "Preview:" in result.stdout
-        assert "qa processing" in result.stdout
-        assert "Total files:" in result.stdout
-        assert "Supported files: 2" in result.stdout
-        assert "test1.txt" in result.stdout
-        assert "test2.txt" in result.stdout
-        
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
+# (command line after the directory, files to create, expected output fragments)
+PREVIEW_CASES = {
+    "ingest": (
+        ["ingest", "--preview"],
+        (("test.txt", "Test content"), ("test.pdf", "PDF content")),
+        ("Supported files:", "test.txt", "test.pdf", "To process these files, run:"),
+    ),
+    "create": (
+        ["create", "--type", "qa", "--preview"],
+        (("test1.txt", "Test content 1"), ("test2.txt", "Test content 2")),
+        ("qa processing", "Supported files: 2", "test1.txt", "test2.txt"),
+    ),
+    "curate": (
+        ["curate", "--threshold", "7.0", "--preview"],
+        _QA_FILES,
+        ("curation", "Supported files: 2", "test1.json", "test2.json"),
+    ),
+    "save-as": (
+        ["save-as", "--format", "alpaca", "--preview"],
+        _QA_FILES,
+        ("for format conversion", "Supported files: 2", "alpaca format", "test1.json", "test2.json"),
+    ),
+}
 
 
 @pytest.mark.functional
-def test_curate_preview_mode(patch_config):
-    """Test curate command with --preview flag."""
-    temp_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create test .json files for curate command
-        json_file1 = os.path.join(temp_dir, "test1.json")
-        with open(json_file1, "w") as f:
-            json.dump({"qa_pairs": [{"question": "Q1?", "answer": "A1."}]}, f)
-            
-        json_file2 = os.path.join(temp_dir, "test2.json") 
-        with open(json_file2, "w") as f:
-            json.dump({"qa_pairs": [{"question": "Q2?", "answer": "A2."}]}, f)
-            
-        # Mock CLI execution
-        from synthetic_data_kit.cli import app
-        from typer.testing import CliRunner
-        
-        runner = CliRunner()
-        result = runner.invoke(app, ['curate', temp_dir, '--threshold', '7.0', '--preview'])
-        
-        # Should show preview without processing
-        assert result.exit_code == 0
-        assert "Preview:" in result.stdout
-        assert "curation" in result.stdout
-        assert "Total files:" in result.stdout
-        assert "Supported files: 2" in result.stdout
-        assert "test1.json" in result.stdout
-        assert "test2.json" in result.stdout
-        
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
+@pytest.mark.parametrize("args, files, expected", PREVIEW_CASES.values(), ids=PREVIEW_CASES.keys())
+def test_preview_mode(patch_config, runner, app, tmp_path, args, files, expected):
+    """Test each command's --preview flag lists the directory without processing it."""
+    for name, content in files:
+        (tmp_path / name).write_text(content)
 
+    command, *options = args
+    result = runner.invoke(app, [command, str(tmp_path), *options])
 
-@pytest.mark.functional
-def test_save_as_preview_mode(patch_config):
-    """Test save-as command with --preview flag."""
-    temp_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create test .json files for save-as command
-        json_file1 = os.path.join(temp_dir, "test1.json")
-        with open(json_file1, "w") as f:
-            json.dump({"qa_pairs": [{"question": "Q1?", "answer": "A1."}]}, f)
-            
-        json_file2 = os.path.join(temp_dir, "test2.json")
-        with open(json_file2, "w") as f:
-            json.dump({"qa_pairs": [{"question": "Q2?", "answer": "A2."}]}, f)
-            
-        # Mock CLI execution
-        from synthetic_data_kit.cli import app
-        from typer.testing import CliRunner
-        
-        runner = CliRunner()
-        result = runner.invoke(app, ['save-as', temp_dir, '--format', 'alpaca', '--preview'])
-        
-        # Should show preview without processing
-        assert result.exit_code == 0
-        assert "Preview:" in result.stdout
-        assert "for format" in result.stdout and "conversion" in result.stdout  # Handle line breaks
-        assert "Total files:" in result.stdout
-        assert "Supported files: 2" in result.stdout
-        assert "alpaca format" in result.stdout
-        assert "test1.json" in result.stdout
-        assert "test2.json" in result.stdout
-        
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
+    # Rich wraps long lines at the console width, which depends on the length
+    # of tmp_path (longer under pytest-xdist), so compare whitespace-normalized
+    output = " ".join(result.stdout.split())
+
+    # Should show preview without processing
+    assert result.exit_code == 0
+    assert "Preview:" in output
+    assert "Total files:" in output
+    for fragment in expected:
+        assert fragment in output
 
 
 @pytest.mark.functional
-def test_preview_mode_empty_directory(patch_config):
+def test_preview_mode_empty_directory(patch_config, runner, app, tmp_path):
     """Test preview mode with empty directory."""
-    temp_dir = tempfile.mkdtemp()
+    # Test with empty directory
+    result = runner.invoke(app, ['ingest', str(tmp_path), '--preview'])
     
-    try:
-        # Test with empty directory
-        from synthetic_data_kit.cli import app
-        from typer.testing import CliRunner
-        
-        runner = CliRunner()
-        result = runner.invoke(app, ['ingest', temp_dir, '--preview'])
-        
-        # Should handle empty directory gracefully
-        assert result.exit_code == 0
-        assert "Preview:" in result.stdout
-        assert "Total files: 0" in result.stdout
-        assert "No supported files found" in result.stdout
-        
-    finally:
-        os.rmdir(temp_dir)
+    # Should handle empty directory gracefully
+    output = result.stdout
+    assert result.exit_code == 0
+    assert "Preview:" in output
+    assert "Total files: 0" in output
+    assert "No supported files found" in output
 
 
 @pytest.mark.functional
-def test_preview_mode_single_file_warning(patch_config):
+def test_preview_mode_single_file_warning(patch_config, runner, app, tmp_path):
     """Test that preview mode shows warning for single files."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("Test content")
-        temp_file = f.name
-        
-    try:
-        # Test preview mode with single file
-        from synthetic_data_kit.cli import app
-        from typer.testing import CliRunner
-        
-        runner = CliRunner()
-        result = runner.invoke(app, ['ingest', temp_file, '--preview'])
-        
-        # Should show warning that preview is only for directories
-        assert result.exit_code == 0
-        assert "Preview mode is only available for directories" in result.stdout
-        
-    finally:
-        os.unlink(temp_file)
\ No newline at end of file
+    temp_file = tmp_path / "test.txt"
+    temp_file.write_text("Test content")
+    
+    # Test preview mode with single file
+    result = runner.invoke(app, ['ingest', str(temp_file), '--preview'])
+    
+    # Should show warning that preview is only for directories
+    assert result.exit_code == 0
+    assert "Preview mode is only available for directories" in result.stdout
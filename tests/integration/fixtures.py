@@ -0,0 +1,67 @@
+"""Shared QA payloads for the integration tests.
+
+The payloads are module-level constants so every test dumps and asserts
+against the same data; treat them as read-only. ``serialize`` returns the
+JSON bytes for a named payload, encoding each one only once.
+"""
+
+import json
+
+QA_PAIRS_BASIC = [
+    {
+        "question": "What is synthetic data?",
+        "answer": "Synthetic data is artificially generated data.",
+    },
+    {
+        "question": "Why use synthetic data?",
+        "answer": "To protect privacy and create diverse training examples.",
+    },
+]
+
+QA_PAIRS_FILTERED = [
+    dict(pair, rating=rating) for pair, rating in zip(QA_PAIRS_BASIC, (8.5, 9.0))
+]
+
+CONVERSATIONS = [
+    [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": pair["question"]},
+        {"role": "assistant", "content": pair["answer"]},
+    ]
+    for pair in QA_PAIRS_BASIC
+]
+
+# Curate-stage output for the workflow payload: one of two pairs kept
+_KEPT_PAIR = {
+    "question": "What is the document about?",
+    "answer": "Synthetic data generation techniques.",
+}
+
+CURATED_PAYLOAD = {
+    "summary": "A sample document about synthetic data generation.",
+    "filtered_pairs": [{**_KEPT_PAIR, "rating": 9.0}],
+    "conversations": [
+        [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": _KEPT_PAIR["question"]},
+            {"role": "assistant", "content": _KEPT_PAIR["answer"]},
+        ]
+    ],
+    "metrics": {"total": 2, "filtered": 1, "retention_rate": 0.5},
+}
+
+PAYLOADS = {
+    "qa_pairs": {"qa_pairs": QA_PAIRS_BASIC},
+    "filtered_pairs": {"filtered_pairs": QA_PAIRS_FILTERED},
+    "conversations": {"conversations": CONVERSATIONS},
+    "curated": CURATED_PAYLOAD,
+}
+
+_SERIALIZED = {}
+
+
+def serialize(name):
+    """Return the JSON encoding of the named payload as bytes."""
+    if name not in _SERIALIZED:
+        _SERIALIZED[name] = json.dumps(PAYLOADS[name]).encode()
+    return _SERIALIZED[name]
@@ -1,250 +1,147 @@
 """Integration tests for backward compatibility with single-file processing."""
 
-import os
-import tempfile
 import json
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
-
-@pytest.mark.integration
-def test_single_file_ingest_still_works(patch_config):
-    """Test that single file ingest processing works unchanged."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("This is test content for single file processing.")
-        input_file = f.name
-        
-    output_dir = tempfile.mkdtemp()
-    
-    try:
-        # Mock the core process_file function
-        with patch("synthetic_data_kit.core.ingest.process_file") as mock_process:
-            expected_output = os.path.join(output_dir, "test_output.txt")
-            mock_process.return_value = expected_output
-            
-            # Test single file processing through CLI
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['ingest', input_file, '--output-dir', output_dir])
-            
-            # Should process single file successfully
-            assert result.exit_code == 0
-            assert "successfully extracted" in result.stdout
-            
-            # Should call process_file once
-            mock_process.assert_called_once()
-            call_args = mock_process.call_args[0]
-            assert call_args[0] == input_file  # input file path
-            assert str(call_args[1]) == output_dir  # output directory (Path object converted to string)
-            
-    finally:
-        os.unlink(input_file)
-        os.rmdir(output_dir)
+from synthetic_data_kit import cli
+from synthetic_data_kit.core import (
+    create as core_create,
+    curate as core_curate,
+    ingest as core_ingest,
+    save_as as core_save_as,
+)
+from synthetic_data_kit.utils import directory_processor
+
+
+QA_PAIRS = {
+    "qa_pairs": [
+        {"question": "What is AI?", "answer": "Artificial Intelligence"},
+        {"question": "What is ML?", "answer": "Machine Learning"}
+    ]
+}
+# Encoded once; the single-file tests write it verbatim
+_QA_JSON = json.dumps(QA_PAIRS)
+
+
+# command -> (CLI command, core module, patched function, input file, input content,
+#             output option, output name, extra options, expected output fragment)
+SINGLE_FILE_CASES = {
+    "ingest": (
+        cli.ingest, core_ingest, "process_file", "input.txt",
+        "This is test content for single file processing.",
+        "output_dir", "output", {}, "successfully extracted",
+    ),
+    "create": (
+        cli.create, core_create, "process_file", "input.txt",
+        "This is test content for QA generation.",
+        "output_dir", "output", {"content_type": "qa"}, "Content saved to",
+    ),
+    "curate": (
+        cli.curate, core_curate, "curate_qa_pairs", "input.json", _QA_JSON,
+        "output", "curated.json", {"threshold": 7.0}, "Cleaned content saved to",
+    ),
+    "save-as": (
+        cli.save_as, core_save_as, "convert_format", "input.json", _QA_JSON,
+        "output", "converted.jsonl", {"format": "jsonl"}, "Converted to jsonl format",
+    ),
+}
 
 
 @pytest.mark.integration
-def test_single_file_create_still_works(patch_config):
-    """Test that single file create processing works unchanged."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("This is test content for QA generation.")
-        input_file = f.name
-        
-    output_dir = tempfile.mkdtemp()
+@pytest.mark.parametrize(
+    "command, module, target, input_name, content, output_option, output_name, options, expected",
+    SINGLE_FILE_CASES.values(),
+    ids=SINGLE_FILE_CASES.keys(),
+)
+def test_single_file_still_works(
+    patch_config, cli_helper, capsys, tmp_path, monkeypatch,
+    command, module, target, input_name, content, output_option, output_name, options, expected,
+):
+    """Test that single file processing works unchanged for every command."""
+    input_file = tmp_path / input_name
+    input_file.write_text(content)
+    output = tmp_path / output_name
     
-    try:
-        # Mock the core process_file function and LLM components
-        with patch("synthetic_data_kit.core.create.process_file") as mock_process:
-            expected_output = os.path.join(output_dir, "test_qa.json")
-            mock_process.return_value = expected_output
-            
-            # Test single file processing through CLI
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['create', input_file, '--type', 'qa', '--output-dir', output_dir])
-            
-            # Should process single file successfully
-            assert result.exit_code == 0
-            assert "Content saved to" in result.stdout
-            
-            # Should call process_file once
-            mock_process.assert_called_once()
-            
-    finally:
-        os.unlink(input_file)
-        os.rmdir(output_dir)
-
-
-@pytest.mark.integration
-def test_single_file_curate_still_works(patch_config):
-    """Test that single file curate processing works unchanged."""
-    # Create test QA pairs file
-    qa_pairs = {
-        "qa_pairs": [
-            {"question": "What is AI?", "answer": "Artificial Intelligence"},
-            {"question": "What is ML?", "answer": "Machine Learning"}
-        ]
-    }
-    
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(qa_pairs, f)
-        input_file = f.name
-        
-    output_dir = tempfile.mkdtemp()
+    # Mock the core function the command delegates to
+    mock_core = Mock(return_value=str(output))
+    monkeypatch.setattr(module, target, mock_core)
     
-    try:
-        # Mock the core curate function
-        with patch("synthetic_data_kit.core.curate.curate_qa_pairs") as mock_curate:
-            expected_output = os.path.join(output_dir, "curated.json")
-            mock_curate.return_value = expected_output
-            
-            # Test single file processing through CLI
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['curate', input_file, '--threshold', '7.0', '--output', expected_output])
-            
-            # Should process single file successfully
-            assert result.exit_code == 0
-            assert "Cleaned content saved to" in result.stdout
-            
-            # Should call curate_qa_pairs once
-            mock_curate.assert_called_once()
-            
-    finally:
-        os.unlink(input_file)
-        os.rmdir(output_dir)
+    # Call the command directly
+    exit_code = cli_helper.call_command(command, str(input_file), **{output_option: output}, **options)
 
+    # Should process single file successfully
+    assert exit_code == 0
+    assert expected in capsys.readouterr().out
 
-@pytest.mark.integration
-def test_single_file_save_as_still_works(patch_config):
-    """Test that single file save-as processing works unchanged."""
-    # Create test QA pairs file
-    qa_pairs = {
-        "qa_pairs": [
-            {"question": "What is AI?", "answer": "Artificial Intelligence"},
-            {"question": "What is ML?", "answer": "Machine Learning"}
-        ]
-    }
-    
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(qa_pairs, f)
-        input_file = f.name
-        
-    output_dir = tempfile.mkdtemp()
-    
-    try:
-        # Mock the core convert_format function
-        with patch("synthetic_data_kit.core.save_as.convert_format") as mock_convert:
-            expected_output = os.path.join(output_dir, "converted.jsonl")
-            mock_convert.return_value = expected_output
-            
-            # Test single file processing through CLI
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['save-as', input_file, '--format', 'jsonl', '--output', expected_output])
-            
-            # Should process single file successfully
-            assert result.exit_code == 0
-            assert "Converted to jsonl format" in result.stdout
-            
-            # Should call convert_format once
-            mock_convert.assert_called_once()
-            
-    finally:
-        os.unlink(input_file)
-        os.rmdir(output_dir)
+    # Should call the core function once with the input and output paths
+    mock_core.assert_called_once()
+    call_args = mock_core.call_args[0]
+    assert call_args[0] == str(input_file)
+    assert str(call_args[1]) == str(output)  # Path options are converted to strings
 
 
 @pytest.mark.integration
-def test_single_file_with_name_option():
+def test_single_file_with_name_option(cli_helper, tmp_path, monkeypatch):
     """Test that --name option still works for single files."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("Test content with custom name.")
-        input_file = f.name
-        
-    output_dir = tempfile.mkdtemp()
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("Test content with custom name.")
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
     custom_name = "custom_output_name"
     
-    try:
-        # Mock the core process_file function
-        with patch("synthetic_data_kit.core.ingest.process_file") as mock_process:
-            expected_output = os.path.join(output_dir, f"{custom_name}.txt")
-            mock_process.return_value = expected_output
-            
-            # Test single file processing with custom name
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['ingest', input_file, '--output-dir', output_dir, '--name', custom_name])
-            
-            # Should process single file successfully
-            assert result.exit_code == 0
-            
-            # Should call process_file with custom name
-            mock_process.assert_called_once()
-            call_args = mock_process.call_args[0]
-            assert call_args[2] == custom_name  # name parameter
-            
-    finally:
-        os.unlink(input_file)
-        os.rmdir(output_dir)
+    # Mock the core process_file function
+    mock_process = Mock(return_value=str(output_dir / f"{custom_name}.txt"))
+    monkeypatch.setattr(core_ingest, "process_file", mock_process)
+
+    # Call the ingest command directly with a custom name
+    exit_code = cli_helper.call_command(cli.ingest, str(input_file), output_dir=output_dir, name=custom_name)
+
+    # Should process single file successfully
+    assert exit_code == 0
+
+    # Should call process_file with custom name
+    mock_process.assert_called_once()
+    call_args = mock_process.call_args[0]
+    assert call_args[2] == custom_name  # name parameter
 
 
 @pytest.mark.integration
-def test_single_file_error_handling_unchanged():
+def test_single_file_error_handling_unchanged(monkeypatch):
     """Test that single file error handling works as before."""
-    # Test with non-existent file by calling the CLI function directly
-    from synthetic_data_kit.cli import ingest
-    
     # Mock the context to avoid directory creation issues
-    with patch("synthetic_data_kit.cli.ctx") as mock_ctx:
-        mock_ctx.config = {}
-        
-        # Call ingest directly with non-existent file
-        try:
-            result = ingest('/path/that/does/not/exist.txt')
-            # Should return 1 for error
-            assert result == 1
-        except SystemExit as e:
-            # Or should raise SystemExit with code 1
-            assert e.code == 1
+    monkeypatch.setattr(cli, "ctx", SimpleNamespace(config={}))
+    
+    # Call ingest directly with non-existent file
+    try:
+        result = cli.ingest('/path/that/does/not/exist.txt')
+        # Should return 1 for error
+        assert result == 1
+    except SystemExit as e:
+        # Or should raise SystemExit with code 1
+        assert e.code == 1
 
 
 @pytest.mark.integration
-def test_directory_name_option_ignored():
+def test_directory_name_option_ignored(runner, app, tmp_path, monkeypatch):
     """Test that --name option is ignored for directories with warning."""
-    temp_dir = tempfile.mkdtemp()
+    # Create a test file
+    (tmp_path / "test.txt").write_text("Test content")
     
-    try:
-        # Create a test file
-        test_file = os.path.join(temp_dir, "test.txt")
-        with open(test_file, "w") as f:
-            f.write("Test content")
-            
-        # Mock the directory processor
-        with patch("synthetic_data_kit.utils.directory_processor.process_directory_ingest") as mock_process:
-            mock_process.return_value = {"total_files": 1, "successful": 1, "failed": 0}
-            
-            # Test directory processing with --name option
-            from synthetic_data_kit.cli import app
-            from typer.testing import CliRunner
-            
-            runner = CliRunner()
-            result = runner.invoke(app, ['ingest', temp_dir, '--name', 'ignored_name'])
-            
-            # Should show warning about ignored --name option
-            assert result.exit_code == 0
-            assert "Warning: --name option is ignored when processing directories" in result.stdout
-            
-    finally:
-        os.unlink(test_file)
-        os.rmdir(temp_dir)
\ No newline at end of file
+    # Mock the directory processor
+    mock_process = Mock(return_value={"total_files": 1, "successful": 1, "failed": 0})
+    monkeypatch.setattr(directory_processor, "process_directory_ingest", mock_process)
+    
+    # Test directory processing with --name option
+    result = runner.invoke(app, ['ingest', str(tmp_path), '--name', 'ignored_name'])
+
+    # Should show warning about ignored --name option
+    assert result.exit_code == 0
+    assert "Warning: --name option is ignored when processing directories" in result.stdout
+
+    # Should still process the directory, without forwarding the name
+    mock_process.assert_called_once()
+    assert mock_process.call_args.kwargs["directory"] == str(tmp_path)
+    assert "ignored_name" not in mock_process.call_args.kwargs.values()
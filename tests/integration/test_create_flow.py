@@ -1,176 +1,161 @@
 """Integration tests for the create workflow."""
 
+import json
 import os
-import tempfile
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
 from synthetic_data_kit.core import create
+from synthetic_data_kit.generators.qa_generator import QAGenerator
+from synthetic_data_kit.models.llm_client import LLMClient
+
+
+# Document every mocked QAGenerator returns
+_FAKE_DOC = {
+    "summary": "A sample text for testing.",
+    "qa_pairs": [
+        {"question": "What is this?", "answer": "This is sample text."},
+        {"question": "What is it for?", "answer": "For testing QA generation."},
+    ],
+}
+
+
+@pytest.fixture
+def mocked_create(monkeypatch):
+    """Replace the LLM client and QA generator used by core.create with mocks."""
+    # Spec'd mocks reject attributes the real classes lack; instance
+    # attributes assigned in LLMClient.__init__ are set explicitly
+    llm = Mock(spec=LLMClient, provider="api-endpoint", config={})
+    generator = Mock(spec=QAGenerator)
+    generator.process_document.return_value = _FAKE_DOC
+    llm_class = Mock(spec=LLMClient, return_value=llm)
+    generator_class = Mock(spec=QAGenerator, return_value=generator)
+    monkeypatch.setattr(create, "LLMClient", llm_class)
+    monkeypatch.setattr(create, "QAGenerator", generator_class)
+    return SimpleNamespace(llm_class=llm_class, llm=llm, generator_class=generator_class, generator=generator)
 
 
 @pytest.mark.integration
-def test_process_file(patch_config, test_env):
+@pytest.mark.parametrize("provider", ["api-endpoint", "vllm"])
+def test_process_file(patch_config, test_env, mocked_create, tmp_path, provider):
     """Test processing a file to generate QA pairs."""
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as f:
-        f.write("This is sample text content for testing QA pair generation.")
-        input_path = f.name
-
-    output_dir = tempfile.mkdtemp()
-    output_path = None
-
-    try:
-        # Mock LLMClient
-        with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class:
-            # Setup mock LLM client
-            mock_llm_client = MagicMock()
-            mock_llm_client_class.return_value = mock_llm_client
-
-            # Mock QAGenerator with simplified behavior
-            with patch("synthetic_data_kit.core.create.QAGenerator") as mock_qa_gen_class:
-                # Create a mock generator that returns a predefined document
-                mock_generator = MagicMock()
-                mock_generator.process_document.return_value = {
-                    "summary": "A sample text for testing.",
-                    "qa_pairs": [
-                        {"question": "What is this?", "answer": "This is sample text."},
-                        {"question": "What is it for?", "answer": "For testing QA generation."},
-                    ],
-                }
-                mock_qa_gen_class.return_value = mock_generator
-
-                # Mock file operations
-                with patch("builtins.open", create=True), patch("json.dump") as mock_json_dump:
-                    # Mock os.path.exists to return True for our output file
-                    with patch("os.path.exists", return_value=True), patch(
-                        "os.path.join",
-                        return_value=os.path.join(output_dir, "output_qa_pairs.json"),
-                    ):
-                        # Run the process_file function with minimal arguments
-                        output_path = create.process_file(
-                            file_path=input_path,
-                            output_dir=output_dir,
-                            config_path=None,
-                            api_base=None,
-                            model=None,
-                            content_type="qa",
-                            num_pairs=2,
-                            verbose=False,
-                            provider="api-endpoint",
-                        )
-
-                        # Verify function doesn't raise an exception
-                        assert output_path is not None
-
-                        # Verify the LLM client was created
-                        mock_llm_client_class.assert_called_once()
-
-                        # Verify QA generator was created and used
-                        mock_qa_gen_class.assert_called_once()
-                        mock_generator.process_document.assert_called_once()
-
-                        # Verify data was written to a file
-                        mock_json_dump.assert_called()
-
-    finally:
-        # Clean up temporary files
-        if os.path.exists(input_path):
-            os.unlink(input_path)
-        try:
-            os.rmdir(output_dir)
-        except:
-            pass
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("This is sample text content for testing QA pair generation.")
+    output_dir = tmp_path / "output"
+
+    # Run the process_file function with minimal arguments
+    output_path = create.process_file(
+        file_path=str(input_path),
+        output_dir=str(output_dir),
+        config_path=None,
+        api_base=None,
+        model=None,
+        content_type="qa",
+        num_pairs=2,
+        verbose=False,
+        provider=provider,
+    )
+
+    # Verify the output was written where process_file reports it
+    assert output_path == str(output_dir / "input_qa_pairs.json")
+    assert json.loads((output_dir / "input_qa_pairs.json").read_text()) == _FAKE_DOC
+
+    # Verify the LLM client was created for the requested provider
+    mocked_create.llm_class.assert_called_once_with(
+        config_path=None, provider=provider, api_base=None, model_name=None
+    )
+
+    # Verify QA generator was created and used
+    mocked_create.generator_class.assert_called_once()
+    mocked_create.generator.process_document.assert_called_once()
 
 
 @pytest.mark.integration
-def test_process_directory(patch_config, test_env):
+def test_process_directory(patch_config, test_env, mocked_create, tmp_path):
     """Test processing a directory to generate QA pairs."""
-    # Create a temporary directory with test files
-    temp_dir = tempfile.mkdtemp()
-    output_dir = tempfile.mkdtemp()
-
-    try:
-        # Create a few test files
-        file_paths = []
-        for i in range(2):
-            with tempfile.NamedTemporaryFile(
-                mode="w+", suffix=".txt", dir=temp_dir, delete=False
-            ) as f:
-                f.write(f"This is sample text content {i} for testing QA pair generation.")
-                file_paths.append(f.name)
-
-        # Mock LLMClient
-        with patch("synthetic_data_kit.core.create.LLMClient") as mock_llm_client_class:
-            # Setup mock LLM client
-            mock_llm_client = MagicMock()
-            mock_llm_client_class.return_value = mock_llm_client
-
-            # Mock QAGenerator
-            with patch("synthetic_data_kit.core.create.QAGenerator") as mock_qa_gen_class:
-                # Create a mock generator that returns a predefined document
-                mock_generator = MagicMock()
-                mock_generator.process_document.return_value = {
-                    "summary": "A sample text for testing.",
-                    "qa_pairs": [
-                        {"question": "What is this?", "answer": "This is sample text."},
-                        {"question": "What is it for?", "answer": "For testing QA generation."},
-                    ],
-                }
-                mock_qa_gen_class.return_value = mock_generator
-
-                # Mock glob to return our test files
-                with patch("glob.glob", return_value=file_paths):
-                    # Mock file operations
-                    with patch("builtins.open", create=True), patch("json.dump"):
-                        # Mock the process_file function to return a predictable output path
-                        with patch(
-                            "synthetic_data_kit.core.create.process_file"
-                        ) as mock_process_file:
-                            # Have process_file return output paths for each input file
-                            output_files = [
-                                os.path.join(output_dir, f"output_{i}.json")
-                                for i in range(len(file_paths))
-                            ]
-                            mock_process_file.side_effect = output_files
-
-                            # Import and run the process_directory function from directory_processor
-                            from synthetic_data_kit.utils.directory_processor import process_directory_create
-                            results = process_directory_create(
-                                directory=temp_dir,
-                                output_dir=output_dir,
-                                config_path=None,
-                                api_base=None,
-                                model=None,
-                                content_type="qa",
-                                num_pairs=2,
-                                verbose=False,
-                                provider="api-endpoint",
-                            )
-
-                            # Verify process_file was called the right number of times
-                            assert mock_process_file.call_count == len(file_paths)
-
-                            # Verify function returns expected results structure
-                            assert isinstance(results, dict)
-                            assert "total_files" in results
-                            assert "successful" in results
-                            assert results["total_files"] == len(file_paths)
-
-    finally:
-        # Clean up temporary files and directories
-        for file_path in file_paths:
-            if os.path.exists(file_path):
-                try:
-                    os.unlink(file_path)
-                except:
-                    pass
-
-        try:
-            os.rmdir(temp_dir)
-        except:
-            pass
-
-        try:
-            os.rmdir(output_dir)
-        except:
-            pass
+    # Create a directory with a few test files
+    temp_dir = tmp_path / "input"
+    temp_dir.mkdir()
+    output_dir = str(tmp_path / "output")
+    for i in range(2):
+        (temp_dir / f"doc{i}.txt").write_text(f"This is sample text content {i} for testing QA pair generation.")
+    file_paths = [str(path) for path in sorted(temp_dir.glob("*.txt"))]
+
+    # Have process_file return output paths for each input file
+    output_files = [os.path.join(output_dir, f"output_{i}.json") for i in range(len(file_paths))]
+
+    # Only process_file is mocked; files are discovered by the real directory scan
+    with patch.object(create, "process_file", side_effect=output_files) as mock_process_file:
+        # Import and run the process_directory function from directory_processor
+        from synthetic_data_kit.utils.directory_processor import process_directory_create
+        results = process_directory_create(
+            directory=str(temp_dir),
+            output_dir=output_dir,
+            config_path=None,
+            api_base=None,
+            model=None,
+            content_type="qa",
+            num_pairs=2,
+            verbose=False,
+            provider="api-endpoint",
+        )
+
+        # Verify process_file was called once per discovered file
+        assert sorted(call.args[0] for call in mock_process_file.call_args_list) == file_paths
+
+        # Verify function returns expected results structure
+        assert isinstance(results, dict)
+        assert "total_files" in results
+        assert "successful" in results
+        assert results["total_files"] == len(file_paths)
+
+
+@pytest.mark.integration
+def test_process_directory_async(patch_config, test_env, tmp_path):
+    """Test the async create variant bounds concurrency and keeps input order."""
+    import asyncio
+    import threading
+    import time
+
+    from synthetic_data_kit.utils.directory_processor import process_directory_create_async
+
+    temp_dir = str(tmp_path / "input")
+    output_dir = str(tmp_path / "output")
+    os.makedirs(temp_dir)
+
+    for i in range(6):
+        with open(os.path.join(temp_dir, f"doc{i}.txt"), "w") as f:
+            f.write(f"This is sample text content {i}.")
+
+    lock = threading.Lock()
+    in_flight = {"current": 0, "peak": 0}
+
+    def fake_process_file(file_path, *args, **kwargs):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        time.sleep(0.01)
+        with lock:
+            in_flight["current"] -= 1
+        if file_path.endswith("doc3.txt"):
+            raise ValueError("LLM failure")
+        return os.path.join(output_dir, os.path.basename(file_path) + ".json")
+
+    with patch("synthetic_data_kit.core.create.process_file", side_effect=fake_process_file):
+        results = asyncio.run(
+            process_directory_create_async(
+                directory=temp_dir,
+                output_dir=output_dir,
+                content_type="qa",
+                max_concurrency=2,
+            )
+        )
+
+    assert results["total_files"] == 6
+    assert results["successful"] == 5
+    assert results["failed"] == 1
+    assert in_flight["peak"] <= 2
+    input_files = [r["input_file"] for r in results["results"]]
+    assert input_files == sorted(input_files)
@@ -1,8 +1,9 @@
 """Integration tests for directory processing edge cases."""
 
 import os
-import tempfile
 import json
+import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -16,109 +17,74 @@ from synthetic_data_kit.utils.directory_processor import (
 )
 
 
+@pytest.fixture
+def mock_ingest_process_file(tmp_path):
+    """Patch ingest.process_file with a mock returning a path under tmp_path."""
+    with patch("synthetic_data_kit.core.ingest.process_file") as mock_process:
+        mock_process.return_value = str(tmp_path / "test.txt")
+        yield mock_process
+
+
 @pytest.mark.integration
-def test_empty_directory_handling(patch_config):
+def test_empty_directory_handling(patch_config, tmp_path):
     """Test processing empty directories doesn't crash."""
-    temp_dir = tempfile.mkdtemp()
-    output_dir = tempfile.mkdtemp()
+    temp_dir = str(tmp_path / "in")
+    os.mkdir(temp_dir)
+    output_dir = str(tmp_path / "out")
+    os.mkdir(output_dir)
     
-    try:
-        # Test ingest with empty directory
-        results = process_directory_ingest(
-            directory=temp_dir,
-            output_dir=output_dir,
-            config=None,
-            verbose=False
-        )
-        
-        # Should handle gracefully
-        assert results["total_files"] == 0
-        assert results["successful"] == 0
-        assert results["failed"] == 0
-        
-    finally:
-        os.rmdir(temp_dir)
-        os.rmdir(output_dir)
+    # Test ingest with empty directory
+    results = process_directory_ingest(
+        directory=temp_dir,
+        output_dir=output_dir,
+        config=None,
+        verbose=False
+    )
+    
+    # Should handle gracefully
+    assert results["total_files"] == 0
+    assert results["successful"] == 0
+    assert results["failed"] == 0
 
 
 @pytest.mark.integration  
-def test_mixed_file_types_directory(patch_config):
+def test_mixed_file_types_directory(patch_config, qa_fixture_dir, tmp_path, mock_ingest_process_file):
     """Test processing directories with supported and unsupported files."""
-    temp_dir = tempfile.mkdtemp()
-    output_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create supported file
-        supported_file = os.path.join(temp_dir, "test.txt")
-        with open(supported_file, "w") as f:
-            f.write("Test content")
-            
-        # Create unsupported file
-        unsupported_file = os.path.join(temp_dir, "test.xyz")
-        with open(unsupported_file, "w") as f:
-            f.write("Unsupported content")
-            
-        # Mock the process_file function
-        with patch("synthetic_data_kit.core.ingest.process_file") as mock_process:
-            mock_process.return_value = os.path.join(output_dir, "test.txt")
-            
-            results = process_directory_ingest(
-                directory=temp_dir,
-                output_dir=output_dir,
-                config=None,
-                verbose=False
-            )
-            
-            # Should process only supported file
-            assert results["total_files"] == 1  # Only .txt file counted
-            assert results["successful"] == 1
-            assert results["failed"] == 0
-            assert mock_process.call_count == 1
-            
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
-        os.rmdir(output_dir)
-
-
-@pytest.mark.integration
-def test_directory_stats_functionality():
+    temp_dir = str(qa_fixture_dir / "mixed")  # test.txt + test.xyz
+    
+    results = process_directory_ingest(
+        directory=temp_dir,
+        output_dir=str(tmp_path),
+        config=None,
+        verbose=False
+    )
+    
+    # Should process only supported file
+    assert results["total_files"] == 1  # Only .txt file counted
+    assert results["successful"] == 1
+    assert results["failed"] == 0
+    assert mock_ingest_process_file.call_count == 1
+
+
+# get_directory_stats result for qa_fixture_dir / "stats"
+_EXPECTED_STATS = {
+    "total_files": 3,
+    "supported_files": 2,  # .txt and .pdf
+    "unsupported_files": 1,  # .xyz
+    "by_extension": {".pdf": 1, ".txt": 1},
+    "file_list": ["test.pdf", "test.txt"],
+}
+
+
+@pytest.mark.integration
+def test_directory_stats_functionality(qa_fixture_dir):
     """Test get_directory_stats function for preview mode."""
-    temp_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create test files
-        txt_file = os.path.join(temp_dir, "test.txt")
-        with open(txt_file, "w") as f:
-            f.write("Test content")
-            
-        pdf_file = os.path.join(temp_dir, "test.pdf") 
-        with open(pdf_file, "w") as f:
-            f.write("PDF content")
-            
-        unsupported_file = os.path.join(temp_dir, "test.xyz")
-        with open(unsupported_file, "w") as f:
-            f.write("Unsupported")
-            
-        # Test stats for ingest extensions
-        stats = get_directory_stats(temp_dir, INGEST_EXTENSIONS)
-        
-        assert stats["total_files"] == 3
-        assert stats["supported_files"] == 2  # .txt and .pdf
-        assert stats["unsupported_files"] == 1  # .xyz
-        assert ".txt" in stats["by_extension"]
-        assert ".pdf" in stats["by_extension"]
-        assert stats["by_extension"][".txt"] == 1
-        assert stats["by_extension"][".pdf"] == 1
-        assert len(stats["file_list"]) == 2
-        
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
+    temp_dir = str(qa_fixture_dir / "stats")  # test.txt, test.pdf, test.xyz
+    
+    # Test stats for ingest extensions
+    stats = get_directory_stats(temp_dir, INGEST_EXTENSIONS)
+    
+    assert stats == _EXPECTED_STATS
 
 
 @pytest.mark.integration
@@ -133,98 +99,347 @@ def test_nonexistent_directory_error():
 
 
 @pytest.mark.integration  
-def test_file_as_directory_error():
+def test_file_as_directory_error(tmp_path):
     """Test handling when a file path is passed as directory."""
     # Create a temporary file
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        f.write(b"test")
-        file_path = f.name
-        
-    try:
-        # Test directory stats with file path
-        stats = get_directory_stats(file_path, INGEST_EXTENSIONS)
-        assert "error" in stats
-        assert "not a directory" in stats["error"]
-        
-    finally:
-        os.unlink(file_path)
-
-
-@pytest.mark.integration
-def test_partial_processing_failures(patch_config):
+    file_path = tmp_path / "file"
+    file_path.write_bytes(b"test")
+    
+    # Test directory stats with file path
+    stats = get_directory_stats(str(file_path), INGEST_EXTENSIONS)
+    assert "error" in stats
+    assert "not a directory" in stats["error"]
+
+
+@pytest.mark.integration
+def test_partial_processing_failures(patch_config, qa_fixture_dir, tmp_path):
     """Test that some files failing doesn't stop entire directory processing."""
-    temp_dir = tempfile.mkdtemp()
-    output_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create test JSON files for save-as processing
-        good_file = os.path.join(temp_dir, "good.json")
-        with open(good_file, "w") as f:
-            json.dump({"qa_pairs": [{"question": "Q?", "answer": "A."}]}, f)
-            
-        bad_file = os.path.join(temp_dir, "bad.json")
-        with open(bad_file, "w") as f:
-            f.write("invalid json content")
-            
-        # Process directory - should handle partial failures
-        results = process_directory_save_as(
+    temp_dir = str(qa_fixture_dir / "partial")  # good.json + bad.json
+    output_dir = str(tmp_path)
+    
+    # Process directory - should handle partial failures
+    results = process_directory_save_as(
+        directory=temp_dir,
+        output_dir=output_dir,
+        format="jsonl",
+        storage_format="json",
+        config=None,
+        verbose=False
+    )
+    
+    # Should have mix of success and failure
+    assert results["total_files"] == 2
+    assert results["successful"] >= 0  # At least some should succeed
+    assert results["failed"] >= 0      # Some might fail
+    assert results["successful"] + results["failed"] == 2
+
+
+@pytest.mark.integration
+def test_directory_with_subdirectories(qa_fixture_dir):
+    """Test that subdirectories are ignored (non-recursive processing)."""
+    temp_dir = str(qa_fixture_dir / "nested")  # main.txt + subdir/sub.txt
+    
+    # Test stats - should only count main directory files
+    stats = get_directory_stats(temp_dir, INGEST_EXTENSIONS)
+    
+    assert stats["total_files"] == 1  # Only main.txt
+    assert stats["supported_files"] == 1
+    assert len(stats["file_list"]) == 1
+    assert "main.txt" in stats["file_list"]
+
+
+@pytest.mark.integration
+def test_parallel_batches_preserve_order_and_bound_concurrency(patch_config, tmp_path):
+    """Test files are processed in bounded batches and reported in input order."""
+    import threading
+    
+    temp_dir = str(tmp_path / "in")
+    os.mkdir(temp_dir)
+    output_dir = str(tmp_path / "out")
+    os.mkdir(output_dir)
+    
+    for i in range(5):
+        Path(temp_dir, f"doc{i}.txt").write_bytes(f"Content {i}".encode())
+    
+    lock = threading.Lock()
+    in_flight = {"current": 0, "peak": 0}
+    
+    def fake_process(file_path, *args, **kwargs):
+        with lock:
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+        try:
+            return os.path.join(output_dir, os.path.basename(file_path))
+        finally:
+            with lock:
+                in_flight["current"] -= 1
+    
+    with patch("synthetic_data_kit.core.ingest.process_file", side_effect=fake_process):
+        results = process_directory_ingest(
             directory=temp_dir,
             output_dir=output_dir,
-            format="jsonl",
-            storage_format="json",
-            config=None,
+            config={"batch": {"parallel_batch_size": 2}},
             verbose=False
         )
-        
-        # Should have mix of success and failure
-        assert results["total_files"] == 2
-        assert results["successful"] >= 0  # At least some should succeed
-        assert results["failed"] >= 0      # Some might fail
-        assert results["successful"] + results["failed"] == 2
-        
-    finally:
-        # Clean up
-        for filename in os.listdir(temp_dir):
-            os.unlink(os.path.join(temp_dir, filename))
-        os.rmdir(temp_dir)
-        
-        # Clean up output dir
-        for filename in os.listdir(output_dir):
-            file_path = os.path.join(output_dir, filename)
-            if os.path.isfile(file_path):
-                os.unlink(file_path)
-        os.rmdir(output_dir)
-
-
-@pytest.mark.integration
-def test_directory_with_subdirectories():
-    """Test that subdirectories are ignored (non-recursive processing)."""
-    temp_dir = tempfile.mkdtemp()
-    
-    try:
-        # Create file in main directory
-        main_file = os.path.join(temp_dir, "main.txt")
-        with open(main_file, "w") as f:
-            f.write("Main content")
-            
-        # Create subdirectory with file
-        sub_dir = os.path.join(temp_dir, "subdir")
-        os.makedirs(sub_dir)
-        sub_file = os.path.join(sub_dir, "sub.txt")
-        with open(sub_file, "w") as f:
-            f.write("Sub content")
-            
-        # Test stats - should only count main directory files
-        stats = get_directory_stats(temp_dir, INGEST_EXTENSIONS)
-        
-        assert stats["total_files"] == 1  # Only main.txt
-        assert stats["supported_files"] == 1
-        assert len(stats["file_list"]) == 1
-        assert "main.txt" in stats["file_list"]
-        
-    finally:
-        # Clean up
-        os.unlink(os.path.join(sub_dir, "sub.txt"))
-        os.rmdir(sub_dir)
-        os.unlink(main_file)
-        os.rmdir(temp_dir)
\ No newline at end of file
+    
+    assert results["successful"] == 5
+    assert in_flight["peak"] <= 2
+    input_files = [r["input_file"] for r in results["results"]]
+    assert input_files == sorted(input_files)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("command, extension", [("create", ".txt"), ("curate", ".json")])
+def test_create_and_curate_read_batch_settings_from_config(tmp_path, command, extension):
+    """Test create and curate take batch settings from the loaded config."""
+    from synthetic_data_kit.utils import directory_processor
+    
+    temp_dir = str(tmp_path / "in")
+    os.mkdir(temp_dir)
+    Path(temp_dir, f"doc{extension}").write_bytes(b"{}")
+    
+    config = {"batch": {"parallel_batch_size": 3, "max_workers": 2}}
+    with patch.object(directory_processor, "load_config", return_value=config) as mock_load, \
+         patch.object(directory_processor, "_process_in_batches", return_value=iter(())) as mock_batches:
+        process = getattr(directory_processor, f"process_directory_{command}")
+        process(directory=temp_dir, output_dir=str(tmp_path / "out"), config_path="custom.yaml")
+    
+    mock_load.assert_called_with("custom.yaml")
+    assert mock_batches.call_args[0][2:] == (3, 2)
+
+
+@pytest.mark.integration
+def test_buffered_success_lines_are_all_printed(patch_config, capsys, tmp_path, mock_ingest_process_file):
+    """Test non-verbose per-file success lines are flushed in order before the summary."""
+    from synthetic_data_kit.utils import directory_processor
+    
+    temp_dir = str(tmp_path / "in")
+    os.mkdir(temp_dir)
+    output_dir = str(tmp_path / "out")
+    os.mkdir(output_dir)
+    
+    for i in range(3):
+        Path(temp_dir, f"doc{i}.txt").write_bytes(f"Content {i}".encode())
+    
+    with patch.object(directory_processor, "_LINE_FLUSH_SIZE", 2):
+        process_directory_ingest(directory=temp_dir, output_dir=output_dir, verbose=False)
+    
+    out = capsys.readouterr().out
+    positions = [out.index(f"✓ doc{i}.txt") for i in range(3)]
+    assert positions == sorted(positions)
+    assert positions[-1] < out.index("Processing Summary:")
+    assert mock_ingest_process_file.call_count == 3
+
+
+@pytest.mark.integration
+def test_directory_scan_cached_until_mtime_changes(tmp_path):
+    """Test repeated scans of an unchanged directory reuse the cached listing."""
+    from synthetic_data_kit.utils.directory_processor import get_supported_files
+    
+    temp_dir = str(tmp_path)
+    
+    Path(temp_dir, "a.txt").write_bytes(b"A")
+    # Only directories whose mtime is safely in the past are cached
+    os.utime(temp_dir, ns=(0, time.time_ns() - 10_000_000_000))
+    
+    first = get_supported_files(temp_dir, INGEST_EXTENSIONS)
+    with patch("os.scandir") as mock_scandir:
+        second = get_supported_files(temp_dir, INGEST_EXTENSIONS)
+        mock_scandir.assert_not_called()
+    assert first == second
+    
+    # Adding a file bumps the directory mtime and forces a rescan
+    Path(temp_dir, "b.txt").write_bytes(b"B")
+    os.utime(temp_dir, ns=(0, os.stat(temp_dir).st_mtime_ns + 1))
+    
+    assert len(get_supported_files(temp_dir, INGEST_EXTENSIONS)) == 2
+
+
+@pytest.mark.integration
+def test_directory_scan_cache_skips_recent_and_is_bounded(tmp_path):
+    """Test recently modified directories are rescanned and the cache stays bounded."""
+    from synthetic_data_kit.utils import directory_processor
+    
+    directory_processor._DIR_CACHE.clear()
+    recent = tmp_path / "recent"
+    recent.mkdir()
+    directory_processor.get_supported_files(str(recent), INGEST_EXTENSIONS)
+    assert not directory_processor._DIR_CACHE
+    
+    old_mtime = time.time_ns() - 10_000_000_000
+    with patch.object(directory_processor, "_DIR_CACHE_MAX_ENTRIES", 2):
+        for name in ["a", "b", "c"]:
+            (tmp_path / name).mkdir()
+            os.utime(tmp_path / name, ns=(0, old_mtime))
+            directory_processor.get_supported_files(str(tmp_path / name), INGEST_EXTENSIONS)
+    
+    cached_dirs = [os.path.basename(key[0]) for key in directory_processor._DIR_CACHE]
+    assert cached_dirs == ["b", "c"]
+
+
+@pytest.mark.integration
+def test_extension_matching_is_case_insensitive(tmp_path):
+    """Test extensions are matched case-insensitively on both sides."""
+    from synthetic_data_kit.utils.directory_processor import get_supported_files
+    
+    temp_dir = str(tmp_path)
+    
+    for filename in ["lower.txt", "UPPER.TXT", "other.md"]:
+        Path(temp_dir, filename).write_bytes(b"content")
+    
+    files = get_supported_files(temp_dir, [".TXT"])
+    assert [os.path.basename(p) for p in files] == ["UPPER.TXT", "lower.txt"]
+
+
+@pytest.mark.integration
+def test_parallel_stat_scan_matches_serial_scan(tmp_path):
+    """Test SDK_PARALLEL_STAT gives the same stats as the serial scan."""
+    from synthetic_data_kit.utils import directory_processor
+    
+    temp_dir = str(tmp_path)
+    
+    for i in range(5):
+        Path(temp_dir, f"doc{i}.txt").write_bytes(b"content")
+    os.mkdir(os.path.join(temp_dir, "subdir.txt"))
+    
+    serial = get_directory_stats(temp_dir, [".txt"])
+    directory_processor._DIR_CACHE.clear()
+    
+    with patch.object(directory_processor, "_PARALLEL_STAT_THRESHOLD", 2), \
+         patch.dict(os.environ, {"SDK_PARALLEL_STAT": "1"}):
+        parallel = get_directory_stats(temp_dir, [".txt"])
+    
+    assert parallel == serial
+    assert parallel["total_files"] == 5
+
+
+@pytest.mark.integration
+def test_results_streamed_to_log_and_trimmed(patch_config, tmp_path):
+    """Test results_log_path writes every record and keeps only the tail in memory."""
+    from synthetic_data_kit.utils import directory_processor
+    
+    temp_dir = str(tmp_path / "in")
+    os.mkdir(temp_dir)
+    output_dir = str(tmp_path / "out")
+    os.mkdir(output_dir)
+    log_path = os.path.join(output_dir, "logs", "results.jsonl")
+    
+    for i in range(7):
+        Path(temp_dir, f"doc{i}.txt").write_bytes(b"content")
+    
+    def fake_process_file(file_path, *args, **kwargs):
+        return os.path.join(output_dir, os.path.basename(file_path))
+    
+    with patch("synthetic_data_kit.core.ingest.process_file", side_effect=fake_process_file), \
+         patch.object(directory_processor, "RESULTS_LOG_KEEP_LAST", 2):
+        results = process_directory_ingest(
+            directory=temp_dir,
+            output_dir=output_dir,
+            results_log_path=log_path,
+        )
+    
+    assert results["successful"] == 7
+    assert results["results_log"] == log_path
+    assert [os.path.basename(r["input_file"]) for r in results["results"]] == ["doc5.txt", "doc6.txt"]
+    
+    with open(log_path, "rb") as f:
+        lines = f.read().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert len(records) == 7
+    assert all(record["status"] == "success" for record in records)
+    # Log lines are exactly what json.dumps writes, whatever is installed
+    assert lines == [json.dumps(record).encode("ascii") for record in records]
+
+
+@pytest.mark.integration
+def test_ingest_in_worker_processes(tmp_path):
+    """Test ingest with use_processes parses real files and reports failures per file."""
+    temp_dir = str(tmp_path / "in")
+    os.mkdir(temp_dir)
+    output_dir = str(tmp_path / "out")
+    os.mkdir(output_dir)
+    
+    for i in range(3):
+        Path(temp_dir, f"doc{i}.txt").write_bytes(f"Document {i}".encode())
+    # An unreadable .docx fails in the worker without stopping the others
+    Path(temp_dir, "broken.docx").write_bytes(b"not a docx file")
+    
+    results = process_directory_ingest(
+        directory=temp_dir,
+        output_dir=output_dir,
+        config={"batch": {"max_workers": 2}},
+        use_processes=True,
+    )
+    
+    assert results["total_files"] == 4
+    assert results["successful"] == 3
+    assert results["failed"] == 1
+    assert os.path.basename(results["errors"][0]["input_file"]) == "broken.docx"
+    with open(os.path.join(output_dir, "doc1.txt")) as f:
+        assert f.read() == "Document 1"
+
+
+@pytest.mark.integration
+def test_iter_and_count_supported_files(tmp_path):
+    """Test the lazy iterator and counter agree with get_supported_files."""
+    from synthetic_data_kit.utils.directory_processor import (
+        count_supported_files,
+        get_supported_files,
+        iter_supported_files,
+    )
+    
+    temp_dir = str(tmp_path)
+    
+    for filename in ["b.txt", "a.TXT", "c.md"]:
+        Path(temp_dir, filename).write_bytes(b"content")
+    
+    expected = get_supported_files(temp_dir, [".txt"])
+    assert sorted(iter_supported_files(temp_dir, [".txt"])) == expected
+    assert list(iter_supported_files(temp_dir, [".txt"], sort=True)) == expected
+    assert count_supported_files(temp_dir, [".txt"]) == 2
+    
+    with pytest.raises(FileNotFoundError):
+        next(iter_supported_files(os.path.join(temp_dir, "missing"), [".txt"]))
+
+
+@pytest.mark.integration
+def test_extension_matcher_agrees_with_splitext():
+    """Test the compiled extension matcher classifies names like os.path.splitext."""
+    from synthetic_data_kit.utils.directory_processor import _INGEST_ENDS, _INGEST_EXT_SET
+    
+    names = [
+        "a.pdf", "B.PDF", "page.htm", "page.html", "notes.txt", ".txt", "..txt",
+        "a..txt", ".hidden.docx", "deck.pptx.bak", "README", "a.tx", "a.ttxt",
+    ]
+    for name in names:
+        expected = os.path.splitext(name)[1].lower() in _INGEST_EXT_SET
+        assert (_INGEST_ENDS.match(name) is not None) == expected, name
+
+
+@pytest.mark.integration
+def test_progress_updates_are_batched(patch_config, tmp_path, mock_ingest_process_file):
+    """Test the progress bar is advanced in batches that still add up to every file."""
+    from rich.progress import Progress
+    
+    temp_dir = str(tmp_path)
+    
+    for i in range(20):
+        Path(temp_dir, f"doc{i:02d}.txt").write_bytes(b"content")
+    
+    advances = []
+    original_update = Progress.update
+    
+    def record_update(self, task_id, *args, advance=None, **kwargs):
+        if advance is not None:
+            advances.append(advance)
+        return original_update(self, task_id, *args, advance=advance, **kwargs)
+    
+    with patch.object(Progress, "update", record_update):
+        results = process_directory_ingest(directory=temp_dir, output_dir=None, verbose=True)
+    
+    assert results["successful"] == 20
+    assert mock_ingest_process_file.call_count == 20
+    assert sum(advances) == 20
+    assert len(advances) < 20
+
+
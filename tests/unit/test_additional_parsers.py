@@ -4,17 +4,44 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+import asyncio
 import os
 import tempfile
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
 
+from synthetic_data_kit.parsers import docx_parser, ppt_parser, youtube_parser
 from synthetic_data_kit.parsers.docx_parser import DOCXParser
 from synthetic_data_kit.parsers.ppt_parser import PPTParser
 from synthetic_data_kit.parsers.youtube_parser import YouTubeParser
 
 
+def fake_imports(parser_module, **modules):
+    """Patch a parser module's lazy_import to serve the given mocks by name.
+
+    A value that is an exception instance is raised instead of returned.
+    """
+
+    def lazy_import(name):
+        module = modules[name]
+        if isinstance(module, Exception):
+            raise module
+        return module
+
+    return patch.object(parser_module, "lazy_import", side_effect=lazy_import)
+
+
+class Shapes(list):
+    """Iterable slide shape collection with a title placeholder, like pptx's SlideShapes"""
+
+    def __init__(self, items, title=None):
+        super().__init__(items)
+        self.title = title
+
+
 class TestDOCXParser:
     """Test cases for DOCX parser"""
 
@@ -23,56 +50,73 @@ class TestDOCXParser:
         parser = DOCXParser()
         assert parser is not None
 
-    @patch("builtins.__import__")
-    def test_docx_parse_success(self, mock_import):
+    def test_docx_parse_success(self):
         """Test successful DOCX parsing with paragraphs and tables"""
-        # Setup mock docx module
-        mock_docx = MagicMock()
-        mock_doc = MagicMock()
-        mock_docx.Document.return_value = mock_doc
-        mock_import.return_value = mock_docx
-
-        # Mock paragraphs
-        mock_paragraph1 = MagicMock()
-        mock_paragraph1.text = "First paragraph"
-        mock_paragraph2 = MagicMock()
-        mock_paragraph2.text = "Second paragraph"
-        mock_paragraph3 = MagicMock()
-        mock_paragraph3.text = ""  # Empty paragraph should be filtered
-
-        mock_doc.paragraphs = [mock_paragraph1, mock_paragraph2, mock_paragraph3]
-
-        # Mock tables
-        mock_cell1 = MagicMock()
-        mock_cell1.text = "Cell 1"
-        mock_cell2 = MagicMock()
-        mock_cell2.text = "Cell 2"
-
-        mock_row = MagicMock()
-        mock_row.cells = [mock_cell1, mock_cell2]
-
-        mock_table = MagicMock()
-        mock_table.rows = [mock_row]
-
-        mock_doc.tables = [mock_table]
+        # Paragraphs, one empty (should be filtered), and a single-row table
+        mock_doc = SimpleNamespace(
+            paragraphs=[
+                SimpleNamespace(text="First paragraph"),
+                SimpleNamespace(text="Second paragraph"),
+                SimpleNamespace(text=""),
+            ],
+            tables=[
+                SimpleNamespace(
+                    rows=[SimpleNamespace(cells=[SimpleNamespace(text="Cell 1"), SimpleNamespace(text="Cell 2")])]
+                )
+            ],
+        )
+        mock_docx = SimpleNamespace(Document=MagicMock(return_value=mock_doc))
 
         # Test parsing
         parser = DOCXParser()
-        result = parser.parse("/fake/path.docx")
+        with fake_imports(docx_parser, docx=mock_docx) as mock_import:
+            result = parser.parse("/fake/path.docx")
 
         expected = "First paragraph\n\nSecond paragraph\n\nCell 1\n\nCell 2"
         assert result == expected
-        # Verify docx import was called (first argument of any call should be 'docx')
-        import_calls = [call[0][0] for call in mock_import.call_args_list if call[0]]
-        assert "docx" in import_calls
+        mock_import.assert_called_once_with("docx")
         mock_docx.Document.assert_called_once_with("/fake/path.docx")
 
-    @patch("builtins.__import__")
-    def test_docx_parse_import_error(self, mock_import):
+    def test_docx_parse_keeps_document_order(self, tmp_path):
+        """Test tables are emitted where they appear between paragraphs"""
+        docx = pytest.importorskip("docx")
+        document = docx.Document()
+        document.add_paragraph("Before table")
+        table = document.add_table(rows=1, cols=2)
+        table.rows[0].cells[0].text = "Cell 1"
+        table.rows[0].cells[1].text = "Cell 2"
+        document.add_paragraph("")
+        document.add_paragraph("After table")
+        file_path = tmp_path / "ordered.docx"
+        document.save(str(file_path))
+
+        result = DOCXParser().parse(str(file_path))
+
+        assert result == "Before table\n\nCell 1\n\nCell 2\n\nAfter table"
+
+    def test_docx_parse_many(self):
+        """Test async batch parsing returns one result per file, in order"""
+        mock_docx = SimpleNamespace(
+            Document=MagicMock(
+                side_effect=lambda path: SimpleNamespace(
+                    paragraphs=[SimpleNamespace(text=f"Text of {path}")], tables=[]
+                )
+            )
+        )
+        paths = [f"/fake/doc{i}.docx" for i in range(6)]
+
+        with fake_imports(docx_parser, docx=mock_docx):
+            results = asyncio.run(DOCXParser().parse_many(paths, concurrency=2))
+
+        assert results == [f"Text of {path}" for path in paths]
+        assert mock_docx.Document.call_count == 6
+
+    def test_docx_parse_import_error(self):
         """Test ImportError when docx module is not available"""
-        mock_import.side_effect = ImportError("No module named 'docx'")
         parser = DOCXParser()
-        with pytest.raises(ImportError, match="python-docx is required"):
+        with fake_imports(docx_parser, docx=ImportError("No module named 'docx'")), pytest.raises(
+            ImportError, match="python-docx is required"
+        ):
             parser.parse("/fake/path.docx")
 
     def test_docx_save(self):
@@ -86,8 +130,46 @@ class TestDOCXParser:
 
             # Verify file was created and content is correct
             assert os.path.exists(output_path)
-            with open(output_path, encoding="utf-8") as f:
-                assert f.read() == content
+            with open(output_path, "rb") as f:
+                assert f.read() == content.encode("utf-8")
+
+    def test_docx_save_streams_chunks(self, tmp_path):
+        """Test save writes parse_iter chunks without joining them first"""
+        mock_doc = SimpleNamespace(
+            paragraphs=[SimpleNamespace(text=t) for t in ("First", "", "Second")], tables=[]
+        )
+        mock_docx = SimpleNamespace(Document=MagicMock(return_value=mock_doc))
+
+        parser = DOCXParser()
+        output_path = tmp_path / "subdir" / "output.txt"
+        with fake_imports(docx_parser, docx=mock_docx):
+            chunks = parser.parse_iter("/fake/path.docx")
+            assert not isinstance(chunks, str)
+            parser.save(chunks, str(output_path))
+            expected = parser.parse("/fake/path.docx")
+
+        assert output_path.read_text(encoding="utf-8") == expected == "First\n\nSecond"
+
+    def test_docx_save_bytes(self, tmp_path):
+        """Test pre-encoded UTF-8 content is written unchanged"""
+        content = "Résumé ✓\n".encode("utf-8")
+        output_path = tmp_path / "subdir" / "output.txt"
+
+        DOCXParser().save(content, str(output_path))
+
+        assert output_path.read_bytes() == content
+
+    def test_save_skips_redundant_makedirs(self, tmp_path):
+        """Test repeated saves into one directory create it only once"""
+        parser = DOCXParser()
+        output_dir = tmp_path / "subdir"
+
+        with patch("os.makedirs", wraps=os.makedirs) as mock_makedirs:
+            for i in range(10):
+                parser.save(f"Content {i}", str(output_dir / f"output{i}.txt"))
+
+        assert mock_makedirs.call_count == 1
+        assert (output_dir / "output9.txt").read_text(encoding="utf-8") == "Content 9"
 
 
 class TestPPTParser:
@@ -98,42 +180,23 @@ class TestPPTParser:
         parser = PPTParser()
         assert parser is not None
 
-    @patch("builtins.__import__")
-    def test_ppt_parse_success(self, mock_import):
+    def test_ppt_parse_success(self):
         """Test successful PPTX parsing with slides and shapes"""
-        # Setup mock pptx module
-        mock_pptx = MagicMock()
-        mock_presentation_class = MagicMock()
-        mock_prs = MagicMock()
-        mock_presentation_class.return_value = mock_prs
-        mock_pptx.Presentation = mock_presentation_class
-        mock_import.return_value = mock_pptx
-
-        # Mock slide 1
-        mock_slide1 = MagicMock()
-        mock_title1 = MagicMock()
-        mock_title1.text = "Slide 1 Title"
-
-        # Setup shapes collection with title attribute
-        mock_shapes1 = MagicMock()
-        mock_shapes1.title = mock_title1
-        mock_shapes1.__iter__ = lambda self: iter([mock_title1, MagicMock(text="Slide 1 content")])
-        mock_slide1.shapes = mock_shapes1
-
-        # Mock slide 2 (no title)
-        mock_slide2 = MagicMock()
-        mock_shapes2 = MagicMock()
-        mock_shapes2.title = None
-        mock_shape2 = MagicMock()
-        mock_shape2.text = "Slide 2 content"
-        mock_shapes2.__iter__ = lambda self: iter([mock_shape2])
-        mock_slide2.shapes = mock_shapes2
-
-        mock_prs.slides = [mock_slide1, mock_slide2]
+        # Slide 1 has a title, which is also one of its shapes; slide 2 has none
+        title1 = SimpleNamespace(text="Slide 1 Title")
+        shapes1 = Shapes([title1, SimpleNamespace(text="Slide 1 content")], title=title1)
+        shapes2 = Shapes([SimpleNamespace(text="Slide 2 content")])
+
+        mock_prs = SimpleNamespace(
+            slides=[SimpleNamespace(shapes=shapes1), SimpleNamespace(shapes=shapes2)]
+        )
+        mock_presentation_class = MagicMock(return_value=mock_prs)
+        mock_pptx = SimpleNamespace(Presentation=mock_presentation_class)
 
         # Test parsing
         parser = PPTParser()
-        result = parser.parse("/fake/path.pptx")
+        with fake_imports(ppt_parser, pptx=mock_pptx) as mock_import:
+            result = parser.parse("/fake/path.pptx")
 
         expected_lines = [
             "--- Slide 1 ---",
@@ -146,17 +209,15 @@ class TestPPTParser:
         ]
         expected = "\n\n".join(["\n".join(expected_lines[:4]), "\n".join(expected_lines[5:])])
         assert result == expected
-        # Verify pptx import was called
-        import_calls = [call[0][0] for call in mock_import.call_args_list if call[0]]
-        assert "pptx" in import_calls
+        mock_import.assert_called_once_with("pptx")
         mock_presentation_class.assert_called_once_with("/fake/path.pptx")
 
-    @patch("builtins.__import__")
-    def test_ppt_parse_import_error(self, mock_import):
+    def test_ppt_parse_import_error(self):
         """Test ImportError when pptx module is not available"""
-        mock_import.side_effect = ImportError("No module named 'pptx'")
         parser = PPTParser()
-        with pytest.raises(ImportError, match="python-pptx is required"):
+        with fake_imports(ppt_parser, pptx=ImportError("No module named 'pptx'")), pytest.raises(
+            ImportError, match="python-pptx is required"
+        ):
             parser.parse("/fake/path.pptx")
 
     def test_ppt_save(self):
@@ -170,52 +231,57 @@ class TestPPTParser:
 
             # Verify file was created and content is correct
             assert os.path.exists(output_path)
-            with open(output_path, encoding="utf-8") as f:
-                assert f.read() == content
+            with open(output_path, "rb") as f:
+                assert f.read() == content.encode("utf-8")
+
+
+def youtube_modules(video_id, title="Test Video Title", length=120, transcript=()):
+    """Build mock pytubefix and youtube_transcript_api modules for one video"""
+    mock_yt = SimpleNamespace(video_id=video_id, title=title, author="Test Author", length=length)
+    mock_pytubefix = SimpleNamespace(YouTube=MagicMock(return_value=mock_yt))
+    mock_transcript_api = SimpleNamespace(
+        YouTubeTranscriptApi=SimpleNamespace(get_transcript=MagicMock(return_value=list(transcript)))
+    )
+    return {"pytubefix": mock_pytubefix, "youtube_transcript_api": mock_transcript_api}
 
 
 class TestYouTubeParser:
     """Test cases for YouTube parser"""
 
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, monkeypatch, tmp_path):
+        """Keep the transcript cache out of the user's home directory"""
+        monkeypatch.setenv("SDK_CACHE_DIR", str(tmp_path))
+        return tmp_path
+
+    @pytest.fixture(autouse=True)
+    def fresh_rate_limiter(self, monkeypatch):
+        """Give each test a full token bucket so earlier fetches cannot throttle it"""
+        monkeypatch.setattr(
+            youtube_parser, "_transcript_rate_limiter", youtube_parser._RateLimiter(calls=10, period=1.0)
+        )
+
     def test_youtube_parser_initialization(self):
         """Test that YouTube parser can be initialized"""
         parser = YouTubeParser()
         assert parser is not None
 
-    @patch("builtins.__import__")
-    def test_youtube_parse_success(self, mock_import):
+    def test_youtube_parse_success(self):
         """Test successful YouTube transcript parsing"""
-
-        # Setup mock modules
-        def mock_import_side_effect(name, *args, **kwargs):
-            if name == "pytubefix":
-                mock_pytubefix = MagicMock()
-                mock_yt = MagicMock()
-                mock_yt.video_id = "test_video_id"
-                mock_yt.title = "Test Video Title"
-                mock_yt.author = "Test Author"
-                mock_yt.length = 120
-                mock_pytubefix.YouTube.return_value = mock_yt
-                return mock_pytubefix
-            elif name == "youtube_transcript_api":
-                mock_transcript_api = MagicMock()
-                mock_transcript = [
-                    {"text": "Hello everyone"},
-                    {"text": "Welcome to this video"},
-                    {"text": "Today we'll learn about testing"},
-                ]
-                mock_transcript_api.YouTubeTranscriptApi.get_transcript.return_value = (
-                    mock_transcript
-                )
-                return mock_transcript_api
-            return MagicMock()  # fallback for other imports
-
-        mock_import.side_effect = mock_import_side_effect
+        modules = youtube_modules(
+            "test_video_id",
+            transcript=[
+                {"text": "Hello everyone"},
+                {"text": "Welcome to this video"},
+                {"text": "Today we'll learn about testing"},
+            ],
+        )
 
         # Test parsing
         parser = YouTubeParser()
         test_url = "https://www.youtube.com/watch?v=test_video_id"
-        result = parser.parse(test_url)
+        with fake_imports(youtube_parser, **modules) as mock_import:
+            result = parser.parse(test_url)
 
         # Verify the result structure
         assert "Title: Test Video Title" in result
@@ -226,40 +292,152 @@ class TestYouTubeParser:
         assert "Hello everyone" in result
         assert "Welcome to this video" in result
         assert "Today we'll learn about testing" in result
+        assert result.endswith(
+            "Transcript:\nHello everyone\nWelcome to this video\nToday we'll learn about testing"
+        )
+        with fake_imports(youtube_parser, **modules):
+            assert "".join(parser.parse_iter(test_url)) == result
 
         # Verify imports were called
-        import_calls = [call[0][0] for call in mock_import.call_args_list]
-        assert "pytubefix" in import_calls
-        assert "youtube_transcript_api" in import_calls
-
-    @patch("builtins.__import__")
-    def test_youtube_parse_import_error_pytube(self, mock_import):
+        import_calls = [call.args[0] for call in mock_import.call_args_list]
+        assert import_calls == ["pytubefix", "youtube_transcript_api"]
+
+    def test_youtube_parse_batch(self):
+        """Test batch parsing returns one transcript per URL, in order"""
+        modules = youtube_modules(None)
+
+        def make_video(url):
+            video_id = url.rsplit("=", 1)[-1]
+            return SimpleNamespace(
+                video_id=video_id, title=f"Title {video_id}", author="Test Author", length=60
+            )
+
+        modules["pytubefix"].YouTube.side_effect = make_video
+        get_transcript = modules["youtube_transcript_api"].YouTubeTranscriptApi.get_transcript
+        get_transcript.side_effect = lambda video_id: [{"text": f"Transcript of {video_id}"}]
+
+        urls = [f"https://www.youtube.com/watch?v=vid{i}" for i in range(5)]
+        with fake_imports(youtube_parser, **modules):
+            results = YouTubeParser().parse_batch(urls, max_workers=2)
+
+        assert len(results) == 5
+        for i, result in enumerate(results):
+            assert f"Title: Title vid{i}" in result
+            assert result.endswith(f"Transcript of vid{i}")
+        assert get_transcript.call_count == 5
+        assert YouTubeParser().parse_batch([]) == []
+
+    def test_youtube_parse_uses_cache(self, cache_dir):
+        """Test a repeated parse of the same video reads the cached transcript"""
+        modules = youtube_modules("cachedVid01", transcript=[{"text": "Cached words"}])
+        get_transcript = modules["youtube_transcript_api"].YouTubeTranscriptApi.get_transcript
+
+        url = "https://www.youtube.com/watch?v=cachedVid01"
+        with fake_imports(youtube_parser, **modules):
+            first = YouTubeParser().parse(url)
+            second = YouTubeParser().parse(url)
+
+        assert second == first
+        assert get_transcript.call_count == 1
+        # The cache hit finds the video ID in the URL without asking pytubefix
+        assert modules["pytubefix"].YouTube.call_count == 1
+        assert (cache_dir / "youtube" / "cachedVid01.json").exists()
+
+    @pytest.mark.parametrize(
+        "url,video_id",
+        [
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/watch?feature=share&v=dQw4w9WgXcQ&t=42", "dQw4w9WgXcQ"),
+            ("https://youtu.be/dQw4w9WgXcQ?si=abc", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/embed/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/live/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+            ("https://www.youtube.com/watch?v=test_video_id", None),
+            ("https://www.youtube.com/channel/UC1234567890", None),
+        ],
+    )
+    def test_extract_video_id(self, url, video_id):
+        """Test video IDs are found in each URL shape and overlong IDs are rejected"""
+        assert youtube_parser.extract_video_id(url) == video_id
+
+    def test_youtube_parse_retries_on_429(self):
+        """Test throttled transcript fetches are retried with backoff"""
+        modules = youtube_modules("throttled_id")
+        get_transcript = modules["youtube_transcript_api"].YouTubeTranscriptApi.get_transcript
+        too_many = requests.HTTPError("429 Client Error: Too Many Requests")
+        get_transcript.side_effect = [too_many, too_many, [{"text": "Finally"}]]
+
+        with fake_imports(youtube_parser, **modules), patch.object(
+            youtube_parser.time, "sleep"
+        ) as mock_sleep:
+            result = YouTubeParser().parse("https://www.youtube.com/watch?v=throttled_id")
+
+        assert result.endswith("Finally")
+        assert get_transcript.call_count == 3
+        assert mock_sleep.call_count == 2
+
+    def test_youtube_parse_does_not_retry_permanent_errors(self):
+        """Test non-transient transcript errors are raised immediately"""
+        modules = youtube_modules("missing_id")
+        get_transcript = modules["youtube_transcript_api"].YouTubeTranscriptApi.get_transcript
+        get_transcript.side_effect = ValueError("Transcripts are disabled")
+
+        with fake_imports(youtube_parser, **modules), pytest.raises(ValueError, match="disabled"):
+            YouTubeParser().parse("https://www.youtube.com/watch?v=missing_id")
+
+        assert get_transcript.call_count == 1
+
+    def test_youtube_parse_shares_http_session(self, monkeypatch):
+        """Test the >= 1.0 transcript API gets one pooled session across parses"""
+        monkeypatch.setattr(youtube_parser, "_HTTP_SESSION", None)
+        clients = []
+
+        class FakeTranscriptApi:
+            def __init__(self, http_client=None):
+                self.http_client = http_client
+                clients.append(self)
+
+            def fetch(self, video_id):
+                return SimpleNamespace(to_raw_data=lambda: [{"text": f"Words of {video_id}"}])
+
+        modules = youtube_modules(None)
+        modules["pytubefix"].YouTube.side_effect = lambda url: SimpleNamespace(
+            video_id=url[-11:], title="Title", author="Test Author", length=1
+        )
+        modules["youtube_transcript_api"] = SimpleNamespace(YouTubeTranscriptApi=FakeTranscriptApi)
+
+        with fake_imports(youtube_parser, **modules), patch.object(
+            youtube_parser.requests, "Session"
+        ) as mock_session:
+            results = [
+                YouTubeParser().parse(f"https://www.youtube.com/watch?v=sessionVid{i}") for i in range(3)
+            ]
+
+        assert mock_session.call_count == 1
+        assert len(clients) == 3
+        assert all(client.http_client is mock_session.return_value for client in clients)
+        assert results[2].endswith("Words of sessionVid2")
+
+    def test_youtube_parse_import_error_pytube(self):
         """Test ImportError when YouTube module is not available"""
+        modules = youtube_modules("test")
+        modules["pytubefix"] = ImportError("No module named 'pytubefix'")
 
-        def import_side_effect(name, *args, **kwargs):
-            if name == "pytubefix":
-                raise ImportError("No module named 'pytubefix'")
-            return MagicMock()
-
-        mock_import.side_effect = import_side_effect
         parser = YouTubeParser()
-        with pytest.raises(ImportError, match="pytube and youtube-transcript-api are required"):
+        with fake_imports(youtube_parser, **modules), pytest.raises(
+            ImportError, match="pytube and youtube-transcript-api are required"
+        ):
             parser.parse("https://www.youtube.com/watch?v=test")
 
-    @patch("builtins.__import__")
-    def test_youtube_parse_import_error_transcript(self, mock_import):
+    def test_youtube_parse_import_error_transcript(self):
         """Test ImportError when transcript API is not available"""
+        modules = youtube_modules("test")
+        modules["youtube_transcript_api"] = ImportError("No module named 'youtube_transcript_api'")
 
-        def import_side_effect(name, *args, **kwargs):
-            if name == "youtube_transcript_api":
-                raise ImportError("No module named 'youtube_transcript_api'")
-            elif name == "pytubefix":
-                return MagicMock()  # pytubefix succeeds
-            return MagicMock()
-
-        mock_import.side_effect = import_side_effect
         parser = YouTubeParser()
-        with pytest.raises(ImportError, match="pytube and youtube-transcript-api are required"):
+        with fake_imports(youtube_parser, **modules), pytest.raises(
+            ImportError, match="pytube and youtube-transcript-api are required"
+        ):
             parser.parse("https://www.youtube.com/watch?v=test")
 
     def test_youtube_save(self):
@@ -273,36 +451,18 @@ class TestYouTubeParser:
 
             # Verify file was created and content is correct
             assert os.path.exists(output_path)
-            with open(output_path, encoding="utf-8") as f:
-                assert f.read() == content
+            with open(output_path, "rb") as f:
+                assert f.read() == content.encode("utf-8")
 
-    @patch("builtins.__import__")
-    def test_youtube_parse_empty_transcript(self, mock_import):
+    def test_youtube_parse_empty_transcript(self):
         """Test parsing with empty transcript"""
-
-        # Setup mock modules with empty transcript
-        def mock_import_side_effect(name, *args, **kwargs):
-            if name == "pytubefix":
-                mock_pytubefix = MagicMock()
-                mock_yt = MagicMock()
-                mock_yt.video_id = "test_video_id"
-                mock_yt.title = "Empty Video"
-                mock_yt.author = "Test Author"
-                mock_yt.length = 0
-                mock_pytubefix.YouTube.return_value = mock_yt
-                return mock_pytubefix
-            elif name == "youtube_transcript_api":
-                mock_transcript_api = MagicMock()
-                mock_transcript_api.YouTubeTranscriptApi.get_transcript.return_value = []
-                return mock_transcript_api
-            return MagicMock()
-
-        mock_import.side_effect = mock_import_side_effect
+        modules = youtube_modules("test_video_id", title="Empty Video", length=0)
 
         # Test parsing
         parser = YouTubeParser()
         test_url = "https://www.youtube.com/watch?v=test_video_id"
-        result = parser.parse(test_url)
+        with fake_imports(youtube_parser, **modules):
+            result = parser.parse(test_url)
 
         # Should still have metadata even with empty transcript
         assert "Title: Empty Video" in result
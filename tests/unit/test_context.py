@@ -5,6 +5,7 @@
 # the root directory of this source tree.
 
 import os
+import stat
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -12,31 +13,35 @@ from unittest.mock import patch
 import pytest
 
 from synthetic_data_kit.core.context import AppContext
+from synthetic_data_kit.utils import fs
 
 
 class TestAppContext:
     """Test cases for AppContext class"""
 
+    def setup_method(self):
+        """Forget directories created by earlier tests so makedirs calls are observable"""
+        fs._CREATED_DIRS.clear()
+
     def test_app_context_initialization_default_config(self):
         """Test AppContext initialization with default config path"""
         with patch("synthetic_data_kit.core.context.DEFAULT_CONFIG_PATH", "/fake/default/path"):
-            with patch.object(AppContext, "_ensure_data_dirs"):
-                context = AppContext()
-                assert context.config_path == "/fake/default/path"
-                assert context.config == {}
+            context = AppContext()
+            assert context.config_path == "/fake/default/path"
+            assert context.config == {}
 
     def test_app_context_initialization_custom_config(self):
         """Test AppContext initialization with custom config path"""
         custom_path = Path("/custom/config/path")
-        with patch.object(AppContext, "_ensure_data_dirs"):
-            context = AppContext(config_path=custom_path)
-            assert context.config_path == custom_path
-            assert context.config == {}
+        context = AppContext(config_path=custom_path)
+        assert context.config_path == custom_path
+        assert context.config == {}
 
-    @patch("synthetic_data_kit.core.context.os.makedirs")
+    @patch("synthetic_data_kit.utils.fs.os.mkdir")
+    @patch("synthetic_data_kit.utils.fs.os.makedirs")
     @patch("synthetic_data_kit.core.context.load_config")
-    def test_ensure_data_dirs(self, mock_load_config, mock_makedirs):
-        """Test that _ensure_data_dirs creates all required directories"""
+    def test_ensure_data_dirs(self, mock_load_config, mock_makedirs, mock_mkdir):
+        """Test that ensure_data_dirs creates all required directories"""
         # Mock config with default directory structure
         mock_config = {
             'paths': {
@@ -52,9 +57,17 @@ class TestAppContext:
         mock_load_config.return_value = mock_config
         
         with patch("synthetic_data_kit.core.context.DEFAULT_CONFIG_PATH", "/fake/path"):
-            AppContext()
+            context = AppContext()
 
-            # Verify all expected directories are created
+            # Nothing is created until the data directories are first accessed
+            mock_makedirs.assert_not_called()
+            assert context.ensure_data_dirs().parsed == "data/parsed"
+            assert context.data_dirs is context.ensure_data_dirs()
+
+            # The shared parent is created once
+            mock_makedirs.assert_called_once_with("data", exist_ok=True)
+
+            # Then each expected directory gets a single mkdir
             expected_dirs = [
                 "data/input",
                 "data/parsed",
@@ -63,11 +76,23 @@ class TestAppContext:
                 "data/final",
             ]
 
-            assert mock_makedirs.call_count == len(expected_dirs)
-
-            # Check that each expected directory was created with exist_ok=True
+            assert mock_mkdir.call_count == len(expected_dirs)
             for expected_dir in expected_dirs:
-                mock_makedirs.assert_any_call(expected_dir, exist_ok=True)
+                mock_mkdir.assert_any_call(expected_dir)
+
+    @patch("synthetic_data_kit.utils.fs.os.mkdir")
+    @patch("synthetic_data_kit.utils.fs.os.makedirs")
+    @patch("synthetic_data_kit.core.context.load_config")
+    def test_ensure_data_dirs_skips_created_dirs(self, mock_load_config, mock_makedirs, mock_mkdir):
+        """Test that later instances do not recreate directories made by earlier ones"""
+        mock_load_config.return_value = {'paths': {}}
+
+        with patch("synthetic_data_kit.core.context.DEFAULT_CONFIG_PATH", "/fake/path"):
+            AppContext().ensure_data_dirs()
+            AppContext().ensure_data_dirs()
+
+        assert mock_makedirs.call_count == 1
+        assert mock_mkdir.call_count == 5
 
     @patch("synthetic_data_kit.core.context.load_config")
     def test_ensure_data_dirs_integration(self, mock_load_config):
@@ -93,7 +118,7 @@ class TestAppContext:
                 os.chdir(temp_dir)
 
                 with patch("synthetic_data_kit.core.context.DEFAULT_CONFIG_PATH", "/fake/path"):
-                    AppContext()
+                    AppContext().data_dirs
 
                 # Verify all directories were actually created
                 expected_dirs = [
@@ -105,48 +130,46 @@ class TestAppContext:
                 ]
 
                 for dir_path in expected_dirs:
-                    full_path = os.path.join(temp_dir, dir_path)
-                    assert os.path.exists(full_path), f"Directory {dir_path} was not created"
-                    assert os.path.isdir(full_path), f"{dir_path} exists but is not a directory"
+                    # One lstat per directory; raises FileNotFoundError if it was not created
+                    st = os.lstat(os.path.join(temp_dir, dir_path))
+                    assert stat.S_ISDIR(st.st_mode), f"{dir_path} exists but is not a directory"
 
             finally:
                 os.chdir(original_cwd)
 
     def test_config_attribute_mutable(self):
         """Test that config attribute can be modified"""
-        with patch.object(AppContext, "_ensure_data_dirs"):
-            context = AppContext()
+        context = AppContext()
 
-            # Initially empty
-            assert context.config == {}
+        # Initially empty
+        assert context.config == {}
 
-            # Should be able to modify
-            context.config["test_key"] = "test_value"
-            assert context.config["test_key"] == "test_value"
+        # Should be able to modify
+        context.config["test_key"] = "test_value"
+        assert context.config["test_key"] == "test_value"
 
-            # Should be able to add nested structure
-            context.config["nested"] = {"inner_key": "inner_value"}
-            assert context.config["nested"]["inner_key"] == "inner_value"
+        # Should be able to add nested structure
+        context.config["nested"] = {"inner_key": "inner_value"}
+        assert context.config["nested"]["inner_key"] == "inner_value"
 
     def test_multiple_instances_independent(self):
         """Test that multiple AppContext instances are independent"""
-        with patch.object(AppContext, "_ensure_data_dirs"):
-            context1 = AppContext(config_path=Path("/path1"))
-            context2 = AppContext(config_path=Path("/path2"))
+        context1 = AppContext(config_path=Path("/path1"))
+        context2 = AppContext(config_path=Path("/path2"))
 
-            # Different config paths
-            assert context1.config_path != context2.config_path
+        # Different config paths
+        assert context1.config_path != context2.config_path
 
-            # Independent config dictionaries
-            context1.config["key1"] = "value1"
-            context2.config["key2"] = "value2"
+        # Independent config dictionaries
+        context1.config["key1"] = "value1"
+        context2.config["key2"] = "value2"
 
-            assert "key1" in context1.config
-            assert "key1" not in context2.config
-            assert "key2" in context2.config
-            assert "key2" not in context1.config
+        assert "key1" in context1.config
+        assert "key1" not in context2.config
+        assert "key2" in context2.config
+        assert "key2" not in context1.config
 
-    @patch("synthetic_data_kit.core.context.os.makedirs")
+    @patch("synthetic_data_kit.utils.fs.os.makedirs")
     @patch("synthetic_data_kit.core.context.load_config")
     def test_ensure_data_dirs_exception_handling(self, mock_load_config, mock_makedirs):
         """Test that AppContext handles directory creation errors gracefully"""
@@ -168,20 +191,21 @@ class TestAppContext:
         mock_makedirs.side_effect = OSError("Permission denied")
 
         with patch("synthetic_data_kit.core.context.DEFAULT_CONFIG_PATH", "/fake/path"):
-            # Should raise the OSError since _ensure_data_dirs doesn't catch exceptions
+            context = AppContext()
+
+            # Should raise the OSError since ensure_data_dirs doesn't catch exceptions
             with pytest.raises(OSError, match="Permission denied"):
-                AppContext()
+                context.ensure_data_dirs()
 
     def test_config_path_type_handling(self):
         """Test that config_path handles different path types correctly"""
-        with patch.object(AppContext, "_ensure_data_dirs"):
-            # Test with string path
-            string_path = "/string/path"
-            context1 = AppContext(config_path=string_path)
-            assert context1.config_path == string_path
-
-            # Test with Path object
-            path_obj = Path("/path/object")
-            context2 = AppContext(config_path=path_obj)
-            assert context2.config_path == path_obj
-            assert isinstance(context2.config_path, Path)
+        # Test with string path
+        string_path = "/string/path"
+        context1 = AppContext(config_path=string_path)
+        assert context1.config_path == string_path
+
+        # Test with Path object
+        path_obj = Path("/path/object")
+        context2 = AppContext(config_path=path_obj)
+        assert context2.config_path == path_obj
+        assert isinstance(context2.config_path, Path)
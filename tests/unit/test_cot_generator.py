@@ -5,7 +5,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from synthetic_data_kit.generators.cot_generator import COTGenerator
+from synthetic_data_kit.generators.cot_generator import COTGenerator, _compile_prompt
 
 
 @pytest.mark.unit
@@ -70,6 +70,46 @@ def test_parse_json_output():
     assert result is None
 
 
+@pytest.mark.unit
+def test_parse_json_output_ignores_brackets_outside_array():
+    """Test that brackets in strings and trailing prose don't break parsing."""
+    generator = COTGenerator(client=MagicMock())
+
+    text = 'Result:\n[{"question": "Is [x] \\"quoted\\"?", "answer": "]"}]\nSee [notes].'
+    result = generator.parse_json_output(text)
+
+    assert result == [{"question": 'Is [x] "quoted"?', "answer": "]"}]
+
+
+@pytest.mark.unit
+def test_parse_json_output_skips_bracketed_prose():
+    """Test bracketed prose before the payload is not mistaken for the array."""
+    generator = COTGenerator(client=MagicMock())
+
+    assert generator.parse_json_output('See note [1]. Here: [{"a": 1}]') == [{"a": 1}]
+    assert generator.parse_json_output('[see [2]] then [[{"role": "user"}]]') == [[{"role": "user"}]]
+
+
+@pytest.mark.unit
+def test_parse_json_output_rejects_malformed_outer_array():
+    """Test a malformed outer array doesn't yield one of its nested arrays."""
+    generator = COTGenerator(client=MagicMock())
+
+    malformed = '[[{"role": "user", "content": "a"}], [{"role": "user", "content": "b"}],]'
+    assert generator.parse_json_output(malformed) is None
+
+
+@pytest.mark.unit
+def test_compile_prompt_matches_str_format():
+    """Test that compiled prompts render exactly like str.format."""
+    template = 'Return {{"n": {num_examples}}} for:\n{text}'
+    render = _compile_prompt(template)
+
+    assert render(num_examples=3, text="doc") == template.format(num_examples=3, text="doc")
+    assert _compile_prompt(template) is render
+    assert _compile_prompt("{value!r}")(value="x") == "'x'"
+
+
 @pytest.mark.unit
 def test_generate_cot_examples(patch_config):
     """Test generating chain-of-thought examples."""
@@ -117,9 +157,8 @@ def test_generate_cot_examples(patch_config):
     assert "reasoning" in examples[0]
     assert examples[0]["answer"] == "Synthetic data is artificially generated data."
 
-    # Check if the document text was used properly in the prompt
-    # We may call the API multiple times if needed to get enough examples
-    assert mock_client.chat_completion.call_count > 0, "Chat completion was never called"
+    # All requested examples come back from a single batched prompt
+    assert mock_client.chat_completion.call_count == 1
 
     # Get the first call's arguments
     call_args = mock_client.chat_completion.call_args_list[0][0][0]
@@ -134,6 +173,57 @@ def test_generate_cot_examples(patch_config):
     )
 
 
+@pytest.mark.unit
+def test_generate_cot_examples_batches_by_batch_size(patch_config):
+    """Test that requested examples are split into batch_size prompts."""
+    mock_client = MagicMock()
+    mock_client.config = {
+        "prompts": {
+            "cot_generation": "Generate {num_examples} examples:\n{text}",
+        },
+        "generation": {"batch_size": 2},
+    }
+    example = {"question": "Q?", "reasoning": "Step 1.", "answer": "A."}
+    mock_client.chat_completion.side_effect = [
+        json.dumps([example, example]),
+        json.dumps([example]),
+    ]
+
+    generator = COTGenerator(client=mock_client)
+    examples = generator.generate_cot_examples("Short document.", num_examples=3)
+
+    assert len(examples) == 3
+    assert mock_client.chat_completion.call_count == 2
+    second_prompt = mock_client.chat_completion.call_args_list[1][0][0][0]["content"]
+    assert second_prompt.startswith("Generate 1 examples:")
+    # The later batch knows its position and the questions already asked
+    assert "examples 3-3 of 3" in second_prompt
+    assert "- Q?" in second_prompt
+    first_prompt = mock_client.chat_completion.call_args_list[0][0][0][0]["content"]
+    assert "of 3" not in first_prompt
+
+
+@pytest.mark.unit
+def test_generate_cot_examples_uses_configured_continuation(patch_config):
+    """Test later batches use the cot_generation_continuation prompt from config."""
+    mock_client = MagicMock()
+    mock_client.config = {
+        "prompts": {
+            "cot_generation": "Generate {num_examples} examples:\n{text}",
+            "cot_generation_continuation": "Batch {first}-{last}/{total}, avoid:\n{previous_questions}",
+        },
+        "generation": {"batch_size": 1},
+    }
+    example = {"question": "Q?", "reasoning": "Step 1.", "answer": "A."}
+    mock_client.chat_completion.return_value = json.dumps([example])
+
+    generator = COTGenerator(client=mock_client)
+    generator.generate_cot_examples("Short document.", num_examples=2)
+
+    second_prompt = mock_client.chat_completion.call_args_list[1][0][0][0]["content"]
+    assert second_prompt.endswith("\n\nBatch 2-2/2, avoid:\n- Q?")
+
+
 @pytest.mark.unit
 def test_enhance_with_cot(patch_config):
     """Test enhancing existing conversations with COT reasoning."""
@@ -208,8 +298,8 @@ def test_enhance_with_cot(patch_config):
     # Check that reasoning was added
     assert "Let me think through this step by step" in enhanced[0][2]["content"]
 
-    # Check if include_simple_steps parameter was respected and matches what was requested
-    assert mock_client.chat_completion.call_count > 0, "Chat completion was never called"
+    # Both conversations fit in one batch, so they are enhanced in one request
+    assert mock_client.chat_completion.call_count == 1
     call_args = mock_client.chat_completion.call_args_list[0][0][0]
     call_args[0]["content"]
 
@@ -259,6 +349,60 @@ def test_enhance_with_cot(patch_config):
     )
 
 
+@pytest.mark.unit
+def test_enhance_with_cot_batches_by_batch_size(patch_config):
+    """Test that conversations are enhanced batch_size per request."""
+    mock_client = MagicMock()
+    mock_client.config = {
+        "prompts": {
+            "cot_enhancement": "Include_simple_steps: {include_simple_steps}\n{conversations}",
+        },
+        "generation": {"batch_size": 2},
+    }
+    conversations = [
+        [{"role": "user", "content": f"Question {i}?"}, {"role": "assistant", "content": "A."}]
+        for i in range(3)
+    ]
+    enhanced = [[{"role": "assistant", "content": "Step by step."}]]
+    # The second batch reply does not match its batch, so it is kept as is
+    mock_client.chat_completion.side_effect = [
+        json.dumps(enhanced * 2),
+        json.dumps(enhanced * 2),
+    ]
+
+    generator = COTGenerator(client=mock_client)
+    result = generator.enhance_with_cot(conversations)
+
+    assert mock_client.chat_completion.call_count == 2
+    assert result == enhanced * 2 + conversations[2:]
+    second_prompt = mock_client.chat_completion.call_args_list[1][0][0][0]["content"]
+    assert json.loads(second_prompt.split("\n", 1)[1]) == conversations[2:]
+
+
+@pytest.mark.unit
+def test_enhance_with_cot_keeps_originals_for_wrongly_shaped_reply(patch_config):
+    """Test a reply of the right length but wrong shape keeps the originals."""
+    mock_client = MagicMock()
+    mock_client.config = {
+        "prompts": {
+            "cot_enhancement": "Include_simple_steps: {include_simple_steps}\n{conversations}",
+        },
+        "generation": {"batch_size": 2},
+    }
+    conversations = [
+        [{"role": "user", "content": "Q1?"}, {"role": "assistant", "content": "A1."}],
+        [{"role": "user", "content": "Q2?"}, {"role": "assistant", "content": "A2."}],
+    ]
+    # Two message dicts instead of two conversations
+    mock_client.chat_completion.return_value = json.dumps(
+        [{"role": "user", "content": "Q1?"}, {"role": "assistant", "content": "Step by step."}]
+    )
+
+    generator = COTGenerator(client=mock_client)
+
+    assert generator.enhance_with_cot(conversations) == conversations
+
+
 @pytest.mark.unit
 def test_process_document(patch_config):
     """Test processing a document to generate COT examples."""
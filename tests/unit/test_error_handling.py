@@ -1,8 +1,6 @@
 """Unit tests for error handling."""
 
 import json
-import os
-import tempfile
 from unittest.mock import patch
 
 import pytest
@@ -64,133 +62,59 @@ def test_save_as_unknown_format():
         },
     ]
 
-    # Create a temporary file with QA pairs
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as f:
-        json.dump({"qa_pairs": qa_pairs}, f)
-        input_path = f.name
+    # Try to convert to an unknown format
+    with pytest.raises(ValueError) as excinfo:
+        save_as.convert_data({"qa_pairs": qa_pairs}, "unknown-format")
 
-    # Create temporary output path
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-        output_path = f.name
-
-    try:
-        # Try to convert to an unknown format
-        with pytest.raises(ValueError) as excinfo:
-            save_as.convert_format(
-                input_path=input_path, output_path=output_path, format_type="unknown-format"
-            )
-
-        # Check that the error message is helpful
-        assert "Unknown format type" in str(excinfo.value)
-    finally:
-        # Clean up
-        if os.path.exists(input_path):
-            os.unlink(input_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    # Check that the error message is helpful
+    assert "Unknown format type" in str(excinfo.value)
 
 
 @pytest.mark.unit
 def test_save_as_unrecognized_data_format():
     """Test error handling for unrecognized data format in save_as."""
-    # Create a file with unrecognized structure
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as f:
-        json.dump({"something_unexpected": "data"}, f)
-        input_path = f.name
+    # Try to convert data with an unrecognized structure
+    with pytest.raises(ValueError) as excinfo:
+        save_as.convert_data({"something_unexpected": "data"}, "jsonl")
 
-    # Create temporary output path
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-        output_path = f.name
-
-    try:
-        # Try to convert a file with unrecognized structure
-        with pytest.raises(ValueError) as excinfo:
-            save_as.convert_format(
-                input_path=input_path, output_path=output_path, format_type="jsonl"
-            )
-
-        # Check that the error message is helpful
-        assert "Unrecognized data format" in str(excinfo.value)
-    finally:
-        # Clean up
-        if os.path.exists(input_path):
-            os.unlink(input_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+    # Check that the error message is helpful
+    assert "Unrecognized data format" in str(excinfo.value)
 
 
 @pytest.mark.unit
-def test_create_invalid_content_type(patch_config, test_env):
+def test_create_invalid_content_type(patch_config, test_env, tmp_path):
     """Test error handling for invalid content type in create."""
     # Create a temporary text file
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".txt", delete=False) as f:
-        f.write("Sample text content")
-        file_path = f.name
-
-    # Create temporary output directory
-    output_dir = tempfile.mkdtemp()
-
-    try:
-        # Mock the LLM client
-        with patch("synthetic_data_kit.core.create.LLMClient"):
-            # Try to create with an invalid content type
-            with pytest.raises(ValueError) as excinfo:
-                create.process_file(
-                    file_path=file_path, output_dir=output_dir, content_type="invalid-type"
-                )
-
-            # Check that the error message mentions the content type
-            # The actual message is "Unknown content type: invalid-type"
-            assert "content type" in str(excinfo.value).lower()
-            assert "invalid-type" in str(excinfo.value)
-    finally:
-        # Clean up
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-        os.rmdir(output_dir)
+    file_path = tmp_path / "input.txt"
+    file_path.write_text("Sample text content")
+
+    # Mock the LLM client
+    with patch("synthetic_data_kit.core.create.LLMClient"):
+        # Try to create with an invalid content type
+        with pytest.raises(ValueError) as excinfo:
+            create.process_file(
+                file_path=str(file_path), output_dir=str(tmp_path / "output"), content_type="invalid-type"
+            )
+
+        # Check that the error message mentions the content type
+        # The actual message is "Unknown content type: invalid-type"
+        assert "content type" in str(excinfo.value).lower()
+        assert "invalid-type" in str(excinfo.value)
 
 
 @pytest.mark.unit
-def test_curate_input_validation(patch_config, test_env):
+def test_curate_input_validation(patch_config, test_env, tmp_path):
     """Test input validation for curate function."""
-    # Create a temporary file with QA pairs
-    qa_pairs = [
-        {
-            "question": "What is synthetic data?",
-            "answer": "Synthetic data is artificially generated data.",
-        },
-    ]
+    # Create empty file to test error handling
+    empty_file_path = tmp_path / "empty.json"
+    empty_file_path.write_text(json.dumps({}))
+    output_path = tmp_path / "output" / "output.json"
+
+    # Mock the LLM client
+    with patch("synthetic_data_kit.core.curate.LLMClient"):
+        # Try to curate an empty file
+        with pytest.raises(ValueError) as excinfo:
+            curate.curate_qa_pairs(input_path=str(empty_file_path), output_path=str(output_path))
 
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as f:
-        json.dump({"qa_pairs": qa_pairs}, f)
-        file_path = f.name
-
-    # Create temporary output directory
-    output_dir = tempfile.mkdtemp()
-    output_path = os.path.join(output_dir, "output.json")
-
-    try:
-        # Create empty file to test error handling
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as f:
-            json.dump({}, f)
-            empty_file_path = f.name
-
-        # Mock the LLM client
-        with patch("synthetic_data_kit.core.curate.LLMClient"):
-            # Try to curate an empty file
-            with pytest.raises(ValueError) as excinfo:
-                curate.curate_qa_pairs(input_path=empty_file_path, output_path=output_path)
-
-            # Check that the error message is helpful
-            assert "No QA pairs found" in str(excinfo.value)
-    finally:
-        # Clean up
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-        if os.path.exists(empty_file_path):
-            os.unlink(empty_file_path)
-        if os.path.exists(output_dir):
-            try:
-                os.rmdir(output_dir)
-            except OSError:
-                pass
+        # Check that the error message is helpful
+        assert "No QA pairs found" in str(excinfo.value)
@@ -3,6 +3,7 @@
 import json
 import os
 import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -61,8 +62,19 @@ def test_to_jsonl():
         assert line2_data["question"] == "Why use synthetic data?"
     finally:
         # Clean up
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        Path(output_path).unlink(missing_ok=True)
+
+
+@pytest.mark.unit
+def test_to_jsonl_matches_json_dumps_bytes(tmp_path):
+    """Test JSONL lines are byte-identical to json.dumps output."""
+    records = [{"q": "café", "score": float("nan")}, {1: "non-str key"}]
+    output_path = tmp_path / "out.jsonl"
+
+    to_jsonl(records, str(output_path))
+
+    expected = "".join(json.dumps(record) + "\n" for record in records).encode("ascii")
+    assert output_path.read_bytes() == expected
 
 
 @pytest.mark.unit
@@ -112,8 +124,7 @@ def test_to_alpaca():
         assert data[0]["output"] == "Synthetic data is artificially generated data."
     finally:
         # Clean up
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        Path(output_path).unlink(missing_ok=True)
 
 
 @pytest.mark.unit
@@ -164,8 +175,7 @@ def test_to_fine_tuning():
         assert data[0]["messages"][2]["content"] == "Synthetic data is artificially generated data."
     finally:
         # Clean up
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        Path(output_path).unlink(missing_ok=True)
 
 
 @pytest.mark.unit
@@ -221,8 +231,7 @@ def test_to_chatml():
         )
     finally:
         # Clean up
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        Path(output_path).unlink(missing_ok=True)
 
 
 @pytest.mark.unit
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -40,10 +41,8 @@ def test_txt_parser():
         assert saved_content == content
     finally:
         # Clean up
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        Path(file_path).unlink(missing_ok=True)
+        Path(output_path).unlink(missing_ok=True)
 
 
 @pytest.mark.unit
@@ -99,10 +98,8 @@ def test_html_parser():
             assert saved_content == content
     finally:
         # Clean up
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-        if os.path.exists(output_path):
-            os.unlink(output_path)
+        Path(file_path).unlink(missing_ok=True)
+        Path(output_path).unlink(missing_ok=True)
 
 
 @pytest.mark.unit
@@ -1,10 +1,13 @@
 """Unit tests for utility functions."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from synthetic_data_kit.utils import config, text
+from synthetic_data_kit.utils.lazy_import import lazy_import
 
 
 @pytest.mark.unit
@@ -114,6 +117,25 @@ def test_load_config(tmpdir):
     assert loaded_config["test-provider"]["model"] == "test-model"
 
 
+@pytest.mark.unit
+def test_load_config_is_cached_until_file_changes(tmpdir):
+    """Test repeated loads reuse the parsed YAML and return independent copies."""
+    config_path = Path(tmpdir) / "cached_config.yaml"
+    config_path.write_text("llm:\n  provider: first\n")
+
+    with patch.object(config.yaml, "safe_load", wraps=config.yaml.safe_load) as safe_load:
+        first = config.load_config(str(config_path))
+        first["llm"]["provider"] = "mutated"
+        second = config.load_config(str(config_path))
+        assert safe_load.call_count == 1
+        assert second["llm"]["provider"] == "first"
+
+        config_path.write_text("llm:\n  provider: second-provider\n")
+        third = config.load_config(str(config_path))
+        assert safe_load.call_count == 2
+        assert third["llm"]["provider"] == "second-provider"
+
+
 @pytest.mark.unit
 def test_get_llm_provider(mock_config):
     """Test getting the LLM provider from config."""
@@ -159,3 +181,101 @@ def test_get_path_config():
     empty_config = {}
     default_path = config.get_path_config(empty_config, "output", "default")
     assert default_path == "data/output"
+
+
+@pytest.mark.unit
+def test_lazy_import_caches_modules_but_not_failures():
+    """Test lazy_import imports once and lets failed imports be retried."""
+    import json
+
+    lazy_import.cache_clear()
+    assert lazy_import("json") is json
+    assert lazy_import("json") is json
+    assert lazy_import.cache_info().hits == 1
+
+    with patch("importlib.import_module", side_effect=ImportError("missing")) as mock_import:
+        for _ in range(2):
+            with pytest.raises(ImportError):
+                lazy_import("not_installed_module")
+    assert mock_import.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("parts", [[], ["one"], ["one", "two", "three"]])
+def test_iter_joined_matches_str_join(parts):
+    """Test iter_joined concatenates to the same text as str.join."""
+    assert "".join(text.iter_joined(iter(parts), "\n\n")) == "\n\n".join(parts)
+
+
+@pytest.mark.unit
+def test_write_text_string_and_chunks_write_same_bytes(tmp_path):
+    """Test write_text writes identical UTF-8 for a string and for chunks."""
+    content = "Línea uno\nline two ✓\n"
+    text.write_text(content, str(tmp_path / "a" / "string.txt"))
+    text.write_text(iter(content.splitlines(keepends=True)), str(tmp_path / "b" / "chunks.txt"))
+
+    expected = content.replace("\n", os.linesep).encode("utf-8")
+    assert (tmp_path / "a" / "string.txt").read_bytes() == expected
+    assert (tmp_path / "b" / "chunks.txt").read_bytes() == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("content", ["y", b"y", iter(["y"])])
+def test_write_text_recreates_deleted_parent(tmp_path, content):
+    """Test write_text recreates an output directory removed after a first save."""
+    import shutil
+
+    output_path = tmp_path / "out" / "a.txt"
+    text.write_text("x", str(output_path))
+    shutil.rmtree(tmp_path / "out")
+
+    text.write_text(content, str(output_path))
+    assert output_path.read_bytes() == b"y"
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(os.name != "posix", reason="umask is POSIX-only")
+def test_write_text_permissions_follow_umask(tmp_path):
+    """Test files written from a string get the same mode as open() gives."""
+    old_umask = os.umask(0o002)
+    try:
+        text.write_text("x", str(tmp_path / "string.txt"))
+        with open(tmp_path / "open.txt", "w") as f:
+            f.write("x")
+    finally:
+        os.umask(old_umask)
+
+    assert os.stat(tmp_path / "string.txt").st_mode == os.stat(tmp_path / "open.txt").st_mode
+
+
+@pytest.mark.unit
+def test_write_text_leaves_no_output_when_chunks_fail(tmp_path):
+    """Test a failing chunk iterator leaves neither output nor temporary file."""
+    output_path = tmp_path / "out.txt"
+    output_path.write_bytes(b"previous")
+
+    def chunks():
+        yield "partial"
+        raise ValueError("parser failed")
+
+    with pytest.raises(ValueError):
+        text.write_text(chunks(), str(output_path))
+
+    assert output_path.read_bytes() == b"previous"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+@pytest.mark.unit
+def test_ensure_dirs_creates_nested_and_overlapping_dirs(tmp_path):
+    """Test ensure_dirs handles directories that are parents of one another."""
+    from synthetic_data_kit.utils import fs
+
+    dirs = [tmp_path / "data", tmp_path / "data" / "parsed", tmp_path / "other" / "deep" / "leaf"]
+    fs.ensure_dirs(str(d) for d in dirs)
+    assert all(d.is_dir() for d in dirs)
+
+    # Already-created directories are skipped on the next call
+    with patch("os.makedirs") as mock_makedirs, patch("os.mkdir") as mock_mkdir:
+        fs.ensure_dirs(str(d) for d in dirs)
+    mock_makedirs.assert_not_called()
+    mock_mkdir.assert_not_called()
@@ -1,9 +1,12 @@
+import inspect
 import os
+import shutil
 import tempfile
 import json
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 from unittest.mock import patch
+from typer.models import ParameterInfo
 from typer.testing import CliRunner
 
 
@@ -106,6 +109,31 @@ class CLITestHelper:
         
         return result
     
+    @staticmethod
+    def call_command(command, *args, **kwargs) -> Any:
+        """Call a Typer command function directly, skipping Click's argv parsing.
+        
+        Runs the app callback first so ``ctx.config`` is loaded as it would be
+        under ``CliRunner.invoke``, and fills any option not passed in with its
+        declared default. Use ``capsys`` to inspect console output.
+        
+        Args:
+            command: Command function from ``synthetic_data_kit.cli``
+            *args, **kwargs: Arguments as the function would receive them
+            
+        Returns:
+            The command's return value (its exit code)
+        """
+        from synthetic_data_kit import cli
+        
+        cli.callback(config=None)
+        signature = inspect.signature(command)
+        bound = signature.bind_partial(*args, **kwargs)
+        for name, param in signature.parameters.items():
+            if name not in bound.arguments and isinstance(param.default, ParameterInfo):
+                bound.arguments[name] = param.default.default
+        return command(*bound.args, **bound.kwargs)
+    
     def assert_cli_success(self, result: Any, expected_patterns: List[str]):
         """Assert CLI command succeeded with expected output patterns.
         
@@ -115,8 +143,9 @@ class CLITestHelper:
         """
         assert result.exit_code == 0, f"Command failed with exit code {result.exit_code}"
         
+        output = result.stdout
         for pattern in expected_patterns:
-            assert pattern in result.stdout, f"Expected pattern '{pattern}' not found in output: {result.stdout}"
+            assert pattern in output, f"Expected pattern '{pattern}' not found in output: {output}"
     
     def assert_cli_failure(self, result: Any, expected_patterns: Optional[List[str]] = None):
         """Assert CLI command failed with expected error patterns.
@@ -197,32 +226,26 @@ class MockConfigHelper:
 
 
 class TempDirectoryManager:
-    """Context manager for handling temporary directories with cleanup."""
+    """Context manager for handling temporary directories with cleanup.
     
-    def __init__(self):
-        self.temp_dir = None
+    When base_dir is given (e.g. from tmp_path_factory) files are created there
+    and the directory is left for its owner to clean up.
+    """
+    
+    def __init__(self, base_dir: Optional[str] = None):
+        self.temp_dir = str(base_dir) if base_dir is not None else None
+        self.owns_dir = base_dir is None
         self.created_files = []
     
     def __enter__(self):
-        self.temp_dir = tempfile.mkdtemp()
+        if self.temp_dir is None:
+            self.temp_dir = tempfile.mkdtemp()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.temp_dir and os.path.exists(self.temp_dir):
-            # Clean up all created files
-            for file_path in self.created_files:
-                try:
-                    if os.path.exists(file_path):
-                        os.unlink(file_path)
-                except OSError:
-                    pass  # Ignore cleanup errors
-            
-            # Remove directory
-            try:
-                import shutil
-                shutil.rmtree(self.temp_dir)
-            except OSError:
-                pass  # Ignore cleanup errors
+        if self.owns_dir and self.temp_dir:
+            # rmtree walks the tree with os.scandir, so created files need no separate unlink
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     def create_files(self, file_specs: Dict[str, str]) -> List[str]:
         """Create files in the temporary directory."""